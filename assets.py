@@ -3,61 +3,240 @@ Asset management module for game sprites.
 
 This module provides the SpriteManager class, which is responsible for handling
 the loading, scaling, and retrieval of graphical assets (sprites) for the game.
-It specifically manages directional and state-based sprites for ghost entities,
-processes transparency (colorkeying), scales images to fit the game's tile size,
-and includes a fallback rendering mechanism for missing files.
+Every ghost direction and the frightened sprite are packed into a single atlas
+surface, and the manager hands out subsurface views of it. Each frame comes
+from its own PNG when present, or else from its region of GeneralSprites.png.
+Missing frames fall back to a magenta block. Asset paths are resolved
+case-insensitively, the processed atlas is cached on disk so that later
+startups skip decoding and scaling, and the time spent loading is recorded.
 """
+import hashlib
 import os
+import time
+from typing import Optional
+
 import pygame as pg
 import settings as s
 
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+SPRITES_DIR = ("assets", "sprites")
+DEFAULT_CACHE_DIR = os.path.join(BASE_DIR, ".cache")
+CACHE_VERSION = 1
+
+# Regions of GeneralSprites.png, in 16x16 source pixels
+SHEET_FILE = "GeneralSprites.png"
+SHEET_SPRITE_SIZE = 16
+SHEET_GHOST_ROWS = {
+    s.GhostType.BLINKY: 64,
+    s.GhostType.PINKY: 80,
+    s.GhostType.INKY: 96,
+    s.GhostType.CLYDE: 112,
+}
+SHEET_DIRECTION_COLUMNS = {
+    s.Direction.RIGHT: 456,
+    s.Direction.LEFT: 488,
+    s.Direction.UP: 520,
+    s.Direction.DOWN: 552,
+}
+SHEET_FRIGHTENED = (584, 64)
+
+DIRECTION_NAMES = {
+    s.Direction.UP: "up",
+    s.Direction.DOWN: "down",
+    s.Direction.LEFT: "left",
+    s.Direction.RIGHT: "right"
+}
+
+
+def resolve_path(*parts: str, base: str = BASE_DIR) -> Optional[str]:
+    """
+    Find a file below ``base`` whose path matches ``parts`` ignoring case.
+
+    Args:
+        *parts (str): Path components, e.g. ("assets", "sprites", "blinky_up.png").
+        base (str): Directory to start from.
+
+    Returns:
+        str | None: The real path on disk, or None if nothing matches.
+    """
+    path = base
+    for part in parts:
+        exact = os.path.join(path, part)
+        if os.path.exists(exact):
+            path = exact
+            continue
+        try:
+            entries = os.listdir(path)
+        except OSError:
+            return None
+        match = next((e for e in entries if e.lower() == part.lower()), None)
+        if match is None:
+            return None
+        path = os.path.join(path, match)
+    return path
+
 
 class SpriteManager:
     """Manages loading, scaling, and retrieving usage sprites."""
 
-    def __init__(self):
-        self.ghost_sprites = {}
-        self.frightened_sprite = None
-        self._load_and_process_sprites()
+    def __init__(self, cache_dir: Optional[str] = DEFAULT_CACHE_DIR):
+        """
+        Args:
+            cache_dir (str, optional): Directory for the processed atlas cache.
+                ``None`` disables the disk cache.
+        """
+        self.cache_dir = cache_dir
+        self.atlas = None
+        self.atlas_source = None
+        self.timings = {}
+        self._ghost_sprites = None
+        self._frightened_sprite = None
 
-    def _load_and_process_sprites(self):
-        # Helper to load and scale
-        def load_sprite(filename):
-            path = os.path.join("assets", "sprites", filename)
-
-            # Fallback: create a colored block if file is missing
-            if not os.path.exists(path):
-                print(f"Sprite missing: {filename}")
-                surf = pg.Surface((s.TILE_SIZE, s.TILE_SIZE))
-                surf.fill((150, 0, 150))  # Error/Magenta
-                return surf
-
-            img = pg.image.load(path).convert()
-            # Make black color transparent
-            img.set_colorkey((0, 0, 0))
-
-            # Scale 16x16 -> 32x32
-            return pg.transform.scale(img, (s.TILE_SIZE - 4, s.TILE_SIZE - 4))
-
-        directions = {
-            s.Direction.UP: "up",
-            s.Direction.DOWN: "down",
-            s.Direction.LEFT: "left",
-            s.Direction.RIGHT: "right"
-        }
-
-        # 1. Load Normal Ghost Sprites
-        # Expects files: blinky_up.png, pinky_left.png, etc.
+    @property
+    def sprite_size(self) -> int:
+        """Side of a scaled sprite in pixels."""
+        return s.TILE_SIZE - 4
+
+    @property
+    def ghost_sprites(self) -> dict:
+        """Sprites per ghost name and direction, loaded on first access."""
+        if self._ghost_sprites is None:
+            self._load_and_process_sprites()
+        return self._ghost_sprites
+
+    @property
+    def frightened_sprite(self) -> pg.Surface:
+        """Sprite shared by every frightened ghost, loaded on first access."""
+        if self._ghost_sprites is None:
+            self._load_and_process_sprites()
+        return self._frightened_sprite
+
+    @staticmethod
+    def _fallback_sprite() -> pg.Surface:
+        # Fallback: create a colored block if file is missing
+        surf = pg.Surface((s.TILE_SIZE, s.TILE_SIZE))
+        surf.fill((150, 0, 150))  # Error/Magenta
+        return surf
+
+    def _frame_sources(self) -> list[tuple]:
+        """
+        List the atlas cells in order with where each one is read from.
+
+        Returns:
+            list[tuple]: ``(key, path, region)`` per cell, where ``key`` is
+            ``(ghost_name, direction)`` or ``None`` for the frightened sprite,
+            ``region`` is None for a standalone PNG or a rect in the sprite
+            sheet, and ``path`` is None when the frame is missing.
+        """
+        sheet = resolve_path(*SPRITES_DIR, SHEET_FILE)
+        size = SHEET_SPRITE_SIZE
+
+        def source(filename, sheet_pos):
+            path = resolve_path(*SPRITES_DIR, filename)
+            if path:
+                return path, None
+            if sheet:
+                return sheet, pg.Rect(sheet_pos, (size, size))
+            print(f"Sprite missing: {filename}")
+            return None, None
+
+        sources = []
         for g_type in s.GhostType:
-            name_key = g_type.name.lower()  # blinky, pinky...
-            self.ghost_sprites[name_key] = {}
+            name_key = g_type.name.lower()
+            for d_enum, d_str in DIRECTION_NAMES.items():
+                sheet_pos = (SHEET_DIRECTION_COLUMNS[d_enum], SHEET_GHOST_ROWS[g_type])
+                sources.append(((name_key, d_enum), *source(f"{name_key}_{d_str}.png", sheet_pos)))
+        sources.append((None, *source("frightened.png", SHEET_FRIGHTENED)))
+        return sources
+
+    def _cache_path(self, sources: list[tuple]) -> Optional[str]:
+        if self.cache_dir is None:
+            return None
+        digest = hashlib.sha1(f"{CACHE_VERSION}:{self.sprite_size}".encode())
+        for key, path, region in sources:
+            digest.update(repr((key, region and tuple(region))).encode())
+            if path:
+                stat = os.stat(path)
+                digest.update(f"{path}:{stat.st_size}:{stat.st_mtime_ns}".encode())
+        return os.path.join(self.cache_dir, f"sprites-{digest.hexdigest()[:16]}.rgb")
+
+    def _build_atlas(self, sources: list[tuple]) -> pg.Surface:
+        size = self.sprite_size
+        atlas = pg.Surface((size * len(DIRECTION_NAMES), size * (len(s.GhostType) + 1)))
+        decoded = {}
+        decode_time = scale_time = 0.0
+        for i, (_, path, region) in enumerate(sources):
+            if path is None:
+                continue
+            start = time.perf_counter()
+            if path not in decoded:
+                decoded[path] = pg.image.load(path)
+            img = decoded[path].subsurface(region) if region else decoded[path]
+            decode_time += time.perf_counter() - start
+
+            start = time.perf_counter()
+            # Scale 16x16 -> 28x28
+            atlas.blit(pg.transform.scale(img, (size, size)), self._cell_pos(i))
+            scale_time += time.perf_counter() - start
+        self.timings["decode"] = decode_time
+        self.timings["scale"] = scale_time
+        return atlas
+
+    def _cell_pos(self, index: int) -> tuple[int, int]:
+        row, col = divmod(index, len(DIRECTION_NAMES))
+        return col * self.sprite_size, row * self.sprite_size
+
+    def _load_atlas(self, sources: list[tuple]) -> pg.Surface:
+        cache_path = self._cache_path(sources)
+        width = self.sprite_size * len(DIRECTION_NAMES)
+        height = self.sprite_size * (len(s.GhostType) + 1)
+
+        if cache_path and os.path.exists(cache_path):
+            start = time.perf_counter()
+            with open(cache_path, "rb") as f:
+                atlas = pg.image.frombytes(f.read(), (width, height), "RGB")
+            self.timings["cache_load"] = time.perf_counter() - start
+            self.atlas_source = "cache"
+            return atlas
+
+        atlas = self._build_atlas(sources)
+        self.atlas_source = "files"
+        if cache_path:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            tmp_path = f"{cache_path}.tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(pg.image.tobytes(atlas, "RGB"))
+            os.replace(tmp_path, cache_path)
+        return atlas
+
+    def _load_and_process_sprites(self):
+        start = time.perf_counter()
+        sources = self._frame_sources()
+        self.timings["resolve"] = time.perf_counter() - start
+
+        atlas = self._load_atlas(sources)
+        if pg.display.get_surface() is not None:
+            atlas = atlas.convert()
+        # Make black color transparent
+        atlas.set_colorkey((0, 0, 0))
+        self.atlas = atlas
 
-            for d_enum, d_str in directions.items():
-                filename = f"{name_key}_{d_str}.png"
-                self.ghost_sprites[name_key][d_enum] = load_sprite(filename)
+        ghost_sprites = {g_type.name.lower(): {} for g_type in s.GhostType}
+        frightened = None
+        for i, (key, path, _) in enumerate(sources):
+            if path is None:
+                sprite = self._fallback_sprite()
+            else:
+                sprite = atlas.subsurface((self._cell_pos(i), (self.sprite_size, self.sprite_size)))
+            if key is None:
+                frightened = sprite
+            else:
+                name_key, d_enum = key
+                ghost_sprites[name_key][d_enum] = sprite
 
-        # 2. Load Frightened Sprite
-        self.frightened_sprite = load_sprite("frightened.png")
+        self._ghost_sprites = ghost_sprites
+        self._frightened_sprite = frightened
+        self.timings["total"] = time.perf_counter() - start
 
     def get_ghost_image(self, ghost_name: str, direction: s.Direction, frightened: bool):
         """Returns the correct surface based on state."""
@@ -0,0 +1,152 @@
+"""
+Audio module.
+
+This module provides AudioManager, which decodes the game's sounds on a
+background thread and plays them through a fixed pool of mixer channels.
+Every sound has a future that resolves once it is decoded, so startup never
+waits for WAV decoding and a sound that is not ready yet is simply skipped.
+Looping sounds (the siren and the frightened theme) each own a reserved
+channel. One-shot sounds share the remaining channels by priority: a new sound
+may take over a channel from a lower priority one, and a sound that is already
+playing is not started again on top of itself. Counters for the audio work
+done in each frame are kept for profiling.
+"""
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import Optional
+
+import pygame as pg
+
+import settings as s
+from assets import resolve_path
+
+_STAT_KEYS = ("played", "preempted", "coalesced", "dropped", "not_ready", "seconds")
+
+
+class AudioManager:
+    """Loads sounds asynchronously and plays them on a prioritized channel pool."""
+    # pylint: disable=too-many-instance-attributes
+
+    def __init__(self, sound_files: Optional[dict] = None, effect_channels: int = s.EFFECT_CHANNELS):
+        """
+        Start decoding every sound in the background.
+
+        Args:
+            sound_files (dict, optional): Sound key to file name. Defaults to
+                ``settings.sound_files``.
+            effect_channels (int): Channels shared by one-shot sounds, in
+                addition to one reserved channel per looping sound.
+        """
+        self.sound_files = dict(s.sound_files if sound_files is None else sound_files)
+        loop_keys = [key for key in s.LOOP_SOUNDS if key in self.sound_files]
+
+        pg.mixer.set_num_channels(len(loop_keys) + effect_channels)
+        pg.mixer.set_reserved(len(loop_keys))
+        self.loop_channels = {key: pg.mixer.Channel(i) for i, key in enumerate(loop_keys)}
+        self.effect_channels = [pg.mixer.Channel(len(loop_keys) + i) for i in range(effect_channels)]
+        # What each effect channel was last asked to play, as (priority, key)
+        self._playing: list[Optional[tuple[int, str]]] = [None] * effect_channels
+
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="audio")
+        self.futures: dict[str, Future] = {
+            key: self._executor.submit(self._decode, filename) for key, filename in self.sound_files.items()
+        }
+        self._executor.shutdown(wait=False)
+
+        self.frame_stats = dict.fromkeys(_STAT_KEYS, 0)
+        self.totals = dict.fromkeys(_STAT_KEYS, 0)
+
+    @staticmethod
+    def _decode(filename: str) -> pg.mixer.Sound:
+        path = resolve_path("assets", "sounds", filename) or resolve_path("assets", filename)
+        if path:
+            return pg.mixer.Sound(path)
+        print(f"Warning: Sound {filename} not found.")
+        return pg.mixer.Sound(buffer=bytearray([0] * 100))
+
+    def wait_ready(self, timeout: Optional[float] = None) -> bool:
+        """Block until every sound is decoded; return False on timeout."""
+        _, not_done = wait(self.futures.values(), timeout=timeout)
+        return not not_done
+
+    def get(self, key: str) -> Optional[pg.mixer.Sound]:
+        """Return the decoded sound ``key``, or None while it is still loading."""
+        future = self.futures.get(key)
+        if future is None or not future.done():
+            return None
+        return future.result()
+
+    def begin_frame(self) -> dict:
+        """Start counting a new frame and return the stats of the previous one."""
+        previous = self.frame_stats
+        self.frame_stats = dict.fromkeys(_STAT_KEYS, 0)
+        return previous
+
+    def _count(self, stat: str, amount=1) -> None:
+        self.frame_stats[stat] += amount
+        self.totals[stat] += amount
+
+    def play(self, key: str, loops: int = 0) -> Optional[pg.mixer.Channel]:
+        """
+        Play ``key`` on its loop channel or on a free or lower priority effect channel.
+
+        Returns:
+            pg.mixer.Channel | None: The channel used, or None if the sound did
+            not start: it was not ready, already playing, or outranked on every
+            channel. Callers that track a looping sound retry on None.
+        """
+        start = time.perf_counter()
+        try:
+            sound = self.get(key)
+            if sound is None:
+                self._count("not_ready")
+                return None
+
+            channel = self.loop_channels.get(key)
+            if channel is not None:
+                channel.play(sound, loops)
+                self._count("played")
+                return channel
+            return self._play_effect(key, sound, loops)
+        finally:
+            self._count("seconds", time.perf_counter() - start)
+
+    def _play_effect(self, key: str, sound: pg.mixer.Sound, loops: int) -> Optional[pg.mixer.Channel]:
+        priority = s.SOUND_PRIORITIES.get(key, 0)
+        free = victim = None
+        for i, channel in enumerate(self.effect_channels):
+            if not channel.get_busy():
+                self._playing[i] = None
+                if free is None:
+                    free = i
+                continue
+            playing_priority, playing_key = self._playing[i] or (0, None)
+            if playing_key == key:
+                self._count("coalesced")
+                return None
+            if playing_priority < priority and (victim is None or playing_priority < self._playing[victim][0]):
+                victim = i
+
+        index = free if free is not None else victim
+        if index is None:
+            self._count("dropped")
+            return None
+        if free is None:
+            self._count("preempted")
+
+        channel = self.effect_channels[index]
+        channel.play(sound, loops)
+        self._playing[index] = (priority, key)
+        self._count("played")
+        return channel
+
+    def stop(self, key: str) -> None:
+        """Stop every channel that is playing ``key``."""
+        channel = self.loop_channels.get(key)
+        if channel is not None:
+            channel.stop()
+            return
+        for i, playing in enumerate(self._playing):
+            if playing and playing[1] == key:
+                self.effect_channels[i].stop()
+                self._playing[i] = None
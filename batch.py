@@ -0,0 +1,224 @@
+"""
+Vectorized batch environment module.
+
+This module provides the BatchEnv class, which steps N independent Pac-Man
+games in lockstep. The state of every game (Pac-Man, the four ghosts, coins,
+pills and score) lives in NumPy arrays, and one call to ``step`` applies the
+logic of ``Ghost.update``, ``Pacman.update``, ``Level.check_pills`` and
+``Pacman.check_ghost_collision`` to the whole batch at once; the ghosts of all
+games share one ``GhostSwarm``. The results match a headless ``Game`` tick for
+tick when both are created with the same seed.
+"""
+import random
+
+import numpy as np
+
+import settings as s
+from grid import TILE_PATH
+from maze import classic_maze
+from swarm import BITS, DX, DY, GHOST_EAT_SCORE, GhostSwarm
+
+
+class BatchEnv:
+    """N independent games whose state is stored in struct-of-arrays form."""
+    # pylint: disable=too-many-instance-attributes
+
+    def __init__(self, num_envs: int, seeds=None, maze=None):
+        """
+        Allocate the state arrays and reset every game.
+
+        Args:
+            num_envs (int): Number of games stepped together.
+            seeds (Sequence[int], optional): One seed per game for the RNG that
+                drives frightened ghost movement. Defaults to seeds 0..N-1.
+            maze (maze.Maze, optional): The maze every game is played on, with
+                its spawns and pills. Defaults to the classic maze.
+        """
+        self.num_envs = num_envs
+        self.maze = maze or classic_maze()
+        self.num_ghosts = len(self.maze.ghost_spawns)
+        self.grid = self.maze.grid
+        self.rows, self.cols = self.grid.rows, self.grid.cols
+        seeds = range(num_envs) if seeds is None else seeds
+        self.rngs = [random.Random(seed) for seed in seeds]
+
+        self._pacman_moves = np.frombuffer(self.grid.pacman_moves, dtype=np.uint8)
+        self._coin_template = np.frombuffer(self.grid.kinds, dtype=np.uint8) == TILE_PATH
+        self._tunnel_rows = np.zeros(self.rows, dtype=bool)
+        self._tunnel_rows[list(self.grid.tunnel_rows)] = True
+        self._pill_rows = np.array([row for row, _ in self.maze.pills], dtype=np.int64)
+        self._pill_cols = np.array([col for _, col in self.maze.pills], dtype=np.int64)
+
+        # Ghosts, flattened to N * G entries in spawn order within each game
+        self.ghosts = GhostSwarm(self.grid, self.maze.ghost_spawns, self.rngs)
+        self._ghost_env = self.ghosts.env
+        # Aliases of the swarm's arrays, which are only ever updated in place
+        self.ghost_row = self.ghosts.row
+        self.ghost_col = self.ghosts.col
+        self.ghost_x = self.ghosts.x
+        self.ghost_y = self.ghosts.y
+        self.ghost_direction = self.ghosts.direction
+        self.ghost_moving = self.ghosts.moving
+        self.ghost_progress = self.ghosts.progress
+        self.ghost_target_row = self.ghosts.target_row
+        self.ghost_target_col = self.ghosts.target_col
+        self.ghost_mode = self.ghosts.mode
+        self.ghost_mode_timer = self.ghosts.mode_timer
+        self.ghost_frightened = self.ghosts.frightened
+        self.ghost_timer = self.ghosts.timer
+        self.ghost_dead = self.ghosts.dead
+        self.ghost_dead_timer = self.ghosts.dead_timer
+        self.ghost_spawn_delay = self.ghosts.spawn_delay
+        self.ghost_in_house = self.ghosts.in_house
+
+        n = num_envs
+        # Pac-Man, one entry per game
+        self.pacman_row = np.zeros(n, dtype=np.int64)
+        self.pacman_col = np.zeros(n, dtype=np.int64)
+        self.pacman_x = np.zeros(n, dtype=np.float64)
+        self.pacman_y = np.zeros(n, dtype=np.float64)
+        self.pacman_direction = np.zeros(n, dtype=np.int64)
+        self.pacman_next_direction = np.zeros(n, dtype=np.int64)
+        self.pacman_moving = np.zeros(n, dtype=bool)
+        self.pacman_progress = np.zeros(n, dtype=np.float64)
+        self.pacman_target_row = np.zeros(n, dtype=np.int64)
+        self.pacman_target_col = np.zeros(n, dtype=np.int64)
+        self.pacman_alive = np.ones(n, dtype=bool)
+
+        # Board
+        self.coins = np.zeros((n, self.rows * self.cols), dtype=bool)
+        self.coin_count = np.zeros(n, dtype=np.int64)
+        self.pills_eaten = np.zeros((n, len(self._pill_rows)), dtype=bool)
+        self.score = np.zeros(n, dtype=np.int64)
+
+        self.reset()
+
+    def ghost_view(self, name: str) -> np.ndarray:
+        """Return a (N, G) view of a flat ghost array such as ``ghost_row``."""
+        return getattr(self, name).reshape(self.num_envs, self.num_ghosts)
+
+    def reset(self, envs=None, keep_score: bool = False) -> None:
+        """
+        Reset the given games (all by default) to a fresh board.
+
+        Args:
+            envs (array-like, optional): Indices or boolean mask of games to reset.
+            keep_score (bool): Carry the score over, as a cleared level does.
+        """
+        env_mask = np.zeros(self.num_envs, dtype=bool)
+        env_mask[slice(None) if envs is None else envs] = True
+        ghost_mask = env_mask[self._ghost_env]
+
+        row, col = self.maze.pacman_spawn
+        self.pacman_row[env_mask] = row
+        self.pacman_col[env_mask] = col
+        self.pacman_x[env_mask] = col * s.TILE_SIZE
+        self.pacman_y[env_mask] = row * s.TILE_SIZE
+        self.pacman_direction[env_mask] = 0
+        self.pacman_next_direction[env_mask] = 0
+        self.pacman_moving[env_mask] = False
+        self.pacman_progress[env_mask] = 0
+        self.pacman_target_row[env_mask] = row
+        self.pacman_target_col[env_mask] = col
+        self.pacman_alive[env_mask] = True
+
+        self.ghosts.reset(ghost_mask)
+
+        self.coins[env_mask] = self._coin_template
+        self.coin_count[env_mask] = int(self._coin_template.sum())
+        self.pills_eaten[env_mask] = False
+        if not keep_score:
+            self.score[env_mask] = 0
+
+    def step(self, actions=None) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Advance every game by one tick.
+
+        Args:
+            actions (array-like, optional): Direction code per game to queue as
+                Pac-Man's next direction; 0 leaves the queued input unchanged.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: Score gained this tick and a mask of
+            games in which Pac-Man died. Those games are reset automatically.
+        """
+        if actions is not None:
+            actions = np.asarray(actions, dtype=np.int64)
+            self.pacman_next_direction = np.where(actions != 0, actions, self.pacman_next_direction)
+
+        prev_score = self.score.copy()
+
+        self.ghosts.update(self.pacman_row, self.pacman_col, self.pacman_direction)
+        self._update_pacman()
+        self._check_pills()
+        self._check_ghost_collisions()
+
+        rewards = self.score - prev_score
+
+        cleared = self.coin_count == 0
+        if cleared.any():
+            self.reset(cleared, keep_score=True)
+
+        dead = ~self.pacman_alive & ~cleared
+        if dead.any():
+            self.reset(dead)
+        return rewards, dead
+
+    # ---------- Pac-Man ----------
+    def _update_pacman(self) -> None:
+        idle = ~self.pacman_moving
+        wanted = np.where(self.pacman_next_direction != 0, self.pacman_next_direction, self.pacman_direction)
+        # A stationary Pac-Man with no input skips the rest of the update, coins included
+        still = idle & (wanted == 0)
+
+        tiles = self.pacman_row * self.cols + self.pacman_col
+        starts = idle & ~still & ((self._pacman_moves[tiles] & BITS[wanted]) != 0)
+        self.pacman_direction[starts] = wanted[starts]
+        self.pacman_moving[starts] = True
+        self.pacman_progress[starts] = 0
+        self.pacman_target_row[starts] = self.pacman_row[starts] + DY[wanted[starts]]
+        self.pacman_target_col[starts] = self.pacman_col[starts] + DX[wanted[starts]]
+
+        moving = self.pacman_moving & (self.pacman_direction != 0)
+        codes = self.pacman_direction[moving]
+        dx_px = DX[codes] * s.BASE_SPEED
+        dy_px = DY[codes] * s.BASE_SPEED
+        self.pacman_x[moving] += dx_px
+        self.pacman_y[moving] += dy_px
+        self.pacman_progress[moving] += np.abs(dx_px) + np.abs(dy_px)
+
+        arrived = moving & (self.pacman_progress >= s.TILE_SIZE)
+        self.pacman_row[arrived] = self.pacman_target_row[arrived]
+        col = self.pacman_target_col[arrived]
+        tunnel = self._tunnel_rows[self.pacman_row[arrived]]
+        col = np.where(tunnel & (col < 0), self.cols - 1, col)
+        col = np.where(tunnel & (col >= self.cols), 0, col)
+        self.pacman_col[arrived] = col
+        self.pacman_x[arrived] = self.pacman_col[arrived] * s.TILE_SIZE
+        self.pacman_y[arrived] = self.pacman_row[arrived] * s.TILE_SIZE
+        self.pacman_moving[arrived] = False
+        self.pacman_progress[arrived] = 0
+
+        envs = np.flatnonzero(~still)
+        tiles = self.pacman_row[envs] * self.cols + self.pacman_col[envs]
+        eaten = self.coins[envs, tiles]
+        self.coins[envs[eaten], tiles[eaten]] = False
+        self.coin_count[envs[eaten]] -= 1
+        self.score[envs[eaten]] += s.COIN_SCORE_VALUE
+
+    def _check_pills(self) -> None:
+        hit = (
+            ~self.pills_eaten
+            & (self.pacman_row[:, None] == self._pill_rows[None, :])
+            & (self.pacman_col[:, None] == self._pill_cols[None, :])
+        )
+        self.pills_eaten |= hit
+        count = hit.sum(axis=1)
+        self.score += count * s.PILL_SCORE_VALUE
+
+        self.ghosts.frighten(count > 0)
+
+    def _check_ghost_collisions(self) -> None:
+        eaten, caught = self.ghosts.collide(self.pacman_x, self.pacman_y)
+        self.score += eaten * GHOST_EAT_SCORE
+        self.pacman_alive &= ~caught
@@ -0,0 +1,362 @@
+"""
+Benchmark module.
+
+This module measures the simulation and rendering hot paths headlessly, with
+SDL's dummy video and audio drivers, and compares the results with a stored
+baseline. Every workload reports one number together with its unit and
+whether higher is better. A result that is worse than the baseline by more
+than the threshold counts as a regression, and the command exits with status 1.
+
+Usage:
+    python bench.py                      # run and compare with bench_baseline.json
+    python bench.py --output out.json    # also write the results
+    python bench.py --update-baseline    # store the results as the new baseline
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+from typing import Callable, Optional
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+# pylint: disable=wrong-import-position
+import numpy as np
+import pygame as pg
+
+import settings as s
+from assets import SpriteManager
+from flowfield import FlowFields
+from game import Game
+from maze import generate_maze
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "bench_baseline.json")
+DEFAULT_THRESHOLD = 0.25
+# Board and ghost counts of the swarm stress workloads
+STRESS_MAZE_SIZE = 101
+SWARM_COUNTS = (4, 64, 256, 1000)
+OBJECT_COUNTS = (4, 64)
+# cycling_policy holds each of these directions for CYCLE_TICKS ticks in turn
+CYCLE_DIRECTIONS = (s.Direction.LEFT, s.Direction.UP, s.Direction.RIGHT, s.Direction.DOWN)
+CYCLE_TICKS = 20
+
+
+def cycling_policy(game: Game) -> s.Direction:
+    """Scripted policy that turns through ``CYCLE_DIRECTIONS``; the tests drive games with it too."""
+    return CYCLE_DIRECTIONS[game.tick // CYCLE_TICKS % len(CYCLE_DIRECTIONS)]
+
+
+def _playing_game(headless: bool = True, seed: int = 1) -> Game:
+    game = Game(headless=headless, seed=seed)
+    game._start_game()  # pylint: disable=protected-access
+    game.intro_ticks_left = 0
+    return game
+
+
+def _best_rate(fn: Callable[[], int], repeats: int, setup: Optional[Callable[[], None]] = None) -> float:
+    """Run ``fn`` ``repeats`` times and return the best operations per second.
+
+    ``setup``, when given, runs before every repeat and is not timed.
+    """
+    best = 0.0
+    for _ in range(repeats):
+        if setup:
+            setup()
+        start = time.perf_counter()
+        ops = fn()
+        best = max(best, ops / (time.perf_counter() - start))
+    return best
+
+
+def _best_ms(fn: Callable[[], int], repeats: int, setup: Optional[Callable[[], None]] = None) -> float:
+    """Run ``fn`` ``repeats`` times and return the best milliseconds per operation."""
+    return 1000 / _best_rate(fn, repeats, setup)
+
+
+def bench_ghost_update(scale: int, repeats: int) -> float:
+    """Ghost.update calls per second while Pac-Man roams the maze."""
+    game = _playing_game()
+
+    def run():
+        pacman = game.pacman
+        for _ in range(scale):
+            for ghost in game.ghosts_list:
+                ghost.update(pacman)
+        return scale * len(game.ghosts_list)
+
+    return _best_rate(run, repeats)
+
+
+def bench_pacman_update(scale: int, repeats: int) -> float:
+    """Pacman.update calls per second, turning as cycling_policy does."""
+    game = _playing_game()
+
+    def run():
+        pacman, grid, level = game.pacman, game.level.grid, game.level
+        for i in range(scale):
+            pacman.next_direction = CYCLE_DIRECTIONS[i // CYCLE_TICKS % len(CYCLE_DIRECTIONS)]
+            pacman.update(grid, level)
+        return scale
+
+    return _best_rate(run, repeats)
+
+
+def bench_choose_best_direction(scale: int, repeats: int) -> float:
+    """Ghost._choose_best_direction calls per second that miss the decision cache."""
+    game = _playing_game()
+    ghost = game.blinky
+    tiles = [(r, c) for r in range(game.level.grid.rows) for c in range(game.level.grid.cols)
+             if not game.level.grid.is_wall(r, c)]
+
+    def run():
+        # Every (tile, target) pair is new, so each call computes its decision
+        for i in range(scale):
+            ghost.row, ghost.col = tiles[i % len(tiles)]
+            ghost._choose_best_direction(*tiles[i // len(tiles) % len(tiles)])  # pylint: disable=protected-access
+        return scale
+
+    return _best_rate(run, repeats, ghost.decisions.clear)
+
+
+def bench_cached_choose_best_direction(scale: int, repeats: int) -> float:
+    """Ghost._choose_best_direction calls per second toward one target, answered by the decision cache."""
+    game = _playing_game()
+    ghost = game.blinky
+    tiles = [(r, c) for r in range(game.level.grid.rows) for c in range(game.level.grid.cols)
+             if not game.level.grid.is_wall(r, c)]
+
+    def run():
+        for i in range(scale):
+            ghost.row, ghost.col = tiles[i % len(tiles)]
+            ghost._choose_best_direction(*s.PACMAN_SPAWN)  # pylint: disable=protected-access
+        return scale
+
+    return _best_rate(run, repeats)
+
+
+def bench_path_choose_best_direction(scale: int, repeats: int) -> float:
+    """Path-steering Ghost._choose_best_direction calls per second, one flow field per target."""
+    game = _playing_game()
+    ghost = game.blinky
+    ghost.path_distance = True
+    tiles = [(r, c) for r in range(game.level.grid.rows) for c in range(game.level.grid.cols)
+             if not game.level.grid.is_wall(r, c)]
+
+    def run():
+        for i in range(scale):
+            ghost.row, ghost.col = tiles[i % len(tiles)]
+            ghost._choose_best_direction(*tiles[i // 64 % len(tiles)])  # pylint: disable=protected-access
+        return scale
+
+    return _best_rate(run, repeats)
+
+
+def bench_flow_field_build(scale: int, repeats: int) -> float:
+    """Milliseconds per flow field search on a large generated maze."""
+    grid = generate_maze(STRESS_MAZE_SIZE, STRESS_MAZE_SIZE).grid
+    fields = FlowFields(grid, capacity=1)
+    tiles = np.flatnonzero(fields.walkable).tolist()
+    builds = max(1, scale // 1000)
+
+    def run():
+        for i in range(builds):
+            fields.toward(*divmod(tiles[i * 7919 % len(tiles)], grid.cols))
+        return builds
+
+    return _best_ms(run, repeats)
+
+
+def bench_episode(scale: int, repeats: int) -> float:
+    """Logic ticks per second of complete headless episodes."""
+    def run():
+        ticks = 0
+        seed = 0
+        while ticks < scale:
+            stats = Game(headless=True, seed=seed).simulate(scale - ticks, cycling_policy)
+            ticks += stats["ticks"]
+            seed += 1
+        return ticks
+
+    return _best_rate(run, repeats)
+
+
+def _stress_workload(count: int, swarm: bool) -> Callable[[int, int], float]:
+    """Return a workload timing full ticks with ``count`` ghosts on a large generated maze."""
+    def bench(scale: int, repeats: int) -> float:
+        maze = generate_maze(STRESS_MAZE_SIZE, STRESS_MAZE_SIZE)
+        game = Game(headless=True, seed=1, maze=maze, ghost_count=count, swarm=swarm)
+        ticks = max(10, scale // 100)
+
+        def setup():
+            # Building the ghosts and their spawns is not part of the throughput
+            if game.state != s.STATE_PLAYING:
+                game._start_game()  # pylint: disable=protected-access
+
+        def run():
+            done = 0
+            while done < ticks and game.state == s.STATE_PLAYING:
+                game.step(cycling_policy)
+                done += 1
+            return done * count
+
+        return _best_rate(run, repeats, setup)
+
+    mode = "GhostSwarm" if swarm else "Ghost objects"
+    bench.__doc__ = f"Ghost updates per second in full ticks with {count} {mode} on a {STRESS_MAZE_SIZE}-tile maze."
+    return bench
+
+
+def bench_level_draw(scale: int, repeats: int) -> float:
+    """Milliseconds per Level.draw onto a screen-sized surface."""
+    game = _playing_game()
+    screen = pg.Surface(game.maze.size)
+    frames = max(1, scale // 20)
+
+    def run():
+        for _ in range(frames):
+            game.level.draw(screen)
+        return frames
+
+    return _best_ms(run, repeats)
+
+
+def bench_game_draw(scale: int, repeats: int) -> float:
+    """Milliseconds per Game._draw of the playing screen, including the flip."""
+    game = _playing_game(headless=False)
+    frames = max(1, scale // 20)
+
+    def run():
+        # pylint: disable=protected-access
+        for _ in range(frames):
+            if game.state != s.STATE_PLAYING:
+                game._start_game()
+                game.intro_ticks_left = 0
+            game.step(cycling_policy)
+            game._draw()
+        return frames
+
+    return _best_ms(run, repeats)
+
+
+def bench_sprite_load(scale: int, repeats: int) -> float:  # pylint: disable=unused-argument
+    """Milliseconds to load and pack the ghost sprites without the disk cache."""
+    pg.display.set_mode((1, 1))
+
+    def run():
+        SpriteManager(cache_dir=None).get_ghost_image("blinky", s.Direction.UP, False)
+        return 1
+
+    return _best_ms(run, repeats)
+
+
+# name: (function, unit, higher_is_better)
+WORKLOADS = {
+    "ghost_update": (bench_ghost_update, "calls/s", True),
+    "pacman_update": (bench_pacman_update, "calls/s", True),
+    "choose_best_direction": (bench_choose_best_direction, "calls/s", True),
+    "cached_choose_best_direction": (bench_cached_choose_best_direction, "calls/s", True),
+    "path_choose_best_direction": (bench_path_choose_best_direction, "calls/s", True),
+    "flow_field_build": (bench_flow_field_build, "ms", False),
+    "episode": (bench_episode, "ticks/s", True),
+    "level_draw": (bench_level_draw, "ms", False),
+    "game_draw": (bench_game_draw, "ms", False),
+    "sprite_load": (bench_sprite_load, "ms", False),
+}
+WORKLOADS.update({
+    f"swarm_{count}": (_stress_workload(count, swarm=True), "ghosts/s", True) for count in SWARM_COUNTS
+})
+WORKLOADS.update({
+    f"objects_{count}": (_stress_workload(count, swarm=False), "ghosts/s", True) for count in OBJECT_COUNTS
+})
+
+
+def run_benchmarks(names: Optional[list[str]] = None, scale: int = 20_000, repeats: int = 5) -> dict:
+    """
+    Run the selected workloads.
+
+    Args:
+        names (list[str], optional): Workloads to run; all of them by default.
+        scale (int): Work per repeat, in calls or ticks (draws use scale / 20 frames).
+        repeats (int): Repeats per workload; the best one is kept.
+
+    Returns:
+        dict: Machine information and one ``{value, unit, higher_is_better}``
+        entry per workload.
+    """
+    results = {}
+    for name in names or WORKLOADS:
+        fn, unit, higher_is_better = WORKLOADS[name]
+        results[name] = {"value": fn(scale, repeats), "unit": unit, "higher_is_better": higher_is_better}
+    return {
+        "python": platform.python_version(),
+        "pygame": pg.version.ver,
+        "machine": platform.machine(),
+        "results": results,
+    }
+
+
+def compare(results: dict, baseline: dict, threshold: float = DEFAULT_THRESHOLD) -> list[str]:
+    """
+    Return a message for every workload that regressed beyond ``threshold``.
+
+    A rate regresses when it falls below ``(1 - threshold)`` times the
+    baseline; a duration regresses when it exceeds ``(1 + threshold)`` times it.
+    Workloads missing from the baseline are skipped.
+    """
+    regressions = []
+    for name, result in results["results"].items():
+        base = baseline.get("results", {}).get(name)
+        if base is None:
+            continue
+        value, reference = result["value"], base["value"]
+        if result["higher_is_better"]:
+            regressed = value < reference * (1 - threshold)
+        else:
+            regressed = value > reference * (1 + threshold)
+        if regressed:
+            regressions.append(f"{name}: {value:.4g} {result['unit']} vs baseline {reference:.4g}")
+    return regressions
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Pac-Man benchmarks")
+    parser.add_argument("workloads", nargs="*", help=f"workloads to run (default: all of {', '.join(WORKLOADS)})")
+    parser.add_argument("--scale", type=int, default=20_000, help="calls or ticks per repeat")
+    parser.add_argument("--repeats", type=int, default=5, help="repeats per workload; the best is kept")
+    parser.add_argument("--baseline", default=BASELINE_PATH, help="baseline JSON to compare with")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, help="allowed relative slowdown")
+    parser.add_argument("--output", help="write the results as JSON to this file")
+    parser.add_argument("--update-baseline", action="store_true", help="store the results as the baseline")
+    args = parser.parse_args(argv)
+    unknown = set(args.workloads) - set(WORKLOADS)
+    if unknown:
+        parser.error(f"unknown workloads: {', '.join(sorted(unknown))}")
+
+    results = run_benchmarks(args.workloads or None, args.scale, args.repeats)
+    for name, result in results["results"].items():
+        print(f"{name:<24}{result['value']:>14.4g} {result['unit']}")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+    if args.update_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+        return 0
+    if not os.path.exists(args.baseline):
+        print(f"No baseline at {args.baseline}; run with --update-baseline to create one")
+        return 0
+
+    with open(args.baseline, encoding="utf-8") as f:
+        regressions = compare(results, json.load(f), args.threshold)
+    for message in regressions:
+        print(f"REGRESSION {message}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
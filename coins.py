@@ -0,0 +1,67 @@
+"""
+Coin storage module.
+
+This module provides CoinGrid, which stores the coins of a level as one integer
+bitset over flat tile indices (``row * cols + col``). Membership, pickup and the
+remaining count are O(1), a snapshot of the coins is the integer itself, and
+the indices of eaten coins are logged in order so that renderers can erase
+them incrementally instead of redrawing every coin each frame.
+"""
+from grid import MazeGrid, TILE_PATH
+
+
+class CoinGrid:
+    """Remaining coins of a level, as a bitset over tile indices."""
+
+    def __init__(self, cols: int, bits: int = 0):
+        """
+        Args:
+            cols (int): Width of the maze, used to turn (row, col) into an index.
+            bits (int): Bit ``i`` is set when tile ``i`` holds a coin.
+        """
+        self.cols = cols
+        self.bits = bits
+        self.count = bits.bit_count()
+        self.eaten: list[int] = []
+
+    @classmethod
+    def for_grid(cls, grid: MazeGrid) -> 'CoinGrid':
+        """Place a coin on every walkable corridor tile of ``grid``."""
+        bits = 0
+        for idx, kind in enumerate(grid.kinds):
+            if kind == TILE_PATH:
+                bits |= 1 << idx
+        return cls(grid.cols, bits)
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __contains__(self, pos) -> bool:
+        r, c = pos
+        if r < 0 or not 0 <= c < self.cols:
+            return False
+        return self.bits >> (r * self.cols + c) & 1 == 1
+
+    def __iter__(self):
+        bits = self.bits
+        while bits:
+            lowest = bits & -bits
+            yield divmod(lowest.bit_length() - 1, self.cols)
+            bits ^= lowest
+
+    def take(self, r: int, c: int) -> bool:
+        """Remove the coin at (r, c) if there is one; return True if it was removed."""
+        if r < 0 or not 0 <= c < self.cols:
+            return False
+        idx = r * self.cols + c
+        if not self.bits >> idx & 1:
+            return False
+        self.bits ^= 1 << idx
+        self.count -= 1
+        self.eaten.append(idx)
+        return True
+
+    def remove(self, pos) -> None:
+        """Remove the coin at ``pos``; raise KeyError if there is none, like ``set.remove``."""
+        if not self.take(*pos):
+            raise KeyError(pos)
@@ -0,0 +1,89 @@
+"""
+Ghost decision cache module.
+
+This module provides DecisionCache, a bounded LRU memo of the directions
+ghosts choose when they finish a tile. A decision depends only on the ghost's
+tile, its heading, its target tile, whether it is in the house and how it
+measures distance, so the same situations (a scatter-corner loop, Blinky
+chasing Pac-Man down a long corridor) resolve to a dictionary hit after the
+first time. Each maze layout has its own cache, so entries never leak from one
+layout to another, and a layout's cache can be dropped on its own. Hits,
+misses and evictions are counted for reporting.
+"""
+from collections import OrderedDict
+from typing import Hashable, Optional
+
+import settings as s
+from grid import MazeGrid, layout_hash
+
+DECISION_CACHE_SIZE = 1 << 16
+
+_caches: dict[str, 'DecisionCache'] = {}
+
+
+class DecisionCache:
+    """Bounded LRU memo of ghost decisions on one maze layout."""
+
+    def __init__(self, capacity: int = DECISION_CACHE_SIZE):
+        """
+        Args:
+            capacity (int): Number of decisions kept; the least recently used goes first.
+        """
+        self.capacity = capacity
+        self._entries: OrderedDict[Hashable, s.Direction] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @classmethod
+    def for_grid(cls, grid: MazeGrid) -> 'DecisionCache':
+        """Return the cache shared by every grid with this layout."""
+        key = layout_hash(grid)
+        cache = _caches.get(key)
+        if cache is None:
+            cache = _caches[key] = cls()
+        return cache
+
+    @staticmethod
+    def invalidate(grid: Optional[MazeGrid] = None) -> None:
+        """Forget the decisions made on ``grid``'s layout, or on every layout."""
+        caches = _caches.values() if grid is None else [_caches.get(layout_hash(grid))]
+        for cache in caches:
+            if cache is not None:
+                # Cleared in place, since ghosts keep a reference to their maze's cache
+                cache.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        """Drop every decision; the counters keep running."""
+        self._entries.clear()
+
+    def get(self, key: Hashable) -> Optional[s.Direction]:
+        """Return the decision stored under ``key``, or None on a miss."""
+        direction = self._entries.get(key)
+        if direction is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return direction
+
+    def put(self, key: Hashable, direction: s.Direction) -> None:
+        """Store a decision, evicting the least recently used one when full."""
+        self._entries[key] = direction
+        if len(self._entries) > self.capacity:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def stats(self) -> dict:
+        """Entries, hits, misses, evictions and the hit rate."""
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
@@ -0,0 +1,172 @@
+"""
+Flow field module.
+
+This module provides FlowField, the shortest ghost-path distance from every
+tile of a maze to one target tile, together with the move a path-steering
+ghost makes on each tile for each heading it can arrive with. A field is
+built by one breadth-first search from the target over the reversed ghost
+moves, so after that every ghost steering toward the target decides its next
+step with a single table lookup. FlowFields keeps the fields of one maze in a
+bounded LRU cache keyed by target tile and shared by all ghosts: while
+Pac-Man stays on a tile, every ghost chasing him reuses the same field, and
+a new one is only searched when he enters a tile whose field is not cached.
+Build counts and times are kept so the cost of the searches can be reported.
+Only the fields toward recent targets are stored, never a distance for every
+pair of tiles, so fields also work on mazes far larger than the classic one.
+"""
+import time
+from collections import OrderedDict, deque
+
+import numpy as np
+
+import settings as s
+from grid import DIRECTIONS, DIRECTION_BITS, MazeGrid, TILE_DOOR, TILE_WALL, layout_hash
+
+# Decision codes: 0 stops, 1-4 step in DIRECTIONS order (the codes of swarm.DIRECTION_CODES)
+STEPS = (s.Direction.STOP,) + DIRECTIONS
+_STEP_CODES = {d: i for i, d in enumerate(STEPS)}
+FLOW_FIELD_CACHE_SIZE = 64
+UNREACHABLE = np.iinfo(np.uint16).max
+
+_fields: dict[str, 'FlowFields'] = {}
+
+
+class FlowField:
+    """Path distances to one target tile and the move toward it from every tile."""
+    # pylint: disable=too-few-public-methods
+    __slots__ = ("target", "dist", "decisions", "_flat")
+
+    def __init__(self, target: int, dist: np.ndarray, decisions: np.ndarray):
+        """
+        Args:
+            target (int): Flat index of the target tile.
+            dist (np.ndarray): ``uint16`` path length from every tile, ``UNREACHABLE`` if none.
+            decisions (np.ndarray): ``(tiles, 5)`` decision codes per tile and heading code.
+        """
+        self.target = target
+        self.dist = dist
+        self.decisions = decisions
+        # Indexing bytes is much cheaper than indexing an array for one ghost at a time
+        self._flat = decisions.tobytes()
+
+    def direction(self, idx: int, heading: s.Direction) -> s.Direction:
+        """Return the move of a ghost outside the house on tile ``idx`` heading ``heading``."""
+        return STEPS[self._flat[idx * len(STEPS) + _STEP_CODES[heading]]]
+
+
+class FlowFields:
+    """LRU cache of the flow fields of one maze, shared by every ghost on it."""
+    # pylint: disable=too-many-instance-attributes
+
+    def __init__(self, grid: MazeGrid, capacity: int = FLOW_FIELD_CACHE_SIZE):
+        """
+        Args:
+            grid (MazeGrid): The maze.
+            capacity (int): Number of fields kept; the least recently used goes first.
+        """
+        self.grid = grid
+        self.capacity = capacity
+        size = grid.rows * grid.cols
+        self.walkable = np.array([kind not in (TILE_WALL, TILE_DOOR) for kind in grid.kinds])
+        moves = np.frombuffer(bytes(grid.ghost_moves), dtype=np.uint8)
+
+        # Ghost moves as a (tiles, 4) mask, the tiles they lead to, and the reversed edges for the search
+        self._allowed = np.stack([(moves & DIRECTION_BITS[d.value]) != 0 for d in DIRECTIONS], axis=1)
+        self._neighbors = np.stack([np.asarray(grid.neighbors[d.value]) for d in DIRECTIONS], axis=1)
+        self._sources: list[list[int]] = [[] for _ in range(size)]
+        for idx, d in zip(*np.nonzero(self._allowed & self.walkable[:, None])):
+            self._sources[int(self._neighbors[idx, d])].append(int(idx))
+
+        self._fields: OrderedDict[int, FlowField] = OrderedDict()
+        self._targets: dict[tuple[int, int], int] = {}
+        self.hits = 0
+        self.builds = 0
+        self.build_seconds = 0.0
+
+    @classmethod
+    def for_grid(cls, grid: MazeGrid) -> 'FlowFields':
+        """Return the cache shared by every grid with this layout."""
+        key = layout_hash(grid)
+        fields = _fields.get(key)
+        if fields is None:
+            fields = _fields[key] = cls(grid)
+        return fields
+
+    def target_index(self, row: int, col: int) -> int:
+        """Flat index of the walkable tile nearest to (row, col), which may be off the board."""
+        grid = self.grid
+        row = min(max(row, 0), grid.rows - 1)
+        col = min(max(col, 0), grid.cols - 1)
+        idx = self._targets.get((row, col))
+        if idx is None:
+            idx = row * grid.cols + col
+            if not self.walkable[idx]:
+                # Ties go to the first walkable tile in reading order
+                walkable = np.flatnonzero(self.walkable)
+                w_rows, w_cols = np.divmod(walkable, grid.cols)
+                idx = int(walkable[np.argmin((w_rows - row) ** 2 + (w_cols - col) ** 2)])
+            self._targets[(row, col)] = idx
+        return idx
+
+    def toward(self, row: int, col: int) -> FlowField:
+        """Return the field of the tile nearest to (row, col), building it if it is not cached."""
+        target = self.target_index(row, col)
+        field = self._fields.get(target)
+        if field is not None:
+            self._fields.move_to_end(target)
+            self.hits += 1
+            return field
+
+        start = time.perf_counter()
+        field = self._build(target)
+        self.build_seconds += time.perf_counter() - start
+        self.builds += 1
+        self._fields[target] = field
+        if len(self._fields) > self.capacity:
+            self._fields.popitem(last=False)
+        return field
+
+    def _build(self, target: int) -> FlowField:
+        size = self.grid.rows * self.grid.cols
+        dist = [UNREACHABLE] * size
+        dist[target] = 0
+        sources = self._sources
+        queue = deque([target])
+        while queue:
+            idx = queue.popleft()
+            step = dist[idx] + 1
+            for source in sources[idx]:
+                if dist[source] == UNREACHABLE:
+                    dist[source] = step
+                    queue.append(source)
+        dist = np.array(dist, dtype=np.uint16)
+        return FlowField(target, dist, self._decisions(dist))
+
+    def _decisions(self, dist: np.ndarray) -> np.ndarray:
+        """Resolve ``Ghost._choose_best_direction`` for every tile and heading at once."""
+        allowed = self._allowed
+        ahead = np.where(allowed, dist[self._neighbors].astype(np.int64), np.iinfo(np.int64).max)
+        decisions = np.zeros((len(dist), len(STEPS)), dtype=np.uint8)
+        decisions[:, 0] = np.where(allowed.any(axis=1), np.argmin(ahead, axis=1) + 1, 0)
+        for heading in range(1, len(STEPS)):
+            # Ghosts never turn back, unless a dead end leaves no other way
+            reverse = DIRECTIONS.index(s.Direction(tuple(-v for v in STEPS[heading].value)))
+            options = ahead.copy()
+            options[:, reverse] = np.iinfo(np.int64).max
+            forward = allowed.copy()
+            forward[:, reverse] = False
+            stuck = np.where(allowed[:, reverse], reverse + 1, 0)
+            decisions[:, heading] = np.where(forward.any(axis=1), np.argmin(options, axis=1) + 1, stuck)
+        return decisions
+
+    def stats(self) -> dict:
+        """Cache hits, field builds and the time spent building them."""
+        lookups = self.hits + self.builds
+        return {
+            "fields": len(self._fields),
+            "hits": self.hits,
+            "builds": self.builds,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "build_seconds": self.build_seconds,
+            "build_ms_mean": 1000 * self.build_seconds / self.builds if self.builds else 0.0,
+        }
@@ -1,69 +1,162 @@
 import os
+import random
+import time
+from datetime import datetime
 import pygame as pg
 import settings as s
 import ghosts
+from inputlog import InputLog
+from snapshot import GameState
+from renderer import DirtyRenderer
 from pacman import Pacman
 from level import Level
+from maze import classic_maze
+from occupancy import OccupancyGrid
+from swarm import DIRECTION_INDEX, GHOST_EAT_SCORE, GhostSwarm, ghost_spawns
+from observation import ObservationEncoder
 from menu import MainMenuScreen, SettingsScreen
 from assets import SpriteManager
+from audio import AudioManager
+from startup import StartupProfiler
+from profiler import FrameProfiler
 
 
 class Game:
-    def __init__(self):
-        pg.init()
-        pg.mixer.init()
-
-        self.screen = pg.display.set_mode((s.SCREEN_WIDTH, s.SCREEN_HEIGHT))
-        pg.display.set_caption("Pacman")
-        self.clock = pg.time.Clock()
+    def __init__(self, headless: bool = False, seed=None, record_dir=None, dirty_rects: bool = False,
+                 profile_startup: bool = False, profile: bool = False, maze=None, ghost_count=None,
+                 swarm: bool = False, path_distance=None):
+        # pylint: disable=too-many-arguments, too-many-positional-arguments
+        # Headless games only run the simulation: no window, mixer, sprites or menus.
+        self.headless = headless
+        self.startup = StartupProfiler()
+        self.profile_startup = profile_startup
         self.running = True
         self.state = s.STATE_MENU
-        self.play_start_time = 0
+        # Every episode is played on this maze; the classic one unless a maze file was loaded
+        self.maze = maze or classic_maze()
+        # Number of ghosts (the maze's own by default), and whether they run as one GhostSwarm
+        self.ghost_count = ghost_count
+        self.use_swarm = swarm
+        # Whether ghosts steer by path distance; settings.GHOST_PATH_DISTANCE by default
+        self.path_distance = s.GHOST_PATH_DISTANCE if path_distance is None else path_distance
+
+        # All game randomness comes from one seeded RNG, and time is counted in
+        # logic ticks, so a seed plus the inputs reproduces a run at any speed.
+        self.seed = seed if seed is not None else random.randrange(2 ** 32)
+        self.rng = random.Random(self.seed)
+        self.episodes = 0
+        self.episode_seed = self.seed
+        self.tick = 0
+        self.intro_ticks_left = 0
+        self.final_score = 0
+
+        # Fixed-timestep loop: real time is banked, in ticks, and spent in whole logic ticks
+        self.tick_seconds = 1 / s.FPS
+        self.accumulator = 0.0
+        self.dropped_ticks = 0
         self.current_bg_sound = None
 
-        self.sounds = {}
-        self._analyze_sounds()
+        # When set, every episode's inputs are written there as an InputLog
+        self.record_dir = record_dir
+        self.recorder = None
+
+        # Optional incremental renderer for the PLAYING state
+        self.renderer = DirtyRenderer() if dirty_rects and not headless else None
+
+        if headless:
+            self.screen = None
+            self.clock = None
+            self.sprite_manager = None
+            self.menu_screen = None
+            self.audio = None
+        else:
+            with self.startup.phase("pygame init"):
+                pg.init()
+            with self.startup.phase("mixer init"):
+                pg.mixer.init()
+
+            with self.startup.phase("display"):
+                self.screen = pg.display.set_mode(self.maze.size)
+                pg.display.set_caption("Pacman")
+                self.clock = pg.time.Clock()
 
-        self.sprite_manager = SpriteManager()
+            # Sounds decode on a background thread; sprites on first use
+            with self.startup.phase("audio"):
+                self.audio = AudioManager()
+            self.sprite_manager = SpriteManager()
 
-        self.menu_screen = MainMenuScreen(
-            on_play=self._start_game,
-            on_exit=self._quit_game,
-            on_settings=self._open_settings
-        )
-        self.settings_screen = SettingsScreen(on_back=self._open_menu)
+            with self.startup.phase("main menu"):
+                self.menu_screen = MainMenuScreen(
+                    on_play=self._start_game,
+                    on_exit=self._quit_game,
+                    on_settings=self._open_settings,
+                    size=self.screen.get_size(),
+                )
+        # The settings screen is built the first time it is opened
+        self._settings_screen = None
 
         self.level = None
         self.pacman = None
         self.ghosts_list = []
         self.blinky = self.pinky = self.inky = self.clyde = None
+        self.occupancy = None
+        self.swarm = None
+        # Agents' tensor view of the board, created by the first ``observe``
+        self._observation = None
 
-    def _analyze_sounds(self):
-        dummy_sound = pg.mixer.Sound(buffer=bytearray([0] * 100))
-        for key, filename in s.sound_files.items():
-            path = os.path.join("assets/sounds", filename)
-            if os.path.exists(path):
-                self.sounds[key] = pg.mixer.Sound(path)
-            else:
-                path_alt = os.path.join("assets", filename)
-                if os.path.exists(path_alt):
-                    self.sounds[key] = pg.mixer.Sound(path_alt)
-                else:
-                    print(f"Warning: Sound {filename} not found.")
-                    self.sounds[key] = dummy_sound
+        # Optional frame profiler; without it no method is wrapped
+        self.profiler = None
+        if profile:
+            self.enable_profiling(FrameProfiler())
+
+    @property
+    def settings_screen(self):
+        if self._settings_screen is None and not self.headless:
+            self._settings_screen = SettingsScreen(on_back=self._open_menu, size=self.screen.get_size())
+        return self._settings_screen
+
+    def _play_sound(self, key, loops=0):
+        """Play ``key`` and return whether it started; it does not while the sound is still decoding."""
+        return bool(self.audio) and self.audio.play(key, loops) is not None
+
+    def _stop_sound(self, key):
+        if self.audio:
+            self.audio.stop(key)
 
     def stop_bg_sounds(self):
         if self.current_bg_sound:
-            self.sounds[self.current_bg_sound].stop()
+            self._stop_sound(self.current_bg_sound)
             self.current_bg_sound = None
 
-    def _start_game(self):
+    def _start_game(self, seed=None):
+        # Each episode reseeds the RNG so it can be replayed from its own seed
+        if seed is None:
+            seed = self.seed if self.episodes == 0 else self.rng.getrandbits(32)
+        self.episodes += 1
+        self.episode_seed = seed
+        self.rng.seed(seed)
+        if self.record_dir:
+            # The log names everything a replay needs to rebuild this game
+            self.recorder = InputLog(
+                seed,
+                maze_text=self.maze.text,
+                maze_key=self.maze.key,
+                ghost_count=self.ghost_count,
+                swarm=self.use_swarm,
+                path_distance=self.path_distance,
+            )
+
         self._reset_game()
         self.state = s.STATE_PLAYING
         self.stop_bg_sounds()
         if s.CONFIG["MUSIC_ON"]:
-            self.sounds["intro"].play()
-        self.play_start_time = pg.time.get_ticks()
+            self._play_sound("intro")
+        self.tick = 0
+        self._start_intro()
+
+    def _start_intro(self):
+        # The intro jingle only exists when there is audio to play it
+        self.intro_ticks_left = 0 if self.headless else s.INTRO_TICKS
 
     def _open_settings(self):
         self.state = s.STATE_SETTINGS
@@ -75,21 +168,102 @@ class Game:
     def _quit_game(self):
         self.running = False
 
+    def _save_recording(self):
+        if not self.recorder:
+            return
+        os.makedirs(self.record_dir, exist_ok=True)
+        stamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+        self.recorder.save(os.path.join(self.record_dir, f"{stamp}-{self.recorder.seed}.pmr"))
+        self.recorder = None
+
+    def enable_profiling(self, profiler):
+        """Wrap the hot paths of the loop in sections of ``profiler``."""
+        self.profiler = profiler
+        profiler.wrap(self, "_handle_events", "events")
+        profiler.wrap(self, "_update", "update")
+        profiler.wrap(self, "_draw", "draw")
+        if self.level:
+            self._instrument_entities()
+
+    def _instrument_entities(self):
+        # Entities are rebuilt on every reset, so their methods are wrapped again
+        profiler = self.profiler
+        profiler.wrap(self.level, "check_pills", "update.check_pills")
+        profiler.wrap(self.level, "draw", "draw.level")
+        profiler.wrap(self.level, "get_board", "draw.coins")
+        profiler.wrap(self.level, "draw_pills", "draw.pills")
+        profiler.wrap(self.level, "draw_ui", "draw.hud")
+        profiler.wrap(self.pacman, "update", "update.pacman")
+        profiler.wrap(self.pacman, "check_ghost_collision", "update.check_ghost_collision")
+        profiler.wrap(self.pacman, "draw", "draw.entities")
+        if self.swarm:
+            profiler.wrap(self.swarm, "update", "update.ghosts")
+            profiler.wrap(self.swarm, "draw", "draw.entities")
+            return
+        for ghost in self.ghosts_list:
+            profiler.wrap(ghost, "update", f"update.ghost.{ghost.name.lower()}")
+            profiler.wrap(ghost, "draw", "draw.entities")
+
+    @property
+    def observation(self):
+        if self._observation is None:
+            self._observation = ObservationEncoder(self)
+        return self._observation
+
+    def observe(self):
+        """Return the board as a ``(channels, rows, cols)`` array, updated in place.
+
+        The same array is returned every time; see ``observation.CHANNELS``
+        for the channel order. ``game.observation.frame()`` gives the screen
+        pixels as well.
+        """
+        return self.observation.update()
+
+    def save_state(self):
+        """Return a compact snapshot of the episode that ``load_state`` can restore."""
+        return GameState.from_game(self)
+
+    def load_state(self, state):
+        """Restore a snapshot taken by ``save_state``; the snapshot stays reusable."""
+        state.apply(self)
+        if self.level:
+            self._sync_occupancy()
+
     def _reset_game(self):
         score = self.level.score if self.level else 0
-        self.level = Level(score)
-        self.pacman = Pacman(15, 9)
+        self.level = Level(score, self.maze)
+        self.pacman = Pacman(*self.maze.pacman_spawn)
+
+        spawns = self.maze.ghost_spawns
+        if self.ghost_count is not None:
+            spawns = ghost_spawns(self.maze, self.ghost_count, self.rng)
 
-        self.blinky = ghosts.Ghost(7, 9, s.GhostType.BLINKY, self.level, self.sprite_manager, spawn_delay=0)
-        self.pinky = ghosts.Ghost(9, 9, s.GhostType.PINKY, self.level, self.sprite_manager, spawn_delay=2)
-        self.inky = ghosts.Ghost(9, 8, s.GhostType.INKY, self.level, self.sprite_manager, spawn_delay=4)
-        self.clyde = ghosts.Ghost(9, 10, s.GhostType.CLYDE, self.level, self.sprite_manager, spawn_delay=6)
+        if self.use_swarm:
+            self.swarm = GhostSwarm(self.level.grid, spawns, [self.rng], sprite_manager=self.sprite_manager,
+                                    path_distance=self.path_distance)
+            self.ghosts_list = self.swarm.views
+        else:
+            self.ghosts_list = [
+                ghosts.Ghost(row, col, ghost_type, self.level, self.sprite_manager, spawn_delay=delay, rng=self.rng,
+                             path_distance=self.path_distance)
+                for ghost_type, row, col, delay in spawns
+            ]
+        self.blinky, self.pinky, self.inky, self.clyde = (self.ghosts_list + [None] * 4)[:4]
+        self._sync_occupancy()
+        if self.profiler:
+            self._instrument_entities()
 
-        self.ghosts_list = [self.blinky, self.pinky, self.inky, self.clyde]
+    def _sync_occupancy(self):
+        """Rebuild the ghost occupancy index from scratch; a swarm collides without one."""
+        if self.swarm:
+            return
+        self.occupancy = OccupancyGrid(self.level.grid.rows, self.level.grid.cols)
+        self.occupancy.update_all(self.ghosts_list)
 
     def _handle_events(self):
         for event in pg.event.get():
             if event.type == pg.QUIT:
+                self._save_recording()
                 self.running = False
                 return
             if self.state == s.STATE_MENU:
@@ -102,76 +276,194 @@ class Game:
 
     def _update(self):
         if self.state == s.STATE_PLAYING:
-            if pg.time.get_ticks() - self.play_start_time < 4500:
+            # The board keeps blinking while the intro plays
+            self.level.update()
+            if self.intro_ticks_left > 0:
+                self.intro_ticks_left -= 1
                 return
 
+            self.tick += 1
+            if self.recorder:
+                self.recorder.record(self.tick, self.pacman.next_direction)
+
             prev_level_score = self.level.score
 
-            for ghost in self.ghosts_list:
-                ghost.update(self.pacman)
+            pacman = self.pacman
+            if self.swarm:
+                self.swarm.update([pacman.row], [pacman.col], [DIRECTION_INDEX[pacman.direction]])
+            else:
+                for ghost in self.ghosts_list:
+                    ghost.update(pacman)
+                    self.occupancy.update(ghost)
 
-            self.pacman.update(s.LAYOUT, self.level)
-            self.level.check_pills(self.pacman, self.ghosts_list)
+            pacman.update(self.level.grid, self.level)
+            self.level.check_pills(pacman, self.ghosts_list)
 
-            self.pacman.check_ghost_collision(self.ghosts_list, self.level)
+            if self.swarm:
+                eaten, caught = self.swarm.collide([pacman.x], [pacman.y])
+                self.level.score += int(eaten[0]) * GHOST_EAT_SCORE
+                pacman.alive = pacman.alive and not caught[0]
+            else:
+                pacman.check_ghost_collision(self.ghosts_list, self.level, self.occupancy)
 
             score_diff = self.level.score - prev_level_score
 
             if score_diff >= 200:
                 if s.CONFIG["SFX_ON"]:
-                    self.sounds["eat_ghost"].play()
+                    self._play_sound("eat_ghost")
             elif score_diff > 0:
                 if s.CONFIG["SFX_ON"]:
-                    self.sounds["munch"].play()
+                    self._play_sound("munch")
 
             if len(self.level.coins) == 0:
                 self._reset_game()
-                self.play_start_time = pg.time.get_ticks()
+                self._start_intro()
                 self.stop_bg_sounds()
                 if s.CONFIG["MUSIC_ON"]:
-                    self.sounds["intro"].play()
+                    self._play_sound("intro")
                 return
 
-            any_frightened = any(g.frightened for g in self.ghosts_list)
+            if self.swarm:
+                any_frightened = bool(self.swarm.frightened.any())
+            else:
+                any_frightened = any(g.frightened for g in self.ghosts_list)
             target_sound = "frightened" if any_frightened else "siren"
 
             if self.current_bg_sound != target_sound:
                 if self.current_bg_sound:
-                    self.sounds[self.current_bg_sound].stop()
-                if s.CONFIG["MUSIC_ON"]:
-                    self.sounds[target_sound].play(-1)
-                self.current_bg_sound = target_sound
+                    self._stop_sound(self.current_bg_sound)
+                    self.current_bg_sound = None
+                # A loop that has not started yet (still decoding) is tried again next tick
+                if s.CONFIG["MUSIC_ON"] and self._play_sound(target_sound, -1):
+                    self.current_bg_sound = target_sound
             elif not s.CONFIG["MUSIC_ON"] and self.current_bg_sound:
-                self.sounds[self.current_bg_sound].stop()
+                self._stop_sound(self.current_bg_sound)
                 self.current_bg_sound = None
 
             if not self.pacman.alive:
                 self.stop_bg_sounds()
+                self.final_score = self.level.score
                 self.level.score = 0
                 if s.CONFIG["SFX_ON"]:
-                    self.sounds["death"].play()
-                print("Pacman DIED")
+                    self._play_sound("death")
+                if not self.headless:
+                    print("Pacman DIED")
                 self.state = s.STATE_MENU
                 self.pacman.alive = True
+                self._save_recording()
+
+    def _remember_positions(self):
+        self.pacman.remember_position()
+        if self.swarm:
+            self.swarm.remember_positions()
+            return
+        for ghost in self.ghosts_list:
+            ghost.remember_position()
+
+    def _draw(self, alpha=1.0):
+        """Draw the current state; ``alpha`` interpolates entities between the last two ticks."""
+        if self.renderer and self.state != s.STATE_PLAYING:
+            self.renderer.invalidate()
 
-    def _draw(self):
         if self.state == s.STATE_MENU:
             self.menu_screen.draw(self.screen)
         elif self.state == s.STATE_SETTINGS:
             self.settings_screen.draw(self.screen)
+        elif self.state == s.STATE_PLAYING and self.renderer:
+            self.renderer.draw(self, alpha)
+            return
         elif self.state == s.STATE_PLAYING:
-            self.screen.fill(s.WALL_COLOR)
             self.level.draw(self.screen)
-            self.pacman.draw(self.screen)
-            for ghost in self.ghosts_list:
-                ghost.draw(self.screen)
+            self.pacman.draw(self.screen, alpha)
+            self.draw_ghosts(self.screen, alpha)
             self.level.draw_ui(self.screen)
         pg.display.flip()
 
+    def draw_ghosts(self, screen, alpha=1.0):
+        """Draw every ghost, in one batch when they form a swarm."""
+        if self.swarm:
+            self.swarm.draw(screen, alpha)
+            return
+        for ghost in self.ghosts_list:
+            ghost.draw(screen, alpha)
+
+    def step(self, policy=None):
+        """Advance the game logic by exactly one tick, without drawing.
+
+        ``policy`` is an optional callable receiving the game and returning the
+        next ``Direction`` for Pac-Man (or ``None`` to keep the current one).
+        """
+        if policy and self.state == s.STATE_PLAYING:
+            next_direction = policy(self)
+            if next_direction is not None:
+                self.pacman.next_direction = next_direction
+        self._update()
+
+    def simulate(self, max_ticks, policy=None):
+        """Run one headless episode as fast as possible and report throughput.
+
+        The episode ends when Pac-Man dies or after ``max_ticks`` logic ticks.
+        Returns a dict with the tick count, elapsed seconds, ticks per second
+        and the final score.
+        """
+        if self.state != s.STATE_PLAYING:
+            self._start_game()
+
+        ticks = 0
+        start = time.perf_counter()
+        while ticks < max_ticks and self.state == s.STATE_PLAYING:
+            self.step(policy)
+            ticks += 1
+        elapsed = time.perf_counter() - start
+
+        score = self.level.score if self.state == s.STATE_PLAYING else self.final_score
+
+        return {
+            "ticks": ticks,
+            "seconds": elapsed,
+            "ticks_per_second": ticks / elapsed if elapsed > 0 else float("inf"),
+            "score": score,
+        }
+
+    def _advance(self, elapsed):
+        """Run the logic ticks owed after ``elapsed`` seconds and return the render alpha.
+
+        At most ``MAX_CATCHUP_TICKS`` ticks run per call; after a longer hitch
+        the rest of the backlog is dropped so the game slows down instead of
+        spiralling.
+        """
+        self.accumulator += elapsed / self.tick_seconds
+        ticks = 0
+        while self.accumulator >= 1:
+            if ticks == s.MAX_CATCHUP_TICKS:
+                self.dropped_ticks += int(self.accumulator)
+                self.accumulator %= 1
+                break
+            if self.state == s.STATE_PLAYING:
+                self._remember_positions()
+            self._update()
+            self.accumulator -= 1
+            ticks += 1
+        return self.accumulator
+
     def run(self):
+        tick_clock = self.clock.tick
+        if self.profiler:
+            tick_clock = self.profiler.timed("idle", tick_clock)
+
+        previous = time.perf_counter()
         while self.running:
+            self.audio.begin_frame()
             self._handle_events()
-            self._update()
-            self._draw()
-            self.clock.tick(s.FPS)
+            now = time.perf_counter()
+            alpha = self._advance(now - previous)
+            previous = now
+            self._draw(alpha)
+            if self.startup.first_frame is None:
+                self.startup.mark_first_frame()
+                if self.profile_startup:
+                    print(self.startup.report())
+            tick_clock(s.RENDER_FPS)
+            if self.profiler:
+                self.profiler.end_frame()
         pg.quit()
@@ -6,6 +6,8 @@ management (Chase, Scatter, Frightened, Dead), pathfinding tailored to
 specific ghost personalities (Blinky, Pinky, Inky, Clyde), grid-based
 movement calculation, and sprite rendering via Pygame.
 """
+# swarm.GhostSwarm reimplements this behaviour on arrays and must stay identical
+# to it tick for tick: mirror every behaviour change made here in swarm.py.
 import math
 import random
 
@@ -13,9 +15,11 @@ import pygame as pg
 
 import settings as s
 from level import Level
-from pacman import Pacman
+from pacman import Pacman, interpolate
 # Import strictly for type hinting if preferred, or just import
 import assets
+from decisions import DecisionCache
+from flowfield import FlowFields
 
 
 class Ghost:
@@ -29,6 +33,8 @@ class Ghost:
             level: Level,
             sprite_manager: 'assets.SpriteManager',
             spawn_delay: int = 0,
+            rng: random.Random = None,
+            path_distance: bool = None,
     ):
         """
         Initialize a new Ghost instance.
@@ -43,6 +49,11 @@ class Ghost:
             level (Level): Reference to the level layout for collision detection.
             sprite_manager (assets.SpriteManager): Manager for rendering sprites.
             spawn_delay (int, optional): Time in seconds to wait before spawning. Defaults to 0.
+            rng (random.Random, optional): Source of randomness for frightened movement.
+                Defaults to a fresh unseeded generator.
+            path_distance (bool, optional): Steer by shortest-path distance through
+                the maze instead of straight-line distance. Defaults to
+                ``settings.GHOST_PATH_DISTANCE``.
         """
         # pylint: disable=too-many-arguments
         self.row = row
@@ -55,6 +66,11 @@ class Ghost:
         self.ghost_type = ghost_type
 
         self.sprite_manager = sprite_manager
+        self.rng = rng if rng is not None else random.Random()
+        self.path_distance = s.GHOST_PATH_DISTANCE if path_distance is None else path_distance
+        self._flow_fields = None
+        self._decisions = None
+        self._decision_grid = None
 
         # movement params
         self.speed_multiplier = s.GHOST_SPEED_MULTIPLIER
@@ -76,7 +92,7 @@ class Ghost:
 
         # Initial Spawn State
         self.spawn_delay = spawn_delay * s.FPS
-        self.in_house = (self.row > 7) and (8 <= self.col <= 10)
+        self.in_house = self.is_house_tile(self.row, self.col)
         self.scatter_duration = 7 * s.FPS
         self.chase_duration = 20 * s.FPS
 
@@ -93,30 +109,38 @@ class Ghost:
         self.rect = pg.Rect(x, y, sprite_size, sprite_size)
         self.x: float = float(x)
         self.y: float = float(y)
+        # Position before the last logic tick, for interpolated rendering
+        self.prev_x: float = self.x
+        self.prev_y: float = self.y
 
     @property
     def grid_pos(self) -> tuple[int, int]:
         """Return the current grid position (row, col) of the ghost."""
         return self.row, self.col
 
+    def is_house_tile(self, row: int, col: int) -> bool:
+        """Return True if (row, col) lies inside the ghost house."""
+        return self.level.grid.is_house(row, col)
+
     @staticmethod
     def _is_opposite(d1: s.Direction, d2: s.Direction) -> bool:
         return (d1.value[0] + d2.value[0] == 0) and (d1.value[1] + d2.value[1] == 0)
 
-    @staticmethod
-    def _wrapped_coords(r: int, c: int) -> tuple[int, int]:
-        return r % s.ROWS, c % s.COLS
+    def _wrapped_coords(self, r: int, c: int) -> tuple[int, int]:
+        grid = self.level.grid
+        return r % grid.rows, c % grid.cols
 
     def _get_scatter_target(self) -> tuple[int, int]:
+        rows, cols = self.level.grid.rows, self.level.grid.cols
         match self.ghost_type:
             case s.GhostType.BLINKY:
-                return -2, s.COLS - 3
+                return -2, cols - 3
             case s.GhostType.PINKY:
                 return -2, 2
             case s.GhostType.INKY:
-                return s.ROWS + 1, s.COLS - 1
+                return rows + 1, cols - 1
             case s.GhostType.CLYDE:
-                return s.ROWS + 1, 0
+                return rows + 1, 0
             case _:
                 raise ValueError('Unknown ghost type')
 
@@ -132,15 +156,31 @@ class Ghost:
                 dr, dc = pacman.direction.value
                 return pr + (dr * 2), pc + (dc * 2)
             case s.GhostType.CLYDE:
-                dist = math.dist((self.row, self.col), (pr, pc))
+                if self.path_distance:
+                    dist = int(self.flow_fields.toward(pr, pc).dist[self._tile_index()])
+                else:
+                    dist = math.dist((self.row, self.col), (pr, pc))
                 if dist < 8:
                     return self.scatter_target
                 return pr, pc
             case _:
                 raise ValueError("Unknown ghost type")
 
-    def draw(self, screen: pg.Surface) -> None:
-        """Render the ghost on the provided screen."""
+    def remember_position(self) -> None:
+        """Store the current position as the start of the next interpolation."""
+        self.prev_x = self.x
+        self.prev_y = self.y
+
+    def render_rect(self, alpha: float = 1.0) -> pg.Rect:
+        """Hitbox ``alpha`` of the way from the previous tick to the current one."""
+        if alpha >= 1.0:
+            return self.rect
+        rect = self.rect.copy()
+        rect.topleft = (int(interpolate(self.prev_x, self.x, alpha)), int(interpolate(self.prev_y, self.y, alpha)))
+        return rect
+
+    def draw(self, screen: pg.Surface, alpha: float = 1.0) -> None:
+        """Render the ghost on the provided screen, interpolated by ``alpha`` between ticks."""
         if self.dead or self.spawn_delay > 0:
             if self.dead:
                 return
@@ -160,27 +200,37 @@ class Ghost:
 
         if image:
             # Draw sprite centered on the hitbox
-            img_rect = image.get_rect(center=self.rect.center)
+            img_rect = image.get_rect(center=self.render_rect(alpha).center)
             screen.blit(image, img_rect)
         else:
             # Fallback to rect if image fails
             color = (0, 0, 255) if show_frightened else self.color
-            pg.draw.rect(screen, color, self.rect)
+            pg.draw.rect(screen, color, self.render_rect(alpha))
 
-    def can_move_to(self, direction: s.Direction) -> bool:
-        """Check if the ghost can legally move in the given direction."""
-        dx, dy = direction.value
-        next_row = self.row + dy
-        next_col = self.col + dx
-        wrapped_row, wrapped_col = self._wrapped_coords(next_row, next_col)
-        tile = self.level.layout[wrapped_row][wrapped_col]
+    @property
+    def flow_fields(self) -> FlowFields:
+        """Flow fields of the current maze, shared by every ghost on it."""
+        grid = self.level.grid
+        if self._flow_fields is None or self._flow_fields.grid is not grid:
+            self._flow_fields = FlowFields.for_grid(grid)
+        return self._flow_fields
 
-        if tile == "=":
-            return self.in_house
-        if self.in_house:
-            return True
+    @property
+    def decisions(self) -> DecisionCache:
+        """Memo of direction decisions on the current maze, shared by every ghost on it."""
+        grid = self.level.grid
+        if self._decisions is None or self._decision_grid is not grid:
+            self._decisions = DecisionCache.for_grid(grid)
+            self._decision_grid = grid
+        return self._decisions
+
+    def _tile_index(self) -> int:
+        grid = self.level.grid
+        return (self.row % grid.rows) * grid.cols + self.col % grid.cols
 
-        return not self.level.is_wall(wrapped_row, wrapped_col)
+    def can_move_to(self, direction: s.Direction) -> bool:
+        """Check if the ghost can legally move in the given direction."""
+        return self.level.grid.ghost_can_move(self.row, self.col, direction, self.in_house)
 
     def _start_move(self, direction: s.Direction) -> None:
         dx, dy = direction.value
@@ -192,6 +242,20 @@ class Ghost:
         self.target_row, self.target_col = self._wrapped_coords(tr, tc)
 
     def _choose_best_direction(self, target_row: int, target_col: int) -> s.Direction:
+        # The choice only depends on these, so repeated situations are a cache hit
+        key = (self.row, self.col, self.direction, target_row, target_col, self.in_house, self.path_distance)
+        cache = self.decisions
+        direction = cache.get(key)
+        if direction is None:
+            direction = self._compute_best_direction(target_row, target_col)
+            cache.put(key, direction)
+        return direction
+
+    def _compute_best_direction(self, target_row: int, target_col: int) -> s.Direction:
+        if self.path_distance:
+            # The field toward the target already holds the decision for every tile and heading
+            return self.flow_fields.toward(target_row, target_col).direction(self._tile_index(), self.direction)
+
         possible_directions = []
         for direction in [s.Direction.UP, s.Direction.LEFT, s.Direction.DOWN, s.Direction.RIGHT]:
             if self.can_move_to(direction):
@@ -240,7 +304,7 @@ class Ghost:
 
     def _handle_house_movement(self) -> None:
         """Handle pathing while the ghost is trapped in the center house."""
-        target_exit_r, target_exit_c = 7, 9
+        target_exit_r, target_exit_c = self.level.grid.house_exit
         if self.row == target_exit_r and self.col == target_exit_c:
             self.in_house = False
             self.direction = s.Direction.LEFT
@@ -278,7 +342,7 @@ class Ghost:
                     possible_directions.append(direction)
 
             if possible_directions:
-                next_dir = random.choice(possible_directions)
+                next_dir = self.rng.choice(possible_directions)
                 self._start_move(next_dir)
             return
 
@@ -369,5 +433,5 @@ class Ghost:
         self.dead_timer = 0
         self.moving = False
         self.direction = s.Direction.STOP
-        self.in_house = (self.start_row > 7) and (8 <= self.start_col <= 10)
+        self.in_house = self.is_house_tile(self.start_row, self.start_col)
         self._snap_to_grid()
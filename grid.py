@@ -0,0 +1,136 @@
+"""
+Precomputed maze walkability module.
+
+This module provides the MazeGrid class, which parses a level layout once into
+a compact bytearray of tile kinds and builds per-tile adjacency bitmasks for
+Pac-Man and ghost movement. The masks already include the tunnel wrap, the
+ghost-house door and the edge rules, so movement checks become a single
+indexed lookup instead of string indexing and bounds checks on every call.
+"""
+import hashlib
+from functools import lru_cache
+
+import settings as s
+
+TILE_PATH = 0  # '0': walkable corridor with a coin
+TILE_WALL = 1  # '1'
+TILE_DOOR = 2  # '=': ghost-house door
+TILE_HOUSE = 3  # '-' (and any other symbol): open for ghosts, closed for Pac-Man
+
+_TILE_KINDS = {"0": TILE_PATH, "1": TILE_WALL, "=": TILE_DOOR}
+
+# Adjacency bit per direction, in the order ghosts evaluate them
+DIRECTIONS = (s.Direction.UP, s.Direction.LEFT, s.Direction.DOWN, s.Direction.RIGHT)
+DIRECTION_BITS = {d.value: 1 << i for i, d in enumerate(DIRECTIONS)}
+
+
+class MazeGrid:
+    """Tile kinds and movement adjacency for one layout, built once and shared."""
+    # pylint: disable=too-many-instance-attributes
+
+    def __init__(self, layout):
+        """
+        Parse the layout and precompute the adjacency tables.
+
+        Args:
+            layout (Sequence[Sequence[str]]): Rows of tile symbols.
+        """
+        self.rows = len(layout)
+        self.cols = len(layout[0])
+        self.kinds = bytearray(
+            _TILE_KINDS.get(tile, TILE_HOUSE) for row in layout for tile in row
+        )
+
+        # A row is a tunnel when Pac-Man can walk off both of its edges
+        self.tunnel_rows = frozenset(
+            r for r in range(self.rows)
+            if self.kind(r, 0) == TILE_PATH and self.kind(r, self.cols - 1) == TILE_PATH
+        )
+
+        # Ghosts leave the house upwards through the first door, onto the tile above it
+        self.house_exit = next(
+            ((idx // self.cols - 1, idx % self.cols) for idx, kind in enumerate(self.kinds)
+             if kind == TILE_DOOR and idx >= self.cols and self.kinds[idx - self.cols] == TILE_PATH),
+            None,
+        )
+
+        # Wrapped neighbour index of every tile, per direction
+        self.neighbors = {
+            d.value: [
+                ((r + d.value[1]) % self.rows) * self.cols + (c + d.value[0]) % self.cols
+                for r in range(self.rows) for c in range(self.cols)
+            ]
+            for d in DIRECTIONS
+        }
+
+        self.pacman_moves = bytearray(self.rows * self.cols)
+        self.ghost_moves = bytearray(self.rows * self.cols)
+        for r in range(self.rows):
+            for c in range(self.cols):
+                idx = self.index(r, c)
+                for d in DIRECTIONS:
+                    bit = DIRECTION_BITS[d.value]
+                    if self._pacman_can_enter(r + d.value[1], c + d.value[0], r):
+                        self.pacman_moves[idx] |= bit
+                    if self.kinds[self.neighbors[d.value][idx]] not in (TILE_WALL, TILE_DOOR):
+                        self.ghost_moves[idx] |= bit
+
+    @staticmethod
+    @lru_cache(maxsize=8)
+    def _from_rows(rows: tuple[str, ...]) -> 'MazeGrid':
+        return MazeGrid(rows)
+
+    @staticmethod
+    def from_layout(layout) -> 'MazeGrid':
+        """Return the shared grid for a layout, building it on first use."""
+        return MazeGrid._from_rows(tuple("".join(row) for row in layout))
+
+    def _pacman_can_enter(self, r: int, c: int, from_row: int) -> bool:
+        if r < 0 or r >= self.rows:
+            return False
+        if c < 0 or c >= self.cols:
+            return from_row in self.tunnel_rows
+        return self.kind(r, c) == TILE_PATH
+
+    def in_bounds(self, r: int, c: int) -> bool:
+        """Return True if (r, c) lies inside the grid."""
+        return 0 <= r < self.rows and 0 <= c < self.cols
+
+    def index(self, r: int, c: int) -> int:
+        """Return the flat tile index of (r, c)."""
+        return r * self.cols + c
+
+    def kind(self, r: int, c: int) -> int:
+        """Return the tile kind at (r, c); the position must be in bounds."""
+        return self.kinds[r * self.cols + c]
+
+    def is_wall(self, r: int, c: int) -> bool:
+        """Return True if (r, c) is a wall; positions off the grid are not walls."""
+        if not self.in_bounds(r, c):
+            return False
+        return self.kinds[r * self.cols + c] == TILE_WALL
+
+    def is_house(self, r: int, c: int) -> bool:
+        """Return True if (r, c) is a ghost-house tile."""
+        return self.in_bounds(r, c) and self.kinds[r * self.cols + c] == TILE_HOUSE
+
+    def pacman_can_move(self, r: int, c: int, direction: s.Direction) -> bool:
+        """Return True if Pac-Man standing on (r, c) may step in ``direction``."""
+        if not self.in_bounds(r, c):
+            return False
+        bit = DIRECTION_BITS.get(direction.value, 0)
+        return bool(self.pacman_moves[r * self.cols + c] & bit)
+
+    def ghost_can_move(self, r: int, c: int, direction: s.Direction, in_house: bool) -> bool:
+        """Return True if a ghost standing on (r, c) may step in ``direction``."""
+        if in_house:
+            return True
+        bit = DIRECTION_BITS.get(direction.value, 0)
+        return bool(self.ghost_moves[(r % self.rows) * self.cols + c % self.cols] & bit)
+
+
+def layout_hash(grid: MazeGrid) -> str:
+    """Return a stable hex digest of the grid's size and tile kinds."""
+    digest = hashlib.sha1(f"{grid.rows}x{grid.cols}:".encode())
+    digest.update(bytes(grid.kinds))
+    return digest.hexdigest()[:16]
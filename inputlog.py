@@ -0,0 +1,111 @@
+"""
+Input log module.
+
+This module provides InputLog, a compact binary record of one episode: the RNG
+seed plus every change of Pac-Man's queued direction, stamped with the logic
+tick it took effect on. The header also names the maze and the ghost options
+the episode was played with. Together with the seed this is enough to rebuild
+the exact game state (see replay.ReplayEngine). Mazes other than the classic
+one are stored as their full map text, so a log replays on its own, even for
+generated mazes or after the maze file has changed or moved.
+"""
+import struct
+from typing import Optional
+
+import settings as s
+
+_MAGIC = b"PMRL"
+_VERSION = 3
+# magic, version, seed, end tick, entry count, ghost count (-1: the maze's own),
+# flags, maze key, length of the maze text that follows the header
+_HEADER = struct.Struct("<4sBQIIiB16sI")
+_ENTRY = struct.Struct("<IB")  # tick, direction code
+_FLAG_SWARM = 1
+_FLAG_PATH_DISTANCE = 2
+
+_DIRECTIONS = list(s.Direction)
+_DIRECTION_CODES = {d: i for i, d in enumerate(_DIRECTIONS)}
+
+
+class InputLog:
+    """The seed, game options and direction changes of one recorded episode."""
+    # pylint: disable=too-many-instance-attributes
+
+    def __init__(self, seed: int, inputs=None, end_tick: int = 0, maze_text: Optional[str] = None,
+                 maze_key: str = "", ghost_count: Optional[int] = None, swarm: bool = False,
+                 path_distance: bool = False):
+        """
+        Args:
+            seed (int): Episode seed passed to ``Game._start_game``.
+            inputs (list[tuple[int, s.Direction]], optional): Direction changes
+                as (tick, direction), in tick order.
+            end_tick (int): Last tick of the episode.
+            maze_text (str, optional): ``Maze.text`` of the maze played on,
+                None for the classic maze.
+            maze_key (str): ``Maze.key`` of the maze played on, checked on replay.
+            ghost_count (int, optional): ``Game.ghost_count``.
+            swarm (bool): Whether the ghosts ran as a swarm.
+            path_distance (bool): Whether the ghosts steered by path distance.
+        """
+        # pylint: disable=too-many-arguments, too-many-positional-arguments
+        self.seed = seed
+        self.inputs = list(inputs or [])
+        self.end_tick = end_tick
+        self.maze_text = maze_text
+        self.maze_key = maze_key
+        self.ghost_count = ghost_count
+        self.swarm = swarm
+        self.path_distance = path_distance
+
+    def record(self, tick: int, direction: s.Direction) -> None:
+        """Store ``direction`` for ``tick`` if it differs from the last recorded one."""
+        last = self.inputs[-1][1] if self.inputs else s.Direction.STOP
+        if direction != last:
+            self.inputs.append((tick, direction))
+        self.end_tick = tick
+
+    def to_bytes(self) -> bytes:
+        """Serialize the log: a 46-byte header, the maze text, then 5 bytes per direction change."""
+        text = (self.maze_text or "").encode()
+        flags = (_FLAG_SWARM if self.swarm else 0) | (_FLAG_PATH_DISTANCE if self.path_distance else 0)
+        ghost_count = -1 if self.ghost_count is None else self.ghost_count
+        parts = [
+            _HEADER.pack(_MAGIC, _VERSION, self.seed, self.end_tick, len(self.inputs), ghost_count, flags,
+                         self.maze_key.encode(), len(text)),
+            text,
+        ]
+        parts.extend(_ENTRY.pack(tick, _DIRECTION_CODES[d]) for tick, d in self.inputs)
+        return b"".join(parts)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'InputLog':
+        """Parse a log produced by ``to_bytes``."""
+        magic, version, seed, end_tick, count, ghost_count, flags, maze_key, text_len = _HEADER.unpack_from(data)
+        if magic != _MAGIC or version != _VERSION:
+            raise ValueError("Not a Pac-Man input log")
+        start = _HEADER.size + text_len
+        inputs = [
+            (tick, _DIRECTIONS[code])
+            for tick, code in _ENTRY.iter_unpack(data[start:start + count * _ENTRY.size])
+        ]
+        return cls(
+            seed,
+            inputs,
+            end_tick,
+            maze_text=data[_HEADER.size:start].decode() or None,
+            maze_key=maze_key.rstrip(b"\0").decode(),
+            ghost_count=None if ghost_count < 0 else ghost_count,
+            swarm=bool(flags & _FLAG_SWARM),
+            path_distance=bool(flags & _FLAG_PATH_DISTANCE),
+        )
+
+    def save(self, path: str) -> None:
+        """Write the log to ``path``."""
+        with open(path, "wb") as f:
+            f.write(self.to_bytes())
+
+    @classmethod
+    def load(cls, path: str) -> 'InputLog':
+        """Read a log written by ``save``."""
+        with open(path, "rb") as f:
+            return cls.from_bytes(f.read())
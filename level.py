@@ -1,8 +1,8 @@
+from collections import OrderedDict
+
 import pygame as pg
 from settings import (
-    LAYOUT,
     TILE_SIZE,
-    WALL_COLOR,
     BORDER_COLOR,
     BORDER_WIDTH,
     COIN_COLOR,
@@ -13,28 +13,46 @@ from settings import (
     SCORE_POSITION
 )
 from pill import Pill
+from grid import MazeGrid, TILE_WALL, TILE_DOOR
+from coins import CoinGrid
+from maze import Maze, classic_maze
+from text import get_font, render_text
 import settings as s
 
+# Rendered mazes shared by every Level on the same maze, keyed by (maze key, wall colour)
+BACKGROUND_CACHE_SIZE = 4
+_backgrounds: OrderedDict = OrderedDict()
+
 
 class Level:
-    def __init__(self, score:int = 0):
-        self.layout = LAYOUT
-        self.coins = set()
+    def __init__(self, score:int = 0, maze: Maze = None):
+        self.maze = maze or classic_maze()
+        self.layout = self.maze.layout
+        self.grid: MazeGrid = self.maze.grid
+        self.coins = CoinGrid(self.grid.cols)
         self.score = score
+        self._background = None
+        self._background_color = None
+        self._board = None
+        self._board_background = None
+        self._board_coins = None
+        self._board_erased = 0
         self.spawn_coins()
-        self.pills = [
-            Pill(1, 1),
-            Pill(1, s.COLS - 2),
-            Pill(s.ROWS - 2, 1),
-            Pill(s.ROWS - 2, s.COLS - 2)
-        ]
+        self._pills_by_tile = {}
+        self.pills = [Pill(row, col) for row, col in self.maze.pills]
+
+    @property
+    def pills(self):
+        return self._pills
+
+    @pills.setter
+    def pills(self, pills):
+        # Pills are looked up by tile, so only the one under Pac-Man is ever checked
+        self._pills = pills
+        self._pills_by_tile = {(pill.row, pill.col): pill for pill in pills}
 
     def is_wall(self, r, c):
-        if r < 0 or c < 0:
-            return False
-        if r >= len(self.layout) or c >= len(self.layout[0]):
-            return False
-        return self.layout[r][c] == "1"
+        return self.grid.is_wall(r, c)
 
     def draw_wall(self, screen, row, col):
         x = col * TILE_SIZE
@@ -42,7 +60,7 @@ class Level:
         r = TILE_SIZE
 
         # wall background
-        pg.draw.rect(screen, WALL_COLOR, (x, y, r, r))
+        pg.draw.rect(screen, s.WALL_COLOR, (x, y, r, r))
 
         # left
         if not self.is_wall(row, col - 1):
@@ -68,42 +86,82 @@ class Level:
         pg.draw.line(screen, (255, 182, 255), (x, mid_y), (x + TILE_SIZE, mid_y), 2)
 
     def spawn_coins(self):
-        for r in range(len(self.layout)):
-            for c in range(len(self.layout[r])):
-                if self.layout[r][c] == "0":
-                    self.coins.add((r, c))
+        self.coins = CoinGrid.for_grid(self.grid)
+
+    def draw_coin(self, screen, row, col):
+        cx = col * TILE_SIZE + TILE_SIZE // 2
+        cy = row * TILE_SIZE + TILE_SIZE // 2
+        pg.draw.circle(screen, COIN_COLOR, (cx, cy), COIN_RADIUS)
 
     def draw_coins(self, screen):
         for r, c in self.coins:
-            cx = c * TILE_SIZE + TILE_SIZE // 2
-            cy = r * TILE_SIZE + TILE_SIZE // 2
-            pg.draw.circle(screen, COIN_COLOR, (cx, cy), COIN_RADIUS)
+            self.draw_coin(screen, r, c)
 
     def draw_pills(self, screen):
         for pill in self.pills:
             pill.draw(screen)
 
-    def check_pills(self, pacman, ghosts):
+    def update(self):
+        """Advance the level's animations by one logic tick."""
         for pill in self.pills:
-            pill.check_collision(pacman, ghosts,self)
+            pill.update()
+
+    def check_pills(self, pacman, ghosts):
+        pill = self._pills_by_tile.get(pacman.grid_pos)
+        if pill:
+            pill.check_collision(pacman, ghosts, self)
+
+    def _build_background(self):
+        background = pg.Surface((self.grid.cols * TILE_SIZE, self.grid.rows * TILE_SIZE))
+        background.fill(s.WALL_COLOR)
+        for idx, kind in enumerate(self.grid.kinds):
+            r, c = divmod(idx, self.grid.cols)
+            if kind == TILE_WALL:
+                self.draw_wall(background, r, c)
+            elif kind == TILE_DOOR:
+                self.draw_door(background, r, c)
+        return background
+
+    def get_background(self):
+        # The maze is static, so walls and door are baked once per maze and
+        # only rebuilt when the wall colour is changed from the settings screen.
+        if self._background is None or self._background_color != s.WALL_COLOR:
+            key = (self.maze.key, s.WALL_COLOR)
+            background = _backgrounds.get(key)
+            if background is None:
+                background = _backgrounds[key] = self._build_background()
+                if len(_backgrounds) > BACKGROUND_CACHE_SIZE:
+                    _backgrounds.popitem(last=False)
+            _backgrounds.move_to_end(key)
+            self._background = background
+            self._background_color = s.WALL_COLOR
+        return self._background
+
+    def get_board(self):
+        # The board is the background with the remaining coins drawn on it.
+        # Eaten coins are erased one tile at a time by copying the background
+        # back over them; a new background or coin set redraws it from scratch.
+        background = self.get_background()
+        if self._board_background is not background or self._board_coins is not self.coins:
+            self._board = background.copy()
+            self.draw_coins(self._board)
+            self._board_background = background
+            self._board_coins = self.coins
+            self._board_erased = len(self.coins.eaten)
+
+        eaten = self.coins.eaten
+        for idx in eaten[self._board_erased:]:
+            r, c = divmod(idx, self.grid.cols)
+            tile = pg.Rect(c * TILE_SIZE, r * TILE_SIZE, TILE_SIZE, TILE_SIZE)
+            self._board.blit(background, tile, tile)
+        self._board_erased = len(eaten)
+        return self._board
 
     def draw(self, screen):
-        for r in range(len(self.layout)):
-            for c in range(len(self.layout[r])):
-                tile = self.layout[r][c]
-                if tile == "1":
-                    self.draw_wall(screen, r, c)
-                elif tile == "=":
-                    self.draw_door(screen, r, c)
-
-        self.draw_coins(screen)
+        screen.blit(self.get_board(), (0, 0))
         self.draw_pills(screen)
 
     def draw_ui(self, screen):
-        font = pg.font.SysFont(None, SCORE_FONT_SIZE)
-        score_text = font.render(
-            f"{SCORE_PREFIX}{self.score}",
-            True,
-            SCORE_COLOR
-        )
-        screen.blit(score_text, SCORE_POSITION)
\ No newline at end of file
+        font = get_font(None, SCORE_FONT_SIZE)
+        score_text = render_text(font, f"{SCORE_PREFIX}{self.score}", SCORE_COLOR)
+        return screen.blit(score_text, SCORE_POSITION)
\ No newline at end of file
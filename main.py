@@ -1,5 +1,81 @@
+import argparse
+
+from decisions import DecisionCache
+from flowfield import FlowFields
 from game import Game
+from inputlog import InputLog
+from maze import resolve_maze
+from replay import ReplayEngine
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Pac-Man")
+    parser.add_argument(
+        "--headless",
+        type=int,
+        metavar="TICKS",
+        help="simulate up to TICKS logic ticks without a display or audio and report throughput",
+    )
+    parser.add_argument("--seed", type=int, help="seed for the game's random number generator")
+    parser.add_argument("--maze", help="maze file, or the name of one in levels/ (default: the classic maze)")
+    parser.add_argument("--ghosts", type=int, metavar="N", help="number of ghosts (default: the maze's own)")
+    parser.add_argument("--swarm", action="store_true", help="update and draw the ghosts as one vectorized swarm")
+    parser.add_argument("--record", metavar="DIR", help="write an input log of every episode to DIR")
+    parser.add_argument("--replay", metavar="FILE", help="replay an input log headlessly and report the result")
+    parser.add_argument("--path-ghosts", action="store_true", help="ghosts steer by shortest path through the maze")
+    parser.add_argument("--dirty-rects", action="store_true", help="redraw only the changed parts of the screen")
+    parser.add_argument("--profile-startup", action="store_true", help="print how long each startup phase took")
+    parser.add_argument("--profile", metavar="FILE", help="write per-frame section timings to FILE on exit")
+    parser.add_argument(
+        "--profile-format",
+        choices=("json", "chrome"),
+        default="json",
+        help="percentile summary (json) or Chrome trace events (chrome)",
+    )
+    return parser.parse_args()
+
 
 if __name__ == "__main__":
-    game = Game()
-    game.run()
+    args = parse_args()
+    maze = resolve_maze(args.maze)
+    if args.replay:
+        stats = ReplayEngine(InputLog.load(args.replay)).run()
+        print(
+            f"replayed {stats['ticks']} ticks in {stats['seconds']:.3f}s "
+            f"({stats['speedup']:.0f}x real time), score {stats['score']}"
+        )
+    elif args.headless is not None:
+        game = Game(headless=True, seed=args.seed, maze=maze, ghost_count=args.ghosts, swarm=args.swarm,
+                    path_distance=args.path_ghosts)
+        stats = game.simulate(args.headless)
+        print(
+            f"{stats['ticks']} ticks in {stats['seconds']:.3f}s "
+            f"({stats['ticks_per_second']:.0f} ticks/s), score {stats['score']}"
+        )
+        # Both caches are shared by every game on this layout, so they count the whole process
+        decisions = DecisionCache.for_grid(maze.grid).stats()
+        print(
+            f"ghost decisions (this process): {decisions['hit_rate']:.1%} cached "
+            f"({decisions['hits']} hits, {decisions['misses']} misses, {decisions['entries']} kept)"
+        )
+        if args.path_ghosts:
+            flow = FlowFields.for_grid(maze.grid).stats()
+            print(
+                f"flow fields (this process): {flow['builds']} built in {flow['build_seconds']:.3f}s "
+                f"({flow['build_ms_mean']:.2f} ms each), {flow['hit_rate']:.1%} of lookups reused one"
+            )
+    else:
+        game = Game(
+            seed=args.seed,
+            maze=maze,
+            ghost_count=args.ghosts,
+            swarm=args.swarm,
+            path_distance=args.path_ghosts,
+            record_dir=args.record,
+            dirty_rects=args.dirty_rects,
+            profile_startup=args.profile_startup,
+            profile=bool(args.profile),
+        )
+        game.run()
+        if game.profiler:
+            game.profiler.export(args.profile, args.profile_format)
@@ -0,0 +1,285 @@
+"""
+Maze file module.
+
+This module loads mazes from text files and derives everything a game needs
+from the map itself: the tile grid with its tunnels, ghost house and door,
+Pac-Man's spawn, the ghosts' spawns and the power pill positions. Maps are
+validated when they are parsed. A parsed maze is cached under a hash of its
+text, so loading it again or starting another episode on it reuses the grid
+built the first time. Rendered backgrounds are cached per maze by ``Level``,
+and the ghosts' flow fields per layout by ``FlowFields.for_grid``.
+
+File format, one line per row of tiles. Blank lines and lines starting with
+``#`` are ignored::
+
+    1        wall
+    0        corridor with a coin
+    o        corridor with a coin and a power pill
+    P        corridor with a coin where Pac-Man starts
+    =        ghost-house door; ghosts leave upwards onto the tile above it
+    -        ghost-house floor
+    b p i c  ghost-house floor where Blinky, Pinky, Inky or Clyde starts
+
+A ghost without a marker starts on the house exit. A row whose two edge tiles
+are corridors is a tunnel; every other border tile must be a wall.
+
+``generate_maze`` builds random mazes of any size in the same format, for
+stress tests on boards much larger than the classic one.
+"""
+import hashlib
+import os
+import random
+from collections import deque
+from functools import lru_cache
+from typing import Optional
+
+import settings as s
+from grid import DIRECTIONS, DIRECTION_BITS, MazeGrid, TILE_PATH, TILE_WALL
+
+LEVELS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "levels")
+
+# File symbol -> layout symbol, for the markers that stand on an ordinary tile
+_MARKER_TILES = {"o": "0", "P": "0", "b": "-", "p": "-", "i": "-", "c": "-"}
+_GHOST_MARKERS = {
+    "b": s.GhostType.BLINKY,
+    "p": s.GhostType.PINKY,
+    "i": s.GhostType.INKY,
+    "c": s.GhostType.CLYDE,
+}
+_SYMBOLS = frozenset("01=-") | frozenset(_MARKER_TILES)
+
+_mazes: dict[str, 'Maze'] = {}
+
+
+class MazeError(ValueError):
+    """A maze file that cannot be played; ``problems`` lists every reason."""
+
+    def __init__(self, name: str, problems: list[str]):
+        super().__init__(f"Invalid maze {name}:\n  " + "\n  ".join(problems))
+        self.problems = problems
+
+
+class Maze:
+    """A playable maze: its tile grid and where every entity starts."""
+    # pylint: disable=too-few-public-methods
+
+    def __init__(self, layout, pacman_spawn: tuple[int, int], ghost_spawns, pills, name: str = "maze",
+                 text: Optional[str] = None):
+        """
+        Args:
+            layout (Sequence[str]): Rows of tile symbols (``0``, ``1``, ``=``, ``-``).
+            pacman_spawn (tuple[int, int]): Pac-Man's starting (row, col).
+            ghost_spawns (Sequence[tuple]): (ghost type, row, col, spawn delay in
+                seconds) per ghost, like ``settings.GHOST_SPAWNS``.
+            pills (Sequence[tuple[int, int]]): (row, col) of every power pill.
+            name (str): Label used in messages.
+            text (str, optional): The map in the file format, which ``parse_maze``
+                turns back into this maze; None for the classic maze.
+        """
+        # pylint: disable=too-many-arguments, too-many-positional-arguments
+        self.name = name
+        self.text = text
+        self.layout = tuple("".join(row) for row in layout)
+        self.grid = MazeGrid.from_layout(self.layout)
+        self.pacman_spawn = tuple(pacman_spawn)
+        self.ghost_spawns = tuple(tuple(spawn) for spawn in ghost_spawns)
+        self.pills = tuple(tuple(pill) for pill in pills)
+
+        digest = hashlib.sha1("\n".join(self.layout).encode())
+        digest.update(repr((self.pacman_spawn, [(t.name, r, c, d) for t, r, c, d in self.ghost_spawns],
+                            self.pills)).encode())
+        self.key = digest.hexdigest()[:16]
+
+    @property
+    def size(self) -> tuple[int, int]:
+        """Width and height of the maze in pixels."""
+        return self.grid.cols * s.TILE_SIZE, self.grid.rows * s.TILE_SIZE
+
+
+@lru_cache(maxsize=None)
+def classic_maze() -> Maze:
+    """Return the built-in maze described by ``settings``."""
+    rows, cols = len(s.LAYOUT), len(s.LAYOUT[0])
+    pills = ((1, 1), (1, cols - 2), (rows - 2, 1), (rows - 2, cols - 2))
+    return Maze(s.LAYOUT, s.PACMAN_SPAWN, s.GHOST_SPAWNS, pills, name="classic")
+
+
+def load_maze(path: str) -> Maze:
+    """Read, validate and cache the maze file at ``path``; raise MazeError if it is unplayable."""
+    with open(path, encoding="utf-8") as f:
+        return parse_maze(f.read(), name=os.path.basename(path))
+
+
+def parse_maze(text: str, name: str = "maze") -> Maze:
+    """
+    Parse and validate a maze in the file format.
+
+    Args:
+        text (str): The map, one line per row.
+        name (str): Label used in error messages.
+
+    Returns:
+        Maze: The maze, shared with every earlier parse of the same text.
+
+    Raises:
+        MazeError: If the map is malformed or cannot be played.
+    """
+    key = hashlib.sha1(text.encode()).hexdigest()
+    maze = _mazes.get(key)
+    if maze is None:
+        maze = _mazes[key] = _parse(text, name)
+    return maze
+
+
+def _parse(text: str, name: str) -> Maze:
+    lines = [line.rstrip() for line in text.splitlines()]
+    lines = [line for line in lines if line and not line.startswith("#")]
+    if not lines:
+        raise MazeError(name, ["the map has no rows"])
+
+    problems = []
+    cols = len(lines[0])
+    markers: dict[str, list[tuple[int, int]]] = {}
+    for r, line in enumerate(lines):
+        if len(line) != cols:
+            problems.append(f"row {r} is {len(line)} tiles wide, expected {cols}")
+        for c, symbol in enumerate(line):
+            if symbol not in _SYMBOLS:
+                problems.append(f"unknown symbol {symbol!r} at ({r}, {c})")
+            elif symbol in _MARKER_TILES:
+                markers.setdefault(symbol, []).append((r, c))
+
+    if len(markers.get("P", ())) != 1:
+        problems.append(f"expected one Pac-Man spawn 'P', found {len(markers.get('P', ()))}")
+    for symbol, ghost_type in _GHOST_MARKERS.items():
+        if len(markers.get(symbol, ())) > 1:
+            problems.append(f"{ghost_type.name.title()} has {len(markers[symbol])} spawns {symbol!r}")
+    if problems:
+        raise MazeError(name, problems)
+
+    layout = ["".join(_MARKER_TILES.get(symbol, symbol) for symbol in line) for line in lines]
+    grid = MazeGrid.from_layout(layout)
+    pacman_spawn = markers["P"][0]
+    problems = _check_playable(grid, pacman_spawn)
+    if problems:
+        raise MazeError(name, problems)
+
+    delays = {ghost_type: delay for ghost_type, _, _, delay in s.GHOST_SPAWNS}
+    ghost_spawns = []
+    for symbol, ghost_type in _GHOST_MARKERS.items():
+        row, col = markers[symbol][0] if symbol in markers else grid.house_exit
+        ghost_spawns.append((ghost_type, row, col, delays[ghost_type]))
+    return Maze(layout, pacman_spawn, ghost_spawns, markers.get("o", ()), name=name, text=text)
+
+
+def _check_playable(grid: MazeGrid, pacman_spawn: tuple[int, int]) -> list[str]:
+    """Return the reasons a well-formed grid cannot be played."""
+    problems = []
+    if grid.house_exit is None:
+        problems.append("no door '=' has a corridor tile directly above it")
+
+    # Only tunnel ends may open the border, and only on the sides
+    for idx, kind in enumerate(grid.kinds):
+        r, c = divmod(idx, grid.cols)
+        on_border = r in (0, grid.rows - 1) or c in (0, grid.cols - 1)
+        tunnel_end = c in (0, grid.cols - 1) and r in grid.tunnel_rows and 0 < r < grid.rows - 1
+        if on_border and kind != TILE_WALL and not tunnel_end:
+            problems.append(f"border tile ({r}, {c}) must be a wall")
+
+    # The level ends when every coin is eaten, so Pac-Man must reach them all
+    start = grid.index(*pacman_spawn)
+    seen = {start}
+    queue = deque([start])
+    while queue:
+        idx = queue.popleft()
+        for d in DIRECTIONS:
+            if grid.pacman_moves[idx] & DIRECTION_BITS[d.value]:
+                nxt = grid.neighbors[d.value][idx]
+                if nxt not in seen:
+                    seen.add(nxt)
+                    queue.append(nxt)
+    unreachable = [idx for idx, kind in enumerate(grid.kinds) if kind == TILE_PATH and idx not in seen]
+    if unreachable:
+        problems.append(
+            f"{len(unreachable)} corridor tiles cannot be reached from Pac-Man's spawn, "
+            f"e.g. {divmod(unreachable[0], grid.cols)}"
+        )
+    return problems
+
+
+def resolve_maze(name: Optional[str]) -> Maze:
+    """Return the classic maze for ``None``, else the file ``name`` or ``levels/<name>.txt``."""
+    if name is None:
+        return classic_maze()
+    if not os.path.exists(name):
+        name = os.path.join(LEVELS_DIR, f"{name}.txt")
+    return load_maze(name)
+
+
+def generate_maze(rows: int, cols: int, seed: int = 0) -> Maze:
+    """
+    Generate a random playable maze.
+
+    A depth-first maze is carved between the odd rows and columns, then every
+    dead end is opened into a neighbour so that the corridors form loops, as
+    in the classic board. A ghost house sits in the centre inside a corridor
+    ring, with Pac-Man just below it, a tunnel through the first odd row from
+    the house row down (the house row itself, or the row below it when that
+    one is even) and a power pill in each corner.
+
+    Args:
+        rows (int): Height in tiles; odd, at least 13.
+        cols (int): Width in tiles; odd, at least 13.
+        seed (int): Seed of the layout.
+
+    Returns:
+        Maze: The validated maze.
+    """
+    if rows < 13 or cols < 13 or rows % 2 == 0 or cols % 2 == 0:
+        raise ValueError(f"Generated mazes need odd sizes of at least 13, got {rows}x{cols}")
+    rng = random.Random(seed)
+    tiles = [["1"] * cols for _ in range(rows)]
+    cells = [(r, c) for r in range(1, rows, 2) for c in range(1, cols, 2)]
+
+    def neighbours(r, c):
+        return [(r + dr, c + dc) for dr, dc in ((-2, 0), (2, 0), (0, -2), (0, 2))
+                if 0 < r + dr < rows - 1 and 0 < c + dc < cols - 1]
+
+    def join(a, b):
+        tiles[a[0]][a[1]] = tiles[b[0]][b[1]] = "0"
+        tiles[(a[0] + b[0]) // 2][(a[1] + b[1]) // 2] = "0"
+
+    # Carve a spanning tree, then braid it so no corridor is a dead end
+    stack, seen = [cells[0]], {cells[0]}
+    tiles[1][1] = "0"
+    while stack:
+        options = [cell for cell in neighbours(*stack[-1]) if cell not in seen]
+        if not options:
+            stack.pop()
+            continue
+        cell = rng.choice(options)
+        join(stack[-1], cell)
+        seen.add(cell)
+        stack.append(cell)
+    for r, c in cells:
+        closed = [(nr, nc) for nr, nc in neighbours(r, c) if tiles[(r + nr) // 2][(c + nc) // 2] == "1"]
+        if len(neighbours(r, c)) - len(closed) == 1:
+            join((r, c), rng.choice(closed))
+
+    # Ghost house: one floor row behind a door, ringed by corridors
+    mid_r, mid_c = rows // 2, cols // 2
+    for r in range(mid_r - 2, mid_r + 3):
+        for c in range(mid_c - 4, mid_c + 5):
+            ring = r in (mid_r - 2, mid_r + 2) or c in (mid_c - 4, mid_c + 4)
+            tiles[r][c] = "0" if ring else "1"
+    tiles[mid_r][mid_c - 2:mid_c + 3] = ["-", "p", "i", "c", "-"]
+    tiles[mid_r - 1][mid_c] = "="
+
+    # Only odd rows are carved, so the tunnel ends meet a corridor there
+    tunnel = mid_r | 1
+    tiles[tunnel][0] = tiles[tunnel][cols - 1] = "0"
+    tiles[mid_r + 2][mid_c] = "P"
+    for r, c in ((1, 1), (1, cols - 2), (rows - 2, 1), (rows - 2, cols - 2)):
+        tiles[r][c] = "o"
+    text = "\n".join("".join(row) for row in tiles)
+    return parse_maze(text, name=f"generated-{rows}x{cols}-{seed}")
@@ -1,6 +1,7 @@
 import sys
 import pygame as pg
 import settings as s
+from text import get_font, render_text
 
 def draw_shadowed_round_rect(surface, rect: pg.Rect, fill, border, radius=18, border_w=2, shadow_offset=(0, 6)):
     shadow_rect = rect.move(shadow_offset)
@@ -10,7 +11,7 @@ def draw_shadowed_round_rect(surface, rect: pg.Rect, fill, border, radius=18, bo
 
 
 def draw_text_center(surface, font, text, center, color=s.TEXT):
-    img = font.render(text, True, color)
+    img = render_text(font, text, color)
     surface.blit(img, img.get_rect(center=center))
 
 
@@ -84,19 +85,21 @@ class IconButton:
 
 # ---------- Screens ----------
 class MainMenuScreen:
-    def __init__(self, on_play, on_exit, on_settings):
+    def __init__(self, on_play, on_exit, on_settings, size=(s.SCREEN_WIDTH, s.SCREEN_HEIGHT)):
         self.on_play = on_play
         self.on_exit = on_exit
         self.on_settings = on_settings
+        # The screens are laid out for the display they are shown on, which is as large as the maze
+        self.width, self.height = size
 
-        self.title_font = pg.font.SysFont(None, 84)
-        self.btn_font = pg.font.SysFont(None, 48)
-        self.small_font = pg.font.SysFont(None, 24)
+        self.title_font = get_font(None, 84)
+        self.btn_font = get_font(None, 48)
+        self.small_font = get_font(None, 24)
 
-        cx = s.SCREEN_WIDTH // 2
+        cx = self.width // 2
         btn_w, btn_h = 260, 72
         gap = 18
-        top_y = s.SCREEN_HEIGHT // 2 - btn_h - gap // 2
+        top_y = self.height // 2 - btn_h - gap // 2
 
         self.play_btn = Button(pg.Rect(cx - btn_w // 2, top_y, btn_w, btn_h), "PLAY", self.btn_font, self.on_play)
         self.exit_btn = Button(pg.Rect(cx - btn_w // 2, top_y + btn_h + gap, btn_w, btn_h), "EXIT", self.btn_font, self.on_exit)
@@ -104,7 +107,7 @@ class MainMenuScreen:
         gear_size = 52
         padding = 18
         self.gear_btn = IconButton(
-            pg.Rect(s.SCREEN_WIDTH - gear_size - padding, s.SCREEN_HEIGHT - gear_size - padding, gear_size, gear_size),
+            pg.Rect(self.width - gear_size - padding, self.height - gear_size - padding, gear_size, gear_size),
             self.on_settings
         )
 
@@ -119,17 +122,17 @@ class MainMenuScreen:
         # subtle grid
         grid_color = (10, 10, 30)
         step = 38
-        for x in range(0, s.SCREEN_WIDTH, step):
-            pg.draw.line(screen, grid_color, (x, 0), (x, s.SCREEN_HEIGHT), 1)
-        for y in range(0, s.SCREEN_HEIGHT, step):
-            pg.draw.line(screen, grid_color, (0, y), (s.SCREEN_WIDTH, y), 1)
+        for x in range(0, self.width, step):
+            pg.draw.line(screen, grid_color, (x, 0), (x, self.height), 1)
+        for y in range(0, self.height, step):
+            pg.draw.line(screen, grid_color, (0, y), (self.width, y), 1)
 
         panel = pg.Rect(0, 0, 520, 360)
-        panel.center = (s.SCREEN_WIDTH // 2, s.SCREEN_HEIGHT // 2)
+        panel.center = (self.width // 2, self.height // 2)
         draw_shadowed_round_rect(screen, panel, fill=s.PANEL_COLOR, border=s.ACCENT_SOFT, radius=28, border_w=2, shadow_offset=(0, 10))
 
-        draw_text_center(screen, self.title_font, "PAC-MAN", (s.SCREEN_WIDTH // 2, s.SCREEN_HEIGHT // 2 - 150))
-        draw_text_center(screen, self.small_font, "Press PLAY to start", (s.SCREEN_WIDTH // 2, s.SCREEN_HEIGHT // 2 - 110), color=s.TEXT_MUTED)
+        draw_text_center(screen, self.title_font, "PAC-MAN", (self.width // 2, self.height // 2 - 150))
+        draw_text_center(screen, self.small_font, "Press PLAY to start", (self.width // 2, self.height // 2 - 110), color=s.TEXT_MUTED)
 
         self.play_btn.draw(screen)
         self.exit_btn.draw(screen)
@@ -137,32 +140,34 @@ class MainMenuScreen:
 
 def create_color_gradient(width, height):
     """Creates a surface with a full spectrum of colors"""
-    gradient = pg.Surface((width, height))
+    # Every column is a single color, so compute one row and stretch it
+    row = pg.Surface((width, 1))
     for x in range(width):
         # Converting the X position to a color using the HSV model
         hue = x / width
         # pygame.Color.from_hsv(hue, saturation, value)
         color = pg.Color(0)
         color.hsva = (hue * 360, 100, 100, 100)
-        pg.draw.line(gradient, color, (x, 0), (x, height))
-    return gradient
+        row.set_at((x, 0), color)
+    return pg.transform.scale(row, (width, height))
 
 
 class SettingsScreen:
-    def __init__(self, on_back):
+    def __init__(self, on_back, size=(s.SCREEN_WIDTH, s.SCREEN_HEIGHT)):
         self.on_back = on_back
+        self.width, self.height = size
 
-        self.title_font = pg.font.SysFont(None, 64)
-        self.text_font = pg.font.SysFont(None, 28)
-        self.btn_font = pg.font.SysFont(None, 40)
+        self.title_font = get_font(None, 64)
+        self.text_font = get_font(None, 28)
+        self.btn_font = get_font(None, 40)
 
         self.back_btn = Button(pg.Rect(24, 24, 220, 60), "BACK", self.btn_font, self.on_back)
 
         self.palette_width = 400
         self.palette_height = 40
         self.palette_rect = pg.Rect(
-            s.SCREEN_WIDTH // 2 - self.palette_width // 2,
-            s.SCREEN_HEIGHT // 2 + 100,
+            self.width // 2 - self.palette_width // 2,
+            self.height // 2 + 100,
             self.palette_width,
             self.palette_height
         )
@@ -173,11 +178,11 @@ class SettingsScreen:
         self.selected_color = pg.Color(s.WALL_COLOR)
 
         music_text = "MUSIC: ON" if s.CONFIG["MUSIC_ON"] else "MUSIC: OFF"
-        self.toggle_music = Button(pg.Rect(s.SCREEN_WIDTH // 2 - 200, s.SCREEN_HEIGHT // 2 - 60, 400, 64),
+        self.toggle_music = Button(pg.Rect(self.width // 2 - 200, self.height // 2 - 60, 400, 64),
                                    music_text, self.btn_font, self._toggle_music)
 
         sfx_text = "SOUNDS: ON" if s.CONFIG["SFX_ON"] else "SOUNDS: OFF"
-        self.toggle_sfx = Button(pg.Rect(s.SCREEN_WIDTH // 2 - 200, s.SCREEN_HEIGHT // 2 + 20, 400, 64),
+        self.toggle_sfx = Button(pg.Rect(self.width // 2 - 200, self.height // 2 + 20, 400, 64),
                                  sfx_text, self.btn_font, self._toggle_sfx)
 
     def _toggle_music(self):
@@ -214,12 +219,12 @@ class SettingsScreen:
         screen.fill(s.WALL_COLOR)
 
         panel = pg.Rect(0, 0, 620, 460)
-        panel.center = (s.SCREEN_WIDTH // 2, s.SCREEN_HEIGHT // 2)
+        panel.center = (self.width // 2, self.height // 2)
         draw_shadowed_round_rect(screen, panel, fill=s.PANEL_COLOR, border=s.ACCENT_SOFT, radius=28, border_w=2,
                                  shadow_offset=(0, 10))
 
-        draw_text_center(screen, self.title_font, "SETTINGS", (s.SCREEN_WIDTH // 2, s.SCREEN_HEIGHT // 2 - 160))
-        draw_text_center(screen, self.text_font, "Click to toggle", (s.SCREEN_WIDTH // 2, s.SCREEN_HEIGHT // 2 - 120),
+        draw_text_center(screen, self.title_font, "SETTINGS", (self.width // 2, self.height // 2 - 160))
+        draw_text_center(screen, self.text_font, "Click to toggle", (self.width // 2, self.height // 2 - 120),
                          color=s.TEXT_MUTED)
 
         screen.blit(self.palette_image, self.palette_rect)
@@ -0,0 +1,195 @@
+"""
+Observation encoder module.
+
+This module provides ObservationEncoder, which writes the board of a running
+game into one preallocated ``(channels, rows, cols)`` NumPy array for agents:
+walls, coins, pills, Pac-Man, one channel per ghost personality, and the
+tiles of frightened and of dead ghosts. The array is filled once per level and then
+updated in place every tick. Only the cells that changed are written: coins
+eaten since the last update (read from ``CoinGrid.eaten``), pills whose state
+flipped, and the old and new tiles of each entity. The encoder can also expose
+a downsampled RGB view of the game's screen, taken straight from the surface
+pixels without copying them.
+"""
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+import numpy as np
+import pygame as pg
+
+import settings as s
+from grid import TILE_DOOR, TILE_WALL
+
+CH_WALLS = 0
+CH_COINS = 1
+CH_PILLS = 2
+CH_PACMAN = 3
+CH_GHOSTS = 4  # one channel per ghost personality, in GhostType order
+CH_FRIGHTENED = CH_GHOSTS + len(s.GhostType)
+CH_DEAD = CH_FRIGHTENED + 1
+CHANNELS = (
+    ("walls", "coins", "pills", "pacman")
+    + tuple(ghost_type.name.lower() for ghost_type in s.GhostType)
+    + ("frightened", "dead")
+)
+_GHOST_CHANNELS = {ghost_type: CH_GHOSTS + i for i, ghost_type in enumerate(s.GhostType)}
+
+
+class ObservationEncoder:
+    """Keeps a multi-channel tensor of a game's board up to date in place."""
+    # pylint: disable=too-many-instance-attributes
+
+    def __init__(self, game, out: Optional[np.ndarray] = None, dtype=np.uint8, frame_step: int = 4):
+        """
+        Args:
+            game (Game): The game to observe; it may not have a level yet.
+            out (np.ndarray, optional): C-contiguous ``(len(CHANNELS), rows, cols)``
+                array to fill, e.g. a slot of a replay buffer. Allocated when omitted.
+            dtype: Element type of the allocated array.
+            frame_step (int): Pixel stride of the downsampled RGB frame.
+        """
+        self.rows, self.cols = game.maze.grid.rows, game.maze.grid.cols
+        shape = (len(CHANNELS), self.rows, self.cols)
+        if out is None:
+            out = np.zeros(shape, dtype=dtype)
+        elif out.shape != shape or not out.flags.c_contiguous:
+            raise ValueError(f"Observation array must be C-contiguous with shape {shape}")
+        self.game = game
+        self.array = out
+        self.frame_step = frame_step
+        # Every channel as one row of flat tile indices; a view, so writes land in ``array``
+        self._flat = out.reshape(len(CHANNELS), self.rows * self.cols)
+
+        self._level = None
+        self._coins = None
+        self._coins_seen = 0
+        self._pills: list[bool] = []
+        # Flat tile last written in Pac-Man's channel, and the tiles set in each ghost channel
+        self._marks: dict[int, int] = {}
+        self._flags: dict[int, list[int]] = {
+            channel: [] for channel in (*_GHOST_CHANNELS.values(), CH_FRIGHTENED, CH_DEAD)
+        }
+
+    def reset(self) -> None:
+        """Forget the level, so the next ``update`` fills the whole array again."""
+        self._level = None
+
+    def update(self) -> np.ndarray:
+        """
+        Bring the array up to date with the game and return it.
+
+        Returns:
+            np.ndarray: The same ``(channels, rows, cols)`` array on every call.
+        """
+        level = self.game.level
+        if level is None:
+            return self.array
+        if level is not self._level:
+            self._fill(level)
+        self._update_coins(level.coins)
+        self._update_pills(level)
+
+        cols = self.cols
+        size = self.rows * cols
+        pacman = self.game.pacman
+        self._move(CH_PACMAN, (pacman.row * cols + pacman.col) % size)
+
+        swarm = self.game.swarm
+        if swarm is not None:
+            self._update_swarm(swarm)
+            return self.array
+
+        tiles = {channel: [] for channel in self._flags}
+        for ghost in self.game.ghosts_list:
+            idx = (ghost.row * cols + ghost.col) % size
+            tiles[_GHOST_CHANNELS[ghost.ghost_type]].append(idx)
+            if ghost.frightened:
+                tiles[CH_FRIGHTENED].append(idx)
+            if ghost.dead:
+                tiles[CH_DEAD].append(idx)
+        for channel, channel_tiles in tiles.items():
+            self._set_flags(channel, channel_tiles)
+        return self.array
+
+    def _update_swarm(self, swarm) -> None:
+        idx = (swarm.row * self.cols + swarm.col) % (self.rows * self.cols)
+        for i in range(len(s.GhostType)):
+            self._set_flags(CH_GHOSTS + i, idx[swarm.type_index == i].tolist())
+        self._set_flags(CH_FRIGHTENED, idx[swarm.frightened].tolist())
+        self._set_flags(CH_DEAD, idx[swarm.dead].tolist())
+
+    def _fill(self, level) -> None:
+        flat = self._flat
+        flat[:] = 0
+        kinds = np.frombuffer(bytes(level.grid.kinds), dtype=np.uint8)
+        flat[CH_WALLS] = (kinds == TILE_WALL) | (kinds == TILE_DOOR)
+        self._level = level
+        self._coins = None
+        self._pills = [False] * len(level.pills)
+        self._marks.clear()
+        for tiles in self._flags.values():
+            tiles.clear()
+
+    def _update_coins(self, coins) -> None:
+        flat = self._flat
+        if coins is not self._coins:
+            # A new coin set (new level or restored snapshot): unpack its bitset
+            size = self.rows * self.cols
+            raw = np.frombuffer(coins.bits.to_bytes((size + 7) // 8, "little"), dtype=np.uint8)
+            flat[CH_COINS] = np.unpackbits(raw, count=size, bitorder="little")
+            self._coins = coins
+            self._coins_seen = len(coins.eaten)
+
+        eaten = coins.eaten
+        for idx in eaten[self._coins_seen:]:
+            flat[CH_COINS, idx] = 0
+        self._coins_seen = len(eaten)
+
+    def _update_pills(self, level) -> None:
+        for i, pill in enumerate(level.pills):
+            present = not pill.eaten
+            if self._pills[i] != present:
+                self._pills[i] = present
+                self._flat[CH_PILLS, pill.row * self.cols + pill.col] = present
+
+    def _move(self, channel: int, idx: int) -> None:
+        old = self._marks.get(channel)
+        if old == idx:
+            return
+        if old is not None:
+            self._flat[channel, old] = 0
+        self._flat[channel, idx] = 1
+        self._marks[channel] = idx
+
+    def _set_flags(self, channel: int, tiles: list[int]) -> None:
+        previous = self._flags[channel]
+        if previous == tiles:
+            return
+        row = self._flat[channel]
+        for idx in previous:
+            row[idx] = 0
+        for idx in tiles:
+            row[idx] = 1
+        self._flags[channel] = tiles
+
+    @contextmanager
+    def frame(self, step: Optional[int] = None) -> Iterator[np.ndarray]:
+        """
+        Yield a downsampled ``(height, width, 3)`` RGB view of the game's screen.
+
+        The view shares memory with the screen surface, which stays locked
+        while the view exists, so it must not be kept past the ``with`` block;
+        copy it (``np.array(view)``) to keep the pixels.
+
+        Args:
+            step (int, optional): Pixel stride; defaults to ``frame_step``.
+        """
+        screen = self.game.screen
+        if screen is None:
+            raise RuntimeError("A headless game has no screen to observe")
+        step = step or self.frame_step
+        pixels = pg.surfarray.pixels3d(screen)
+        try:
+            yield pixels[::step, ::step].transpose(1, 0, 2)
+        finally:
+            del pixels
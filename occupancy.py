@@ -0,0 +1,121 @@
+"""
+Tile occupancy module.
+
+This module provides OccupancyGrid, a spatial hash from tiles to the entities
+standing on them. Each entity is registered under its current tile and under
+the tile it is moving into, and is only re-registered when one of those
+changes, i.e. when it crosses a tile boundary. Two entities that are less than
+a tile apart always have registered tiles that touch. A collision query
+therefore only looks at the 3x3 cells around the querying entity's tiles,
+instead of at every entity in the game. Occupied tiles are also kept as an
+integer bitset, so a query with no neighbours costs a couple of ANDs.
+"""
+from functools import lru_cache
+from typing import Iterable
+
+
+@lru_cache(maxsize=8)
+def _neighbourhood_masks(rows: int, cols: int) -> tuple[int, ...]:
+    """Bitmask of the 3x3 block around every tile, wrapped at the edges."""
+    return tuple(
+        sum({1 << ((r + dr) % rows) * cols + (c + dc) % cols for dr in (-1, 0, 1) for dc in (-1, 0, 1)})
+        for r in range(rows) for c in range(cols)
+    )
+
+
+class OccupancyGrid:
+    """Entities per tile, indexed by flat (wrapped) tile index."""
+
+    def __init__(self, rows: int, cols: int):
+        """
+        Args:
+            rows (int): Height of the maze in tiles.
+            cols (int): Width of the maze in tiles.
+        """
+        self.rows = rows
+        self.cols = cols
+        self.cells: list[list] = [[] for _ in range(rows * cols)]
+        # Bit i is set while tile i holds at least one entity
+        self.occupied = 0
+        self.around = _neighbourhood_masks(rows, cols)
+        self._positions: dict[object, tuple[int, int, int, int]] = {}
+        self._tiles: dict[object, tuple[int, ...]] = {}
+
+    def __len__(self) -> int:
+        return len(self._tiles)
+
+    def _key(self, r: int, c: int) -> int:
+        return (r % self.rows) * self.cols + c % self.cols
+
+    def update(self, entity) -> None:
+        """Register ``entity`` under its ``row``/``col`` and ``target_row``/``target_col`` tiles."""
+        # Most calls find the entity inside the same tiles as last time
+        position = (entity.row, entity.col, entity.target_row, entity.target_col)
+        if self._positions.get(entity) == position:
+            return
+        self._positions[entity] = position
+
+        current = self._key(entity.row, entity.col)
+        target = self._key(entity.target_row, entity.target_col)
+        tiles = (current,) if current == target else (current, target)
+        old = self._tiles.get(entity)
+        if old == tiles:
+            return
+        if old:
+            self._unregister(entity, old)
+        for tile in tiles:
+            self.cells[tile].append(entity)
+            self.occupied |= 1 << tile
+        self._tiles[entity] = tiles
+
+    def update_all(self, entities: Iterable) -> None:
+        """Bring every entity in ``entities`` up to date."""
+        for entity in entities:
+            self.update(entity)
+
+    def _unregister(self, entity, tiles: tuple[int, ...]) -> None:
+        for tile in tiles:
+            cell = self.cells[tile]
+            cell.remove(entity)
+            if not cell:
+                self.occupied &= ~(1 << tile)
+
+    def remove(self, entity) -> None:
+        """Forget ``entity``; unknown entities are ignored."""
+        self._positions.pop(entity, None)
+        tiles = self._tiles.pop(entity, None)
+        if tiles:
+            self._unregister(entity, tiles)
+
+    def clear(self) -> None:
+        """Forget every entity."""
+        for cell in self.cells:
+            cell.clear()
+        self.occupied = 0
+        self._positions.clear()
+        self._tiles.clear()
+
+    def near(self, *tiles: tuple[int, int]) -> list:
+        """
+        Return the entities registered in or next to any of ``tiles``.
+
+        Args:
+            *tiles (tuple[int, int]): (row, col) positions to search around,
+                typically an entity's current and target tiles.
+
+        Returns:
+            list: Each nearby entity once, in the order they were found.
+        """
+        hits = 0
+        for r, c in tiles:
+            hits |= self.around[self._key(r, c)]
+        hits &= self.occupied
+
+        found = []
+        while hits:
+            lowest = hits & -hits
+            for entity in self.cells[lowest.bit_length() - 1]:
+                if entity not in found:
+                    found.append(entity)
+            hits ^= lowest
+        return found
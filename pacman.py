@@ -1,6 +1,81 @@
 import math
+from functools import lru_cache
+
 import pygame as pg
-from settings import TILE_SIZE, Direction, BASE_SPEED, ROWS, COLS, COIN_SCORE_VALUE
+from grid import MazeGrid
+from settings import TILE_SIZE, Direction, BASE_SPEED, COIN_SCORE_VALUE
+
+
+class MouthAtlas:
+    """
+    Pre-rendered Pac-Man frames for every facing and mouth opening.
+
+    The mouth angle only ever moves in ``animation_speed`` steps, so it is
+    quantized to those steps and each (facing, step) pair is drawn once into a
+    single atlas surface. Drawing Pac-Man is then one blit of a subsurface.
+    """
+
+    FACINGS = 4
+
+    def __init__(self, radius: int, color: tuple[int, int, int], animation_speed: float, max_mouth_angle: float):
+        self.radius = radius
+        self.color = color
+        self.animation_speed = animation_speed
+        self.max_mouth_angle = max_mouth_angle
+        self.steps = math.ceil(max_mouth_angle / animation_speed)
+
+        self.surface = pg.Surface((TILE_SIZE * (self.steps + 1), TILE_SIZE * self.FACINGS), pg.SRCALPHA)
+        self.frames = [
+            [self._render(facing, step) for step in range(self.steps + 1)]
+            for facing in range(self.FACINGS)
+        ]
+
+    def _render(self, facing: int, step: int) -> pg.Surface:
+        frame = self.surface.subsurface((step * TILE_SIZE, facing * TILE_SIZE, TILE_SIZE, TILE_SIZE))
+        center = TILE_SIZE // 2
+        mouth_angle = min(step * self.animation_speed, self.max_mouth_angle)
+
+        if step == 0:
+            pg.draw.circle(frame, self.color, (center, center), self.radius)
+            return frame
+
+        facing_angle = facing * math.pi / 2
+        start_angle = facing_angle + mouth_angle
+        end_angle = facing_angle + 2 * math.pi - mouth_angle
+
+        points = [(center, center)]
+        segments = 30
+        angle_step = (end_angle - start_angle) / segments
+        for i in range(segments + 1):
+            current_angle = start_angle + i * angle_step
+            points.append((center + self.radius * math.cos(current_angle),
+                           center + self.radius * math.sin(current_angle)))
+
+        pg.draw.polygon(frame, self.color, points)
+        return frame
+
+    def frame(self, facing_angle: float, mouth_angle: float) -> pg.Surface:
+        """Return the frame closest to ``facing_angle`` and ``mouth_angle``."""
+        facing = round(facing_angle / (math.pi / 2)) % self.FACINGS
+        if mouth_angle >= self.max_mouth_angle:
+            step = self.steps
+        else:
+            step = min(round(mouth_angle / self.animation_speed), self.steps)
+        return self.frames[facing][step]
+
+
+def interpolate(previous: float, current: float, alpha: float) -> float:
+    """Blend two positions of one tick; jumps longer than a tile (tunnel wraps) are not blended."""
+    if abs(current - previous) > TILE_SIZE:
+        return current
+    return previous + (current - previous) * alpha
+
+
+@lru_cache(maxsize=None)
+def get_mouth_atlas(radius: int, color: tuple[int, int, int], animation_speed: float,
+                    max_mouth_angle: float) -> MouthAtlas:
+    """Return the atlas for these parameters, shared by every Pacman instance."""
+    return MouthAtlas(radius, color, animation_speed, max_mouth_angle)
 
 
 class Pacman:
@@ -10,6 +85,9 @@ class Pacman:
 
         self.x: float = col * TILE_SIZE
         self.y: float = row * TILE_SIZE
+        # Position before the last logic tick, for interpolated rendering
+        self.prev_x: float = self.x
+        self.prev_y: float = self.y
 
         self.alive: bool = True
         self.base_speed: float = BASE_SPEED
@@ -35,14 +113,14 @@ class Pacman:
     def grid_pos(self) -> tuple[int, int]:
         return self.row, self.col
 
-    def _is_tunnel_row(self) -> bool:
-        return 8 <= self.row <= 11
+    def _is_tunnel_row(self, grid: MazeGrid) -> bool:
+        return self.row in grid.tunnel_rows
 
-    def _handle_teleport(self) -> None:
-        if self.col < 0 and self._is_tunnel_row():
-            self.col = COLS - 1
+    def _handle_teleport(self, grid: MazeGrid) -> None:
+        if self.col < 0 and self._is_tunnel_row(grid):
+            self.col = grid.cols - 1
             self.x = self.col * TILE_SIZE
-        elif self.col >= COLS and self._is_tunnel_row():
+        elif self.col >= grid.cols and self._is_tunnel_row(grid):
             self.col = 0
             self.x = self.col * TILE_SIZE
 
@@ -59,26 +137,11 @@ class Pacman:
         elif event.key in (pg.K_DOWN, pg.K_s):
             self.next_direction = Direction.DOWN
 
-    def can_move_to(self, layout: list[list[str]], direction: Direction) -> bool:
-        dx, dy = direction.value
-        next_row = self.row + dy
-        next_col = self.col + dx
-
-        if next_row < 0 or next_row >= len(layout):
-            return False
+    def can_move_to(self, grid: MazeGrid, direction: Direction) -> bool:
+        return grid.pacman_can_move(self.row, self.col, direction)
 
-        if next_col < 0 or next_col >= len(layout[0]):
-            return self._is_tunnel_row()
-
-        tile = layout[next_row][next_col]
-
-        if tile == "=":
-            return False
-
-        return tile == "0"
-
-    def _start_move(self, layout: list[list[str]], direction: Direction) -> None:
-        if self.can_move_to(layout, direction):
+    def _start_move(self, grid: MazeGrid, direction: Direction) -> None:
+        if self.can_move_to(grid, direction):
             dx, dy = direction.value
             self.direction = direction
             self.moving = True
@@ -95,12 +158,12 @@ class Pacman:
             elif self.direction == Direction.DOWN:
                 self.facing_angle = math.pi * 0.5
 
-    def update(self, layout: list[list[str]], level) -> None:
+    def update(self, grid: MazeGrid, level) -> None:
         if not self.moving:
             if self.next_direction != Direction.STOP:
-                self._start_move(layout, self.next_direction)
+                self._start_move(grid, self.next_direction)
             elif self.direction != Direction.STOP:
-                self._start_move(layout, self.direction)
+                self._start_move(grid, self.direction)
             else:
                 self.mouth_angle = 0
                 return
@@ -129,47 +192,35 @@ class Pacman:
                 self.row = self.target_row
                 self.col = self.target_col
 
-                self._handle_teleport()
+                self._handle_teleport(grid)
 
                 self.x = self.col * TILE_SIZE
                 self.y = self.row * TILE_SIZE
                 self.moving = False
                 self.move_progress = 0
 
-        pos = (self.row, self.col)
-
-        if pos in level.coins:
-            level.coins.remove(pos)
+        if level.coins.take(self.row, self.col):
             level.score += COIN_SCORE_VALUE
 
-    def draw(self, screen: pg.Surface) -> None:
-        center_x = self.x + TILE_SIZE / 2
-        center_y = self.y + TILE_SIZE / 2
-
-        if self.mouth_angle <= 0.01:
-            pg.draw.circle(
-                screen,
-                self.color,
-                (int(center_x), int(center_y)),
-                self.radius,
-            )
-        else:
-            start_angle = self.facing_angle + self.mouth_angle
-            end_angle = self.facing_angle + 2 * math.pi - self.mouth_angle
+    def remember_position(self) -> None:
+        self.prev_x = self.x
+        self.prev_y = self.y
 
-            points = [(center_x, center_y)]
-            segments = 30
-            angle_step = (end_angle - start_angle) / segments
+    def render_position(self, alpha: float = 1.0) -> tuple[int, int]:
+        """Pixel position ``alpha`` of the way from the previous tick to the current one."""
+        if alpha >= 1.0:
+            return int(self.x), int(self.y)
+        return int(interpolate(self.prev_x, self.x, alpha)), int(interpolate(self.prev_y, self.y, alpha))
 
-            for i in range(segments + 1):
-                current_angle = start_angle + i * angle_step
-                px = center_x + self.radius * math.cos(current_angle)
-                py = center_y + self.radius * math.sin(current_angle)
-                points.append((px, py))
+    def draw(self, screen: pg.Surface, alpha: float = 1.0) -> None:
+        atlas = get_mouth_atlas(self.radius, self.color, self.animation_speed, self.max_mouth_angle)
+        screen.blit(atlas.frame(self.facing_angle, self.mouth_angle), self.render_position(alpha))
 
-            pg.draw.polygon(screen, self.color, points)
+    def check_ghost_collision(self, ghosts: list, level, occupancy=None) -> None:
+        # With an occupancy index only the ghosts on or next to our tiles can be close enough
+        if occupancy is not None:
+            ghosts = occupancy.near((self.row, self.col), (self.target_row, self.target_col))
 
-    def check_ghost_collision(self, ghosts: list, level) -> None:
         for g in ghosts:
             if g.dead:
                 continue
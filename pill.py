@@ -12,10 +12,14 @@ class Pill:
             row * s.TILE_SIZE + s.TILE_SIZE // 2
         )
 
+    def update(self):
+        # The blink is counted in logic ticks, so its speed does not depend on the frame rate
+        if not self.eaten:
+            self.blink_timer += 1
+
     def draw(self, screen):
         if self.eaten:
             return
-        self.blink_timer += 1
         if (self.blink_timer // s.PILL_BLINK_SPEED) % 2 == 0:
             pg.draw.circle(
                 screen,
@@ -0,0 +1,150 @@
+"""
+Frame profiling module.
+
+This module provides FrameProfiler, an opt-in instrumentation surface for the
+game loop. Hot-path methods are wrapped in named, timed sections only when
+profiling is enabled, so a game without a profiler runs its original,
+unwrapped methods. Per-frame totals of every section go into fixed-size ring
+buffers. These are summarized as p50/p95/p99 percentiles and can be exported
+as JSON or in the Chrome trace event format (chrome://tracing, Perfetto).
+Sections are inclusive: ``draw.level`` also contains ``draw.coins`` and
+``draw.pills``.
+"""
+import json
+import time
+from array import array
+from collections import deque
+from typing import Callable
+
+
+class RingBuffer:
+    """Fixed-size buffer of floats that overwrites its oldest values."""
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self.data = array("d", bytes(8 * capacity))
+        self.count = 0
+        self._next = 0
+
+    def __len__(self) -> int:
+        return self.count
+
+    def append(self, value: float) -> None:
+        self.data[self._next] = value
+        self._next = (self._next + 1) % self.capacity
+        self.count = min(self.count + 1, self.capacity)
+
+    def values(self) -> list[float]:
+        """Return the stored values, oldest first."""
+        if self.count < self.capacity:
+            return self.data[:self.count].tolist()
+        return (self.data[self._next:] + self.data[:self._next]).tolist()
+
+    def percentiles(self, *qs: float) -> list[float]:
+        """Return the nearest-rank percentile for each ``q`` in [0, 100]."""
+        ordered = sorted(self.values())
+        if not ordered:
+            return [0.0] * len(qs)
+        last = len(ordered) - 1
+        return [ordered[min(last, max(0, round(q / 100 * len(ordered)) - 1))] for q in qs]
+
+
+class FrameProfiler:
+    """Collects per-frame section timings of the game loop."""
+
+    def __init__(self, capacity: int = 600, max_events: int = 50_000):
+        """
+        Args:
+            capacity (int): Frames of history kept per section.
+            max_events (int): Individual section calls kept for trace export.
+        """
+        self.capacity = capacity
+        self.sections: dict[str, RingBuffer] = {}
+        self.events = deque(maxlen=max_events)
+        self.frames = 0
+        self._current: dict[str, float] = {}
+        self._frame_start = time.perf_counter()
+
+    def record(self, name: str, start: float, end: float) -> None:
+        """Add one call of section ``name`` that ran from ``start`` to ``end``."""
+        self._current[name] = self._current.get(name, 0.0) + (end - start)
+        self.events.append((name, start, end - start))
+
+    def timed(self, name: str, fn: Callable) -> Callable:
+        """Return ``fn`` wrapped so that every call is recorded as section ``name``."""
+        record = self.record
+        clock = time.perf_counter
+
+        def wrapper(*args, **kwargs):
+            start = clock()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                record(name, start, clock())
+
+        wrapper.__wrapped__ = fn
+        return wrapper
+
+    def wrap(self, obj, attr: str, name: str) -> None:
+        """Replace the method ``obj.attr`` on this instance with a timed version."""
+        setattr(obj, attr, self.timed(name, getattr(obj, attr)))
+
+    def _buffer(self, name: str) -> RingBuffer:
+        buffer = self.sections.get(name)
+        if buffer is None:
+            buffer = self.sections[name] = RingBuffer(self.capacity)
+        return buffer
+
+    def end_frame(self) -> None:
+        """Close the current frame and push its section totals into the ring buffers."""
+        now = time.perf_counter()
+        self._buffer("frame").append(now - self._frame_start)
+        for name, seconds in self._current.items():
+            self._buffer(name).append(seconds)
+        self._current.clear()
+        self._frame_start = now
+        self.frames += 1
+
+    def summary(self) -> dict:
+        """Return count, mean, p50/p95/p99 and max in milliseconds for each section."""
+        result = {}
+        for name, buffer in sorted(self.sections.items()):
+            values = buffer.values()
+            p50, p95, p99 = buffer.percentiles(50, 95, 99)
+            result[name] = {
+                "count": len(values),
+                "mean_ms": sum(values) / len(values) * 1000,
+                "p50_ms": p50 * 1000,
+                "p95_ms": p95 * 1000,
+                "p99_ms": p99 * 1000,
+                "max_ms": max(values) * 1000,
+            }
+        return result
+
+    def chrome_trace(self) -> dict:
+        """Return the recorded section calls as Chrome trace complete events."""
+        return {
+            "traceEvents": [
+                {"name": name, "ph": "X", "ts": start * 1e6, "dur": duration * 1e6, "pid": 0, "tid": 0}
+                for name, start, duration in self.events
+            ],
+            "displayTimeUnit": "ms",
+        }
+
+    def export(self, path: str, fmt: str = "json") -> None:
+        """
+        Write the profile to ``path``.
+
+        Args:
+            path (str): Output file.
+            fmt (str): ``"json"`` for the percentile summary or ``"chrome"``
+                for a trace that chrome://tracing and Perfetto can open.
+        """
+        if fmt == "json":
+            data = {"frames": self.frames, "sections": self.summary()}
+        elif fmt == "chrome":
+            data = self.chrome_trace()
+        else:
+            raise ValueError(f"Unknown profile format: {fmt}")
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=1)
@@ -0,0 +1,94 @@
+"""
+Incremental rendering module.
+
+This module provides DirtyRenderer, which draws the PLAYING state by touching
+only the parts of the screen that changed: the areas under Pac-Man and the
+ghosts (before and after they move), the blinking pills, freshly eaten coins
+and the score text. Each dirty area is restored from the level's cached board
+before the sprites are drawn again, and only those rectangles are sent to the
+display with ``pg.display.update``.
+"""
+import pygame as pg
+
+import settings as s
+
+
+class DirtyRenderer:
+    """Redraws and presents only the changed rectangles of the game screen."""
+
+    def __init__(self):
+        self._rects: list[pg.Rect] = []
+        self._level = None
+        self._board = None
+        self._coins = None
+        self._coins_erased = 0
+
+    def invalidate(self) -> None:
+        """Force a full redraw on the next frame."""
+        self._level = None
+
+    @staticmethod
+    def _tile_rect(x: float, y: float) -> pg.Rect:
+        # One tile at the entity's pixel position, padded for float rounding
+        return pg.Rect(int(x) - 1, int(y) - 1, s.TILE_SIZE + 2, s.TILE_SIZE + 2)
+
+    def _entity_rects(self, game, alpha: float) -> list[pg.Rect]:
+        rects = [self._tile_rect(*game.pacman.render_position(alpha))]
+        for ghost in game.ghosts_list:
+            rect = self._tile_rect(0, 0)
+            rect.center = ghost.render_rect(alpha).center
+            rects.append(rect)
+        for pill in game.level.pills:
+            rect = pg.Rect(0, 0, 2 * s.PILL_RADIUS + 2, 2 * s.PILL_RADIUS + 2)
+            rect.center = pill.center
+            rects.append(rect)
+        return rects
+
+    def _needs_full_redraw(self, game, board: pg.Surface) -> bool:
+        level = game.level
+        return level is not self._level or board is not self._board or level.coins is not self._coins
+
+    def draw(self, game, alpha: float = 1.0) -> list[pg.Rect]:
+        """
+        Draw the current frame of ``game`` and present it.
+
+        Args:
+            game (Game): The game to draw.
+            alpha (float): Interpolation between the previous and the current
+                logic tick, as in ``Game._draw``.
+
+        Returns:
+            list[pg.Rect]: The rectangles sent to the display; empty after a
+            full-screen flip.
+        """
+        screen = game.screen
+        level = game.level
+        board = level.get_board()
+
+        if self._needs_full_redraw(game, board):
+            screen.blit(board, (0, 0))
+            dirty = None
+            self._level, self._board, self._coins = level, board, level.coins
+            self._coins_erased = len(level.coins.eaten)
+        else:
+            dirty = list(self._rects)
+            eaten = level.coins.eaten
+            for idx in eaten[self._coins_erased:]:
+                r, c = divmod(idx, level.grid.cols)
+                dirty.append(pg.Rect(c * s.TILE_SIZE, r * s.TILE_SIZE, s.TILE_SIZE, s.TILE_SIZE))
+            self._coins_erased = len(eaten)
+            for rect in dirty:
+                screen.blit(board, rect, rect)
+
+        level.draw_pills(screen)
+        game.pacman.draw(screen, alpha)
+        game.draw_ghosts(screen, alpha)
+        hud = level.draw_ui(screen)
+
+        self._rects = self._entity_rects(game, alpha) + [hud]
+        if dirty is None:
+            pg.display.flip()
+            return []
+        dirty.extend(self._rects)
+        pg.display.update(dirty)
+        return dirty
@@ -0,0 +1,83 @@
+"""
+Replay module.
+
+This module provides ReplayEngine, which rebuilds the exact game state of a
+recorded episode by feeding its InputLog through the headless update path, at
+hundreds of times real time. The engine keeps periodic state checkpoints so
+that it can seek to any tick without replaying from the start.
+"""
+import time
+
+import settings as s
+from game import Game
+from inputlog import InputLog
+from maze import classic_maze, parse_maze
+
+
+class ReplayEngine:
+    """Replays an InputLog headlessly, with checkpoints for fast seeking."""
+
+    def __init__(self, log: InputLog, checkpoint_interval: int = 10 * s.FPS):
+        """
+        Args:
+            log (InputLog): The episode to replay.
+            checkpoint_interval (int): Ticks between stored state checkpoints.
+        """
+        self.log = log
+        self.checkpoint_interval = checkpoint_interval
+        self._inputs = dict(log.inputs)
+
+        # Rebuild the game with the maze and ghost options the episode was recorded with
+        maze = classic_maze() if log.maze_text is None else parse_maze(log.maze_text, name="recorded maze")
+        if maze.key != log.maze_key:
+            raise ValueError(f"Maze {maze.name} is not the one this log was recorded on")
+        self.game = Game(
+            headless=True,
+            seed=log.seed,
+            maze=maze,
+            ghost_count=log.ghost_count,
+            swarm=log.swarm,
+            path_distance=log.path_distance,
+        )
+        self.game._start_game(log.seed)  # pylint: disable=protected-access
+        self.checkpoints = {0: self.game.save_state()}
+
+    @property
+    def tick(self) -> int:
+        """The last tick that has been simulated."""
+        return self.game.tick
+
+    def _policy(self, game: Game):
+        return self._inputs.get(game.tick + 1)
+
+    def seek(self, tick: int) -> Game:
+        """
+        Bring the game to the state right after ``tick`` and return it.
+
+        Seeking backwards, or far forwards, restores the closest checkpoint at
+        or before ``tick`` and simulates only the remaining ticks.
+        """
+        tick = max(0, min(tick, self.log.end_tick))
+        nearest = max(t for t in self.checkpoints if t <= tick)
+        if tick < self.tick or nearest > self.tick:
+            self.game.load_state(self.checkpoints[nearest])
+
+        while self.tick < tick and self.game.state == s.STATE_PLAYING:
+            self.game.step(self._policy)
+            if self.tick % self.checkpoint_interval == 0 and self.tick not in self.checkpoints:
+                self.checkpoints[self.tick] = self.game.save_state()
+        return self.game
+
+    def run(self) -> dict:
+        """Replay to the end of the log and report the replay speed."""
+        start = time.perf_counter()
+        first_tick = self.tick
+        self.seek(self.log.end_tick)
+        elapsed = time.perf_counter() - start
+        ticks = self.tick - first_tick
+        return {
+            "ticks": ticks,
+            "seconds": elapsed,
+            "speedup": ticks / s.FPS / elapsed if elapsed > 0 else float("inf"),
+            "score": self.game.level.score if self.game.state == s.STATE_PLAYING else self.game.final_score,
+        }
@@ -0,0 +1,150 @@
+"""
+Multiprocess rollout module.
+
+This module runs complete headless Pac-Man episodes in a pool of worker
+processes so that bot evaluation can use every core. Each episode is seeded
+deterministically, results are streamed back as soon as they finish, the
+number of episodes in flight is bounded, and workers are recycled after a fixed
+number of episodes or restarted if one of them crashes.
+"""
+import multiprocessing
+import os
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from typing import Callable, Iterable, Iterator, NamedTuple, Optional
+
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+# pylint: disable=wrong-import-position
+import settings as s
+from game import Game
+
+DEFAULT_MAX_TICKS = 60 * s.FPS
+
+
+class EpisodeResult(NamedTuple):
+    """Outcome of one simulated episode."""
+    seed: int
+    score: int
+    ticks: int
+    coins_eaten: int
+    ghosts_eaten: int
+
+
+def run_episode(seed: int, policy: Optional[Callable] = None,
+                max_ticks: int = DEFAULT_MAX_TICKS) -> EpisodeResult:
+    """
+    Play one headless episode until Pac-Man dies or ``max_ticks`` elapse.
+
+    Args:
+        seed (int): Seed for the game's RNG, which drives frightened ghosts.
+        policy (Callable, optional): Receives the game each tick and returns the
+            next ``Direction`` for Pac-Man, or ``None`` to keep the current one.
+        max_ticks (int): Upper bound on the episode length in logic ticks.
+
+    Returns:
+        EpisodeResult: Score, ticks survived, coins eaten and ghosts eaten.
+    """
+    game = Game(headless=True, seed=seed)
+    game._start_game()  # pylint: disable=protected-access
+
+    ticks = coins_eaten = ghosts_eaten = 0
+    while ticks < max_ticks and game.state == s.STATE_PLAYING:
+        coins_before = len(game.level.coins)
+        level_before = game.level
+        hunting = [g for g in game.ghosts_list if not g.dead]
+
+        game.step(policy)
+        ticks += 1
+
+        # A cleared level is replaced by a fresh one, so every remaining coin was eaten
+        coins_after = len(game.level.coins) if game.level is level_before else 0
+        coins_eaten += coins_before - coins_after
+        ghosts_eaten += sum(g.dead for g in hunting)
+
+    score = game.level.score if game.state == s.STATE_PLAYING else game.final_score
+    return EpisodeResult(seed, score, ticks, coins_eaten, ghosts_eaten)
+
+
+class RolloutPool:
+    """Runs episodes for many seeds across worker processes."""
+
+    def __init__(self, workers: Optional[int] = None, max_ticks: int = DEFAULT_MAX_TICKS,
+                 max_pending: Optional[int] = None, episodes_per_worker: Optional[int] = 100,
+                 max_restarts: int = 3):
+        """
+        Configure the pool; worker processes start when ``run`` is called.
+
+        Args:
+            workers (int, optional): Number of processes. Defaults to the CPU count.
+            max_ticks (int): Episode length cap passed to ``run_episode``.
+            max_pending (int, optional): Episodes in flight at once, which bounds
+                memory. Defaults to twice the number of workers.
+            episodes_per_worker (int, optional): Recycle a worker after this many
+                episodes to release leaked memory. ``None`` keeps workers alive.
+            max_restarts (int): How many times a crashed pool is rebuilt before
+                the error is raised.
+        """
+        # pylint: disable=too-many-arguments, too-many-positional-arguments
+        self.workers = workers or os.cpu_count() or 1
+        self.max_ticks = max_ticks
+        self.max_pending = max_pending or 2 * self.workers
+        self.episodes_per_worker = episodes_per_worker
+        self.max_restarts = max_restarts
+        self.restarts = 0
+
+    def _make_executor(self) -> ProcessPoolExecutor:
+        if self.episodes_per_worker is None:
+            return ProcessPoolExecutor(max_workers=self.workers)
+        # Worker recycling is not available with the fork start method
+        return ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            max_tasks_per_child=self.episodes_per_worker,
+        )
+
+    def run(self, policy: Optional[Callable], seeds: Iterable[int]) -> Iterator[EpisodeResult]:
+        """
+        Yield one result per seed, in completion order.
+
+        ``policy`` must be picklable (for example a module-level function), since
+        it is sent to the worker processes. Seeds are consumed lazily, so a
+        generator of seeds never has more than ``max_pending`` episodes queued.
+        """
+        seeds = iter(seeds)
+        pending = {}
+        executor = self._make_executor()
+        try:
+            while True:
+                while len(pending) < self.max_pending:
+                    seed = next(seeds, None)
+                    if seed is None:
+                        break
+                    pending[executor.submit(run_episode, seed, policy, self.max_ticks)] = seed
+                if not pending:
+                    return
+
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                try:
+                    for future in done:
+                        result = future.result()
+                        del pending[future]
+                        yield result
+                except BrokenProcessPool:
+                    executor = self._restart(executor, pending, policy)
+        finally:
+            executor.shutdown(cancel_futures=True)
+
+    def _restart(self, executor, pending, policy) -> ProcessPoolExecutor:
+        """Replace a crashed executor and resubmit every unfinished episode."""
+        self.restarts += 1
+        if self.restarts > self.max_restarts:
+            raise RuntimeError(f"Rollout workers crashed {self.restarts} times")
+
+        executor.shutdown(cancel_futures=True)
+        executor = self._make_executor()
+        seeds = list(pending.values())
+        pending.clear()
+        for seed in seeds:
+            pending[executor.submit(run_episode, seed, policy, self.max_ticks)] = seed
+        return executor
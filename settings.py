@@ -54,7 +54,12 @@ WALL_COLOR = (0, 0, 0)
 BORDER_COLOR = (0, 0, 255)
 BORDER_WIDTH = 3
 RADIUS = 10
+# Logic ticks per second; speeds and timers are expressed per tick
 FPS = 60
+# Frame rate cap for rendering, which interpolates between logic ticks
+RENDER_FPS = 120
+# Most logic ticks run in one frame to catch up after a hitch
+MAX_CATCHUP_TICKS = 5
 
 # coins
 COIN_COLOR = (255, 215, 0)
@@ -68,16 +73,30 @@ PILL_SCORE_VALUE = 50
 PILL_BLINK_SPEED = 10
 PILL_FRIGHT_TIME = 300
 
+# intro jingle, in logic ticks
+INTRO_TICKS = int(4.5 * FPS)
+
 # score
 SCORE_FONT_SIZE = 36
 SCORE_COLOR = (255, 255, 255)
 SCORE_POSITION = (10, 10)
 SCORE_PREFIX = ""
 
+# spawn points (row, col)
+PACMAN_SPAWN = (15, 9)
+GHOST_SPAWNS = (  # (ghost type, row, col, spawn delay in seconds)
+    (GhostType.BLINKY, 7, 9, 0),
+    (GhostType.PINKY, 9, 9, 2),
+    (GhostType.INKY, 9, 8, 4),
+    (GhostType.CLYDE, 9, 10, 6),
+)
+
 # ghosts
 GHOST_BLINK_TICKS = (1, 2, 3, 4, 5)
 GHOST_BLINKING_DURATION = PILL_FRIGHT_TIME / 3  # 1/3 of the frightened time
 GHOST_SPEED_MULTIPLIER = 0.9
+# Steer by shortest-path distance through the maze instead of straight-line distance
+GHOST_PATH_DISTANCE = False
 
 # states
 STATE_MENU = "MENU"
@@ -104,6 +123,17 @@ sound_files = {
     "frightened": "frightened.wav"  # Blue ghost movement (loop)
 }
 
+# Sounds with a dedicated looping channel each
+LOOP_SOUNDS = ("siren", "frightened")
+# One-shot sounds may take over a busy channel from a lower priority sound
+SOUND_PRIORITIES = {
+    "intro": 3,
+    "death": 3,
+    "eat_ghost": 2,
+    "munch": 1,
+}
+EFFECT_CHANNELS = 4
+
 CONFIG = {
     "MUSIC_ON": True,
     "SFX_ON": True
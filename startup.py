@@ -0,0 +1,42 @@
+"""
+Startup instrumentation module.
+
+This module provides StartupProfiler, which times the phases of launching the
+game (pygame and mixer initialization, the display, sprites, menus) and the
+time until the first frame is on screen, and formats them as a short report.
+"""
+import time
+from contextlib import contextmanager
+
+
+class StartupProfiler:
+    """Records how long each startup phase takes."""
+
+    def __init__(self):
+        self.start = time.perf_counter()
+        self.phases: dict[str, float] = {}
+        self.first_frame = None
+
+    @contextmanager
+    def phase(self, name: str):
+        """Time the body of a ``with`` block as phase ``name``."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases[name] = self.phases.get(name, 0.0) + time.perf_counter() - start
+
+    def mark_first_frame(self) -> None:
+        """Record the time to first frame; later calls are ignored."""
+        if self.first_frame is None:
+            self.first_frame = time.perf_counter() - self.start
+
+    def report(self) -> str:
+        """Return one line per phase, slowest first, followed by the time to first frame."""
+        width = max((len(name) for name in self.phases), default=0)
+        lines = ["startup:"]
+        for name, seconds in sorted(self.phases.items(), key=lambda item: -item[1]):
+            lines.append(f"  {name:<{width}}  {seconds * 1000:8.2f} ms")
+        if self.first_frame is not None:
+            lines.append(f"  {'first frame':<{width}}  {self.first_frame * 1000:8.2f} ms")
+        return "\n".join(lines)
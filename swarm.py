@@ -0,0 +1,589 @@
+"""
+Ghost swarm module.
+
+This module provides GhostSwarm, which stores the state of any number of
+ghosts in struct-of-arrays form, one NumPy array per field, and runs the logic
+of ``Ghost.update`` and ``Pacman.check_ghost_collision`` on all of them at
+once. Swarm ghosts behave exactly like Ghost objects, so a swarm and a list of
+Ghosts that start alike stay alike tick for tick. BatchEnv keeps the ghosts of
+all its games in one swarm, and Game uses one for stress scenarios with
+hundreds of ghosts, where the cost of a tick grows with a few vector
+operations per ghost instead of a Python call chain per ghost. GhostView is a
+slotted handle on one swarm ghost with the attributes of a Ghost, for code
+that visits ghosts one at a time (pills, snapshots, the dirty renderer).
+"""
+import math
+import random
+from typing import Optional, Sequence
+
+import numpy as np
+import pygame as pg
+
+import settings as s
+from flowfield import FlowFields
+from grid import MazeGrid, TILE_PATH
+from pacman import interpolate
+
+# Direction codes stored in the arrays; 1-4 follow the ghosts' evaluation order
+DIRECTION_CODES = (
+    s.Direction.STOP,
+    s.Direction.UP,
+    s.Direction.LEFT,
+    s.Direction.DOWN,
+    s.Direction.RIGHT,
+)
+DIRECTION_INDEX = {d: i for i, d in enumerate(DIRECTION_CODES)}
+
+DX = np.array([d.value[0] for d in DIRECTION_CODES], dtype=np.int64)
+DY = np.array([d.value[1] for d in DIRECTION_CODES], dtype=np.int64)
+OPPOSITE = np.array(
+    [DIRECTION_INDEX[s.Direction((-d.value[0], -d.value[1]))] for d in DIRECTION_CODES],
+    dtype=np.int64,
+)
+BITS = np.array([0, 1, 2, 4, 8], dtype=np.uint8)  # MazeGrid adjacency bit per code
+_CODE_UP, _CODE_LEFT, _CODE_RIGHT = 1, 2, 4
+
+SCATTER, CHASE = 0, 1
+MODE_NAMES = ("SCATTER", "CHASE")
+GHOST_TYPES = tuple(s.GhostType)
+_CHASE_LEAD = {s.GhostType.PINKY: 4, s.GhostType.INKY: 2}
+_UNREACHABLE = np.iinfo(np.int64).max
+
+GHOST_EAT_SCORE = 200
+GHOST_DEATH_TICKS = 5 * s.FPS
+COLLISION_THRESHOLD = s.TILE_SIZE * 0.7
+SPRITE_SIZE = max(4, s.TILE_SIZE - 4)
+SPRITE_OFFSET = (s.TILE_SIZE - SPRITE_SIZE) // 2
+# Extra ghosts never start closer to Pac-Man than this, in tiles
+MIN_SPAWN_DISTANCE = 8
+
+
+def ghost_spawns(maze, count: int, rng: random.Random) -> list[tuple]:
+    """
+    Return ``count`` ghost spawns for ``maze``, like ``settings.GHOST_SPAWNS``.
+
+    The maze's own spawns come first. Extra ghosts cycle through the four
+    personalities and start on random corridor tiles away from Pac-Man.
+
+    Args:
+        maze (Maze): The maze played on.
+        count (int): Number of ghosts.
+        rng (random.Random): Picks the corridor tiles of the extra ghosts.
+    """
+    spawns = list(maze.ghost_spawns[:count])
+    if len(spawns) == count:
+        return spawns
+    grid = maze.grid
+    pr, pc = maze.pacman_spawn
+    tiles = [
+        divmod(idx, grid.cols) for idx, kind in enumerate(grid.kinds)
+        if kind == TILE_PATH and math.dist(divmod(idx, grid.cols), (pr, pc)) >= MIN_SPAWN_DISTANCE
+    ]
+    delays = {ghost_type: delay for ghost_type, _, _, delay in maze.ghost_spawns}
+    for i in range(len(spawns), count):
+        ghost_type = GHOST_TYPES[i % len(GHOST_TYPES)]
+        row, col = rng.choice(tiles)
+        spawns.append((ghost_type, row, col, delays.get(ghost_type, 0)))
+    return spawns
+
+
+class GhostSwarm:
+    """Ghosts of one or more games, stored and updated as arrays."""
+    # pylint: disable=too-many-instance-attributes
+
+    def __init__(self, grid: MazeGrid, spawns: Sequence[tuple], rngs: Sequence[random.Random],
+                 sprite_manager=None, path_distance: Optional[bool] = None):
+        """
+        Allocate the state arrays and put every ghost on its spawn.
+
+        Args:
+            grid (MazeGrid): The maze the ghosts move in.
+            spawns (Sequence[tuple]): (ghost type, row, col, spawn delay in
+                seconds) of the ghosts of one game.
+            rngs (Sequence[random.Random]): One generator per game for
+                frightened movement. The swarm holds ``len(spawns)`` ghosts
+                per game, game after game.
+            sprite_manager (assets.SpriteManager, optional): Sprites for ``draw``.
+            path_distance (bool, optional): Steer by shortest-path distance, as
+                Ghost does. Defaults to ``settings.GHOST_PATH_DISTANCE``.
+        """
+        # pylint: disable=too-many-arguments, too-many-positional-arguments
+        self.grid = grid
+        self.rows, self.cols = grid.rows, grid.cols
+        self.rngs = list(rngs)
+        self.sprite_manager = sprite_manager
+        self.path_distance = s.GHOST_PATH_DISTANCE if path_distance is None else path_distance
+        self.num_envs = len(self.rngs)
+        self.per_env = len(spawns)
+        n, g = self.num_envs, self.per_env
+        self.size = n * g
+
+        self._ghost_moves = np.frombuffer(grid.ghost_moves, dtype=np.uint8)
+        self._speed = s.BASE_SPEED * s.GHOST_SPEED_MULTIPLIER
+        self.env = np.repeat(np.arange(n), g)
+
+        # Per-ghost constants
+        types = [ghost_type for ghost_type, _, _, _ in spawns]
+        self.ghost_types = [types[i % g] for i in range(self.size)]
+        self.type_index = np.tile([GHOST_TYPES.index(t) for t in types], n)
+        self._chase_lead = np.tile([_CHASE_LEAD.get(t, 0) for t in types], n)
+        self._is_clyde = np.tile([t is s.GhostType.CLYDE for t in types], n)
+        self.start_row = np.tile([row for _, row, _, _ in spawns], n).astype(np.int64)
+        self.start_col = np.tile([col for _, _, col, _ in spawns], n).astype(np.int64)
+        self._spawn_delay = np.tile([delay * s.FPS for _, _, _, delay in spawns], n).astype(np.int64)
+        scatter = [self._scatter_target(t) for t in types]
+        self.scatter_row = np.tile([r for r, _ in scatter], n).astype(np.int64)
+        self.scatter_col = np.tile([c for _, c in scatter], n).astype(np.int64)
+
+        # Per-ghost state; the arrays are only ever written in place
+        m = self.size
+        self.row = np.zeros(m, dtype=np.int64)
+        self.col = np.zeros(m, dtype=np.int64)
+        self.x = np.zeros(m, dtype=np.float64)
+        self.y = np.zeros(m, dtype=np.float64)
+        self.prev_x = np.zeros(m, dtype=np.float64)
+        self.prev_y = np.zeros(m, dtype=np.float64)
+        self.direction = np.zeros(m, dtype=np.int64)
+        self.moving = np.zeros(m, dtype=bool)
+        self.progress = np.zeros(m, dtype=np.float64)
+        self.target_row = np.zeros(m, dtype=np.int64)
+        self.target_col = np.zeros(m, dtype=np.int64)
+        self.mode = np.zeros(m, dtype=np.int64)
+        self.mode_timer = np.zeros(m, dtype=np.int64)
+        self.frightened = np.zeros(m, dtype=bool)
+        self.timer = np.zeros(m, dtype=np.int64)
+        self.dead = np.zeros(m, dtype=bool)
+        self.dead_timer = np.zeros(m, dtype=np.int64)
+        self.spawn_delay = np.zeros(m, dtype=np.int64)
+        self.in_house = np.zeros(m, dtype=bool)
+
+        self.views = [GhostView(self, i) for i in range(m)]
+        self.reset(np.ones(m, dtype=bool))
+        self.remember_positions()
+
+    def _scatter_target(self, ghost_type: s.GhostType) -> tuple[int, int]:
+        match ghost_type:
+            case s.GhostType.BLINKY:
+                return -2, self.cols - 3
+            case s.GhostType.PINKY:
+                return -2, 2
+            case s.GhostType.INKY:
+                return self.rows + 1, self.cols - 1
+            case s.GhostType.CLYDE:
+                return self.rows + 1, 0
+            case _:
+                raise ValueError('Unknown ghost type')
+
+    def __len__(self) -> int:
+        return self.size
+
+    @property
+    def flow_fields(self) -> FlowFields:
+        """Flow fields of the maze, shared with every other ghost on it."""
+        return FlowFields.for_grid(self.grid)
+
+    def reset(self, mask: np.ndarray) -> None:
+        """Put the masked ghosts back on their spawns at the start of a level."""
+        self.respawn(mask)
+        self.mode[mask] = SCATTER
+        self.mode_timer[mask] = 0
+        self.spawn_delay[mask] = self._spawn_delay[mask]
+
+    def respawn(self, mask: np.ndarray) -> None:
+        """Return the masked ghosts to their spawns, alive and calm, as ``Ghost.respawn``."""
+        self.row[mask] = self.start_row[mask]
+        self.col[mask] = self.start_col[mask]
+        self.target_row[mask] = self.start_row[mask]
+        self.target_col[mask] = self.start_col[mask]
+        self.frightened[mask] = False
+        self.timer[mask] = 0
+        self.dead[mask] = False
+        self.dead_timer[mask] = 0
+        self.moving[mask] = False
+        self.direction[mask] = 0
+        self.in_house[mask] = [
+            self.grid.is_house(r, c) for r, c in zip(self.start_row[mask], self.start_col[mask])
+        ]
+        self._snap(mask)
+
+    def _snap(self, mask: np.ndarray) -> None:
+        self.x[mask] = self.col[mask] * s.TILE_SIZE + SPRITE_OFFSET
+        self.y[mask] = self.row[mask] * s.TILE_SIZE + SPRITE_OFFSET
+
+    def remember_positions(self) -> None:
+        """Store the current positions as the start of the next interpolation."""
+        self.prev_x[:] = self.x
+        self.prev_y[:] = self.y
+
+    def frighten(self, env_mask: np.ndarray) -> None:
+        """Frighten every ghost of the masked games, as a power pill does."""
+        frightened = np.asarray(env_mask)[self.env]
+        self.frightened[frightened] = True
+        self.timer[frightened] = s.PILL_FRIGHT_TIME
+
+    def _start_moves(self, mask: np.ndarray, codes) -> None:
+        self.direction[mask] = codes
+        self.moving[mask] = True
+        self.progress[mask] = 0
+        self.target_row[mask] = (self.row[mask] + DY[codes]) % self.rows
+        self.target_col[mask] = (self.col[mask] + DX[codes]) % self.cols
+
+    def update(self, pacman_row, pacman_col, pacman_direction) -> None:
+        """
+        Advance every ghost by one tick.
+
+        Args:
+            pacman_row (array-like): Pac-Man's row, one entry per game.
+            pacman_col (array-like): Pac-Man's column, one entry per game.
+            pacman_direction (array-like): Pac-Man's direction code per game.
+        """
+        # Dead ghosts only count down to their respawn
+        dead = self.dead.copy()
+        self.dead_timer[dead] -= 1
+        self.respawn(dead & (self.dead_timer <= 0))
+
+        waiting = ~dead & (self.spawn_delay > 0)
+        self.spawn_delay[waiting] -= 1
+        active = ~dead & ~waiting
+
+        self._update_modes(active)
+
+        frightened = active & self.frightened
+        self.timer[frightened] -= 1
+        self.frightened[frightened & (self.timer <= 0)] = False
+
+        deciding = active & ~self.moving
+        in_house = deciding & self.in_house
+        self._update_house_movement(in_house)
+        outside = deciding & ~in_house
+        self._update_frightened_decisions(outside & self.frightened)
+        pacman = (np.asarray(pacman_row), np.asarray(pacman_col), np.asarray(pacman_direction))
+        self._update_target_decisions(outside & ~self.frightened, *pacman)
+
+        self._update_pixels(active)
+
+    def _update_modes(self, active: np.ndarray) -> None:
+        counting = active & ~self.frightened
+        self.mode_timer[counting] += 1
+        to_chase = counting & (self.mode == SCATTER) & (self.mode_timer > 7 * s.FPS)
+        to_scatter = counting & (self.mode == CHASE) & (self.mode_timer > 20 * s.FPS)
+        self.mode[to_chase] = CHASE
+        self.mode[to_scatter] = SCATTER
+        switched = to_chase | to_scatter
+        self.mode_timer[switched] = 0
+        self.direction[switched] = OPPOSITE[self.direction[switched]]
+
+    def _update_house_movement(self, mask: np.ndarray) -> None:
+        if not mask.any():
+            return
+        exit_row, exit_col = self.grid.house_exit
+        row, col = self.row, self.col
+        at_exit = mask & (row == exit_row) & (col == exit_col)
+        self.in_house[at_exit] = False
+        self.direction[at_exit] = _CODE_LEFT
+
+        moving = mask & ~at_exit
+        self._start_moves(moving & (col < exit_col), _CODE_RIGHT)
+        self._start_moves(moving & (col > exit_col), _CODE_LEFT)
+        self._start_moves(moving & (col == exit_col) & (row > exit_row), _CODE_UP)
+
+    def _tiles(self, mask) -> np.ndarray:
+        return (self.row[mask] % self.rows) * self.cols + self.col[mask] % self.cols
+
+    def _allowed_codes(self, mask: np.ndarray) -> np.ndarray:
+        """Return a (K, 5) mask of legal, non-reversing codes for the masked ghosts."""
+        moves = self._ghost_moves[self._tiles(mask)]
+        direction = self.direction[mask]
+        allowed = (moves[:, None] & BITS[None, :]) != 0
+        reverse = (direction != 0)[:, None] & (np.arange(5)[None, :] == OPPOSITE[direction][:, None])
+        return allowed & ~reverse
+
+    def _update_frightened_decisions(self, mask: np.ndarray) -> None:
+        if not mask.any():
+            return
+        allowed = self._allowed_codes(mask)
+        indices = np.flatnonzero(mask)
+        # Choices consume each game's RNG in ghost order, exactly like random.choice
+        for ghost, options in zip(indices, allowed):
+            codes = np.flatnonzero(options).tolist()
+            if codes:
+                code = self.rngs[self.env[ghost]].choice(codes)
+                self._start_moves(np.array([ghost]), code)
+
+    def _fields_toward(self, target_row: np.ndarray, target_col: np.ndarray):
+        """Yield each distinct flow field among the targets with the mask of the entries using it."""
+        targets, inverse = np.unique(np.stack([target_row, target_col], axis=1), axis=0, return_inverse=True)
+        inverse = inverse.reshape(-1)
+        for k, (row, col) in enumerate(targets.tolist()):
+            yield self.flow_fields.toward(row, col), inverse == k
+
+    def _chase_targets(self, mask, pacman_row, pacman_col, pacman_direction) -> tuple[np.ndarray, np.ndarray]:
+        env = self.env[mask]
+        pr, pc = pacman_row[env], pacman_col[env]
+        # Mirrors Ghost._get_chase_target, which unpacks (dx, dy) as (dr, dc)
+        dr, dc = DX[pacman_direction[env]], DY[pacman_direction[env]]
+        lead = self._chase_lead[mask]
+        target_row, target_col = pr + dr * lead, pc + dc * lead
+
+        near = self._is_clyde[mask] & self._near_pacman(mask, pr, pc)
+        target_row = np.where(near, self.scatter_row[mask], target_row)
+        target_col = np.where(near, self.scatter_col[mask], target_col)
+        return target_row, target_col
+
+    def _near_pacman(self, mask, pacman_row, pacman_col) -> np.ndarray:
+        """Which masked ghosts are closer than 8 tiles to Pac-Man, measured as Ghost measures it."""
+        if self.path_distance:
+            tiles = self._tiles(mask)
+            distance = np.zeros(len(tiles), dtype=np.int64)
+            for field, uses in self._fields_toward(pacman_row, pacman_col):
+                distance[uses] = field.dist[tiles[uses]]
+            return distance < 8
+        return (self.row[mask] - pacman_row) ** 2 + (self.col[mask] - pacman_col) ** 2 < 64
+
+    def _update_target_decisions(self, mask, pacman_row, pacman_col, pacman_direction) -> None:
+        if not mask.any():
+            return
+        chase = self.mode[mask] == CHASE
+        chase_row, chase_col = self._chase_targets(mask, pacman_row, pacman_col, pacman_direction)
+        target_row = np.where(chase, chase_row, self.scatter_row[mask])
+        target_col = np.where(chase, chase_col, self.scatter_col[mask])
+        if self.path_distance:
+            best = self._path_decisions(mask, target_row, target_col)
+        else:
+            best = self._straight_line_decisions(mask, target_row, target_col)
+
+        indices = np.flatnonzero(mask)
+        go = best != 0
+        self._start_moves(indices[go], best[go])
+        self.direction[indices[~go]] = 0
+
+    def _path_decisions(self, mask, target_row, target_col) -> np.ndarray:
+        """Direction codes of the masked ghosts, one lookup each in the flow field of its target."""
+        tiles = self._tiles(mask)
+        direction = self.direction[mask]
+        best = np.zeros(len(tiles), dtype=np.int64)
+        for field, uses in self._fields_toward(target_row, target_col):
+            best[uses] = field.decisions[tiles[uses], direction[uses]]
+        return best
+
+    def _straight_line_decisions(self, mask, target_row, target_col) -> np.ndarray:
+        """Direction codes of the masked ghosts, taking the legal step closest to the target."""
+        allowed = self._allowed_codes(mask)
+        row = self.row[mask][:, None] + DY[None, :]
+        col = self.col[mask][:, None] + DX[None, :]
+        dist = (row - target_row[:, None]) ** 2 + (col - target_col[:, None]) ** 2
+        best = np.argmin(np.where(allowed, dist, _UNREACHABLE), axis=1)
+
+        # Dead ends: reverse if possible, otherwise stop
+        direction = self.direction[mask]
+        reverse = OPPOSITE[direction]
+        can_reverse = (direction != 0) & ((self._ghost_moves[self._tiles(mask)] & BITS[reverse]) != 0)
+        return np.where(~allowed.any(axis=1), np.where(can_reverse, reverse, 0), best)
+
+    def _update_pixels(self, active: np.ndarray) -> None:
+        mask = active & self.moving & (self.direction != 0)
+        codes = self.direction[mask]
+        dx_px = DX[codes] * self._speed
+        dy_px = DY[codes] * self._speed
+        self.x[mask] += dx_px
+        self.y[mask] += dy_px
+        self.progress[mask] += np.abs(dx_px) + np.abs(dy_px)
+
+        arrived = mask & (self.progress >= s.TILE_SIZE)
+        self.row[arrived] = self.target_row[arrived]
+        self.col[arrived] = self.target_col[arrived]
+        self._snap(arrived)
+        self.moving[arrived] = False
+        self.progress[arrived] = 0
+
+    def start_death(self, mask: np.ndarray) -> None:
+        """Kill the masked ghosts, as ``Ghost.start_death``."""
+        self.dead[mask] = True
+        self.frightened[mask] = False
+        self.dead_timer[mask] = GHOST_DEATH_TICKS
+        self.moving[mask] = False
+        self.direction[mask] = 0
+
+    def collide(self, pacman_x, pacman_y) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Resolve contacts with Pac-Man, as ``Pacman.check_ghost_collision``.
+
+        Frightened ghosts that touch Pac-Man die; any other live ghost that
+        touches him catches him.
+
+        Args:
+            pacman_x (array-like): Pac-Man's pixel x, one entry per game.
+            pacman_y (array-like): Pac-Man's pixel y, one entry per game.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: Ghosts eaten per game, and a mask
+            of the games in which Pac-Man was caught.
+        """
+        env = self.env
+        distance = np.hypot(np.asarray(pacman_x)[env] - self.x, np.asarray(pacman_y)[env] - self.y)
+        hit = ~self.dead & (distance < COLLISION_THRESHOLD)
+
+        eaten = hit & self.frightened
+        self.start_death(eaten)
+        eaten_per_env = np.bincount(env[eaten], minlength=self.num_envs)
+        caught = np.bincount(env[hit & ~eaten], minlength=self.num_envs) > 0
+        return eaten_per_env, caught
+
+    def render_positions(self, alpha: float = 1.0, indices=None) -> tuple[np.ndarray, np.ndarray]:
+        """Integer hitbox corners of the ghosts (all, or ``indices``) ``alpha`` of the way through the tick."""
+        if indices is None:
+            indices = slice(None)
+        x, y = self.x[indices], self.y[indices]
+        if alpha >= 1.0:
+            return x.astype(np.int64), y.astype(np.int64)
+        positions = []
+        for previous, current in ((self.prev_x[indices], x), (self.prev_y[indices], y)):
+            # Jumps longer than a tile (tunnel wraps) are not blended, as in pacman.interpolate
+            blended = previous + (current - previous) * alpha
+            positions.append(np.where(np.abs(current - previous) > s.TILE_SIZE, current, blended).astype(np.int64))
+        return positions[0], positions[1]
+
+    def draw(self, screen: pg.Surface, alpha: float = 1.0, indices=None) -> None:
+        """
+        Draw the live ghosts (all, or ``indices``) with one ``Surface.blits`` call.
+
+        Args:
+            screen (pg.Surface): Target surface.
+            alpha (float): Interpolation between the previous and current tick.
+            indices (Sequence[int], optional): Ghosts to draw; all by default.
+        """
+        indices = np.arange(self.size) if indices is None else np.asarray(indices, dtype=np.int64)
+        indices = indices[~self.dead[indices]]
+        xs, ys = self.render_positions(alpha, indices)
+        show_frightened = self._shows_frightened(indices).tolist()
+        directions = self.direction[indices].tolist()
+        half = SPRITE_SIZE // 2
+
+        blits = []
+        for k, i in enumerate(indices.tolist()):
+            center = (int(xs[k]) + half, int(ys[k]) + half)
+            image = self._sprite(i, directions[k], show_frightened[k])
+            if image:
+                blits.append((image, image.get_rect(center=center)))
+            else:
+                # Fallback to rect if image fails
+                rect = pg.Rect(0, 0, SPRITE_SIZE, SPRITE_SIZE)
+                rect.center = center
+                pg.draw.rect(screen, (0, 0, 255) if show_frightened[k] else self.ghost_types[i].value, rect)
+        screen.blits(blits, doreturn=False)
+
+    def _shows_frightened(self, indices: np.ndarray) -> np.ndarray:
+        """Which of the ghosts at ``indices`` are drawn with the frightened sprite."""
+        # Near the end of the fright the normal sprite blinks through
+        timer = self.timer[indices]
+        blinking = (timer < s.PILL_FRIGHT_TIME // 3) & np.isin(timer % 10, s.GHOST_BLINK_TICKS)
+        return self.frightened[indices] & ~blinking
+
+    def _sprite(self, index: int, code: int, frightened: bool) -> Optional[pg.Surface]:
+        if not self.sprite_manager:
+            return None
+        return self.sprite_manager.get_ghost_image(self.ghost_types[index].name, DIRECTION_CODES[code], frightened)
+
+
+def _field(name: str, cast):
+    def get(self):
+        return cast(getattr(self.swarm, name)[self.index])
+
+    def put(self, value):
+        getattr(self.swarm, name)[self.index] = value
+
+    return property(get, put)
+
+
+class GhostView:
+    """One ghost of a swarm, with the attributes and methods of a Ghost."""
+    __slots__ = ("swarm", "index")
+
+    def __init__(self, swarm: GhostSwarm, index: int):
+        self.swarm = swarm
+        self.index = index
+
+    row = _field("row", int)
+    col = _field("col", int)
+    x = _field("x", float)
+    y = _field("y", float)
+    prev_x = _field("prev_x", float)
+    prev_y = _field("prev_y", float)
+    moving = _field("moving", bool)
+    move_progress = _field("progress", float)
+    target_row = _field("target_row", int)
+    target_col = _field("target_col", int)
+    mode_timer = _field("mode_timer", int)
+    frightened = _field("frightened", bool)
+    timer = _field("timer", int)
+    dead = _field("dead", bool)
+    dead_timer = _field("dead_timer", int)
+    spawn_delay = _field("spawn_delay", int)
+    in_house = _field("in_house", bool)
+    start_row = _field("start_row", int)
+    start_col = _field("start_col", int)
+
+    @property
+    def direction(self) -> s.Direction:
+        """Heading of the ghost, STOP while it stands."""
+        return DIRECTION_CODES[self.swarm.direction[self.index]]
+
+    @direction.setter
+    def direction(self, value: s.Direction) -> None:
+        self.swarm.direction[self.index] = DIRECTION_INDEX[value]
+
+    @property
+    def mode(self) -> str:
+        """``"SCATTER"`` or ``"CHASE"``, as Ghost.mode."""
+        return MODE_NAMES[self.swarm.mode[self.index]]
+
+    @mode.setter
+    def mode(self, value: str) -> None:
+        self.swarm.mode[self.index] = MODE_NAMES.index(value)
+
+    @property
+    def ghost_type(self) -> s.GhostType:
+        """The ghost's personality."""
+        return self.swarm.ghost_types[self.index]
+
+    @property
+    def name(self) -> str:
+        """Name of the personality, e.g. ``"BLINKY"``."""
+        return self.ghost_type.name
+
+    @property
+    def color(self) -> tuple[int, int, int]:
+        """RGB colour of the personality."""
+        return self.ghost_type.value
+
+    @property
+    def grid_pos(self) -> tuple[int, int]:
+        """The (row, col) tile the ghost stands on or leaves."""
+        return self.row, self.col
+
+    @property
+    def rect(self) -> pg.Rect:
+        """A fresh hitbox; unlike a Ghost's, moving it does not move the ghost."""
+        return pg.Rect(int(self.x), int(self.y), SPRITE_SIZE, SPRITE_SIZE)
+
+    def render_rect(self, alpha: float = 1.0) -> pg.Rect:
+        """Hitbox ``alpha`` of the way from the previous tick's position to the current one."""
+        if alpha >= 1.0:
+            return self.rect
+        return pg.Rect(int(interpolate(self.prev_x, self.x, alpha)), int(interpolate(self.prev_y, self.y, alpha)),
+                       SPRITE_SIZE, SPRITE_SIZE)
+
+    def remember_position(self) -> None:
+        """Store the current position as the start of the next interpolation."""
+        self.prev_x = self.x
+        self.prev_y = self.y
+
+    def start_death(self) -> None:
+        """Kill this ghost, as ``Ghost.start_death``."""
+        mask = np.zeros(self.swarm.size, dtype=bool)
+        mask[self.index] = True
+        self.swarm.start_death(mask)
+
+    def draw(self, screen: pg.Surface, alpha: float = 1.0) -> None:
+        """Draw this ghost unless it is dead."""
+        self.swarm.draw(screen, alpha, indices=(self.index,))
@@ -1,22 +1,30 @@
 # pylint: disable=missing-docstring, redefined-outer-name, protected-access, too-many-positional-arguments, too-many-arguments
-from unittest.mock import patch, MagicMock
+import os
+from unittest.mock import patch
 
 import pytest
 import pygame as pg
 
 import settings as s
-from assets import SpriteManager
+from assets import SpriteManager, resolve_path
 
 
 @pytest.fixture
-@patch('os.path.exists', return_value=False)
-def manager(mock_exists):  # pylint: disable=unused-argument
+@patch('assets.resolve_path', return_value=None)
+def manager(mock_resolve):  # pylint: disable=unused-argument
     """
-    Creates a SpriteManager where all file checks return False.
+    Creates a SpriteManager where no asset file can be found.
     This safely forces the manager to generate its dummy magenta Pygame Surfaces
     instead of crashing if real image files are missing during testing.
     """
-    return SpriteManager()
+    sm = SpriteManager(cache_dir=None)
+    sm._load_and_process_sprites()
+    return sm
+
+
+@pytest.fixture
+def display():
+    pg.display.set_mode((1, 1))
 
 
 class TestSpriteManager:
@@ -35,32 +43,56 @@ class TestSpriteManager:
         # Pygame colors include an alpha channel by default (255)
         assert sprite.get_at((0, 0)) == (150, 0, 150, 255)
 
-    @patch('os.path.exists', return_value=True)
-    @patch('pygame.image.load')
-    @patch('pygame.transform.scale')
-    def test_successful_sprite_loading(self, mock_scale, mock_load, mock_exists):  # pylint: disable=unused-argument
-        # Mock the loaded image and its convert() method
-        mock_image = MagicMock()
-        mock_load.return_value = mock_image
-        mock_image.convert.return_value = mock_image
-
-        # Mock the scaled image that gets returned at the end
-        mock_scaled = MagicMock()
-        mock_scale.return_value = mock_scaled
-
-        # Initialize the manager
-        sm = SpriteManager()
-
-        # Assertions to ensure Pygame processes the image correctly
-        assert mock_load.called
-        mock_image.convert.assert_called()
-        mock_image.set_colorkey.assert_called_with((0, 0, 0))
-
-        # Ensure scaling logic was triggered with the correct math (-4)
-        mock_scale.assert_called_with(mock_image, (s.TILE_SIZE - 4, s.TILE_SIZE - 4))
-
-        # Verify the final stored sprite is the mocked scaled image
-        assert sm.frightened_sprite == mock_scaled
+    def test_resolve_path_ignores_case(self):
+        path = resolve_path("assets", "sprites", "blinky_up.png")
+        assert path is not None
+        assert os.path.basename(path) == "Blinky_up.png"
+        assert resolve_path("assets", "sprites", "missing.png") is None
+
+    def test_sprites_are_loaded_lazily(self, display):  # pylint: disable=unused-argument
+        sm = SpriteManager(cache_dir=None)
+        assert sm.atlas is None
+
+        sprite = sm.get_ghost_image('blinky', s.Direction.UP, frightened=False)
+        assert sm.atlas is not None
+        assert sprite.get_size() == (s.TILE_SIZE - 4, s.TILE_SIZE - 4)
+        assert "total" in sm.timings
+
+    def test_sprites_are_views_into_one_atlas(self, display):  # pylint: disable=unused-argument
+        sm = SpriteManager(cache_dir=None)
+        sprites = [img for images in sm.ghost_sprites.values() for img in images.values()]
+        sprites.append(sm.frightened_sprite)
+
+        assert len(sprites) == 4 * len(s.GhostType) + 1
+        assert all(img.get_parent() is sm.atlas for img in sprites)
+        assert sm.frightened_sprite.get_colorkey()[:3] == (0, 0, 0)
+
+    def test_sheet_is_used_when_sprite_file_missing(self, display):  # pylint: disable=unused-argument
+        def only_sheet(*parts, **kwargs):
+            return resolve_path(*parts, **kwargs) if parts[-1] == "GeneralSprites.png" else None
+
+        from_files = SpriteManager(cache_dir=None)
+        from_files._load_and_process_sprites()
+        with patch('assets.resolve_path', side_effect=only_sheet):
+            from_sheet = SpriteManager(cache_dir=None)
+            from_sheet._load_and_process_sprites()
+
+        assert pg.image.tobytes(from_sheet.atlas, "RGB") == pg.image.tobytes(from_files.atlas, "RGB")
+
+    def test_atlas_is_cached_on_disk(self, display, tmp_path):  # pylint: disable=unused-argument
+        first = SpriteManager(cache_dir=str(tmp_path))
+        first._load_and_process_sprites()
+        assert first.atlas_source == "files"
+        assert len(list(tmp_path.iterdir())) == 1
+
+        with patch('pygame.image.load') as mock_load:
+            second = SpriteManager(cache_dir=str(tmp_path))
+            second._load_and_process_sprites()
+            mock_load.assert_not_called()
+
+        assert second.atlas_source == "cache"
+        assert "cache_load" in second.timings
+        assert pg.image.tobytes(second.atlas, "RGB") == pg.image.tobytes(first.atlas, "RGB")
 
     def test_get_ghost_image_frightened(self, manager):
         img = manager.get_ghost_image('blinky', s.Direction.UP, frightened=True)
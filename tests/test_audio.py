@@ -0,0 +1,63 @@
+# pylint: disable=missing-docstring, redefined-outer-name, protected-access
+import pygame as pg
+import pytest
+
+from audio import AudioManager
+
+
+@pytest.fixture
+def audio():
+    pg.mixer.init()
+    manager = AudioManager(effect_channels=2)
+    assert manager.wait_ready(timeout=10)
+    yield manager
+    pg.mixer.stop()
+
+
+def test_every_sound_has_a_future(audio):
+    assert set(audio.futures) == {"intro", "munch", "eat_ghost", "death", "siren", "frightened"}
+    assert all(isinstance(audio.get(key), pg.mixer.Sound) for key in audio.futures)
+
+
+def test_loops_use_reserved_channels(audio):
+    channel = audio.play("siren", -1)
+    assert channel is audio.loop_channels["siren"]
+    assert audio.play("frightened", -1) is audio.loop_channels["frightened"]
+
+
+def test_same_effect_is_not_stacked(audio):
+    assert audio.play("munch") is not None
+    assert audio.play("munch") is None
+    assert audio.frame_stats["coalesced"] == 1
+
+
+def test_higher_priority_preempts_lower(audio):
+    audio.play("munch")
+    audio.play("eat_ghost")
+    channel = audio.play("death")
+
+    assert channel is audio.effect_channels[0]
+    assert audio._playing[0] == (3, "death")
+    assert audio.frame_stats["preempted"] == 1
+
+
+def test_lower_priority_is_dropped_when_pool_is_full(audio):
+    audio.play("death")
+    audio.play("eat_ghost")
+    assert audio.play("munch") is None
+    assert audio.frame_stats["dropped"] == 1
+
+
+def test_sound_still_loading_is_skipped(audio):
+    audio.futures["munch"] = type(audio.futures["munch"])()
+    assert audio.play("munch") is None
+    assert audio.frame_stats["not_ready"] == 1
+
+
+def test_begin_frame_returns_previous_stats(audio):
+    audio.play("siren", -1)
+    previous = audio.begin_frame()
+
+    assert previous["played"] == 1
+    assert audio.frame_stats["played"] == 0
+    assert audio.totals["played"] == 1
@@ -0,0 +1,111 @@
+# pylint: disable=missing-docstring, redefined-outer-name, protected-access
+import random
+
+import numpy as np
+import pytest
+
+import settings as s
+from batch import BatchEnv
+from game import Game
+from maze import generate_maze
+from swarm import DIRECTION_CODES
+
+
+def _scripted_actions(seed, ticks):
+    rng = random.Random(seed + 1000)
+    return [rng.choice([0, 0, 0, 1, 2, 3, 4]) for _ in range(ticks)]
+
+
+def _ghost_state(env, i):
+    return (
+        env.ghost_row[i], env.ghost_col[i], env.ghost_x[i], env.ghost_y[i],
+        DIRECTION_CODES[env.ghost_direction[i]],
+        env.ghost_frightened[i], env.ghost_dead[i], env.ghost_in_house[i],
+    )
+
+
+@pytest.mark.parametrize("seed", [0, 3, 17, 39])
+def test_batch_matches_scalar_game_tick_for_tick(seed):
+    actions = _scripted_actions(seed, 3000)
+    game = Game(headless=True, seed=seed)
+    game._start_game()
+    env = BatchEnv(3, seeds=[seed, 1, 2])
+
+    for tick, action in enumerate(actions):
+        game.step(lambda _game, a=action: DIRECTION_CODES[a] if a else None)
+        _, dead = env.step([action, 2, 4])
+
+        if game.state != s.STATE_PLAYING:
+            assert dead[0], tick
+            break
+        pacman = game.pacman
+        assert (pacman.row, pacman.col, pacman.x, pacman.y) == (
+            env.pacman_row[0], env.pacman_col[0], env.pacman_x[0], env.pacman_y[0]
+        ), tick
+        for i, ghost in enumerate(game.ghosts_list):
+            assert (
+                ghost.row, ghost.col, ghost.x, ghost.y, ghost.direction,
+                ghost.frightened, ghost.dead, ghost.in_house,
+            ) == _ghost_state(env, i), (tick, ghost.name)
+        assert game.level.score == env.score[0]
+        assert len(game.level.coins) == env.coin_count[0]
+
+
+def test_cleared_level_resets_board_and_keeps_score():
+    env = BatchEnv(2)
+    env.coins[0] = False
+    env.coin_count[0] = 0
+    env.score[0] = 1234
+
+    env.step()
+
+    assert env.coin_count[0] == env.coin_count[1]
+    assert env.score[0] == 1234
+
+
+def test_dead_games_reset_automatically():
+    env = BatchEnv(2)
+    env.ghost_x[0], env.ghost_y[0] = env.pacman_x[0], env.pacman_y[0]
+    env.ghost_row[0], env.ghost_col[0] = env.pacman_row[0], env.pacman_col[0]
+
+    _, dead = env.step()
+
+    assert dead.tolist() == [True, False]
+    assert env.pacman_alive.all()
+    assert env.ghost_view("ghost_row")[0].tolist() == [row for _, row, _, _ in s.GHOST_SPAWNS]
+
+
+def test_pill_frightens_every_ghost_of_that_game_only():
+    env = BatchEnv(2)
+    env.pacman_row[:] = 1
+    env.pacman_col[:] = 1
+    env.pacman_x[:] = env.pacman_y[:] = s.TILE_SIZE
+    env.pills_eaten[1] = True
+
+    rewards, _ = env.step()
+
+    assert env.ghost_view("ghost_frightened")[0].all()
+    assert not env.ghost_view("ghost_frightened")[1].any()
+    # A stationary Pac-Man does not pick up coins, only the pill
+    assert rewards[0] == s.PILL_SCORE_VALUE
+    assert np.array_equal(env.pills_eaten[0], [True, False, False, False])
+
+
+def test_batch_plays_a_maze_from_its_own_spawns_and_pills():
+    maze = generate_maze(25, 31, seed=2)
+    game = Game(headless=True, seed=5, maze=maze)
+    game._start_game()
+    env = BatchEnv(2, seeds=[5, 6], maze=maze)
+
+    assert (env.pacman_row[0], env.pacman_col[0]) == maze.pacman_spawn
+    assert list(zip(env._pill_rows, env._pill_cols)) == list(maze.pills)
+    assert env.coin_count[0] == len(game.level.coins)
+    for action in _scripted_actions(5, 1500):
+        game.step(lambda _game, a=action: DIRECTION_CODES[a] if a else None)
+        _, dead = env.step([action, 0])
+        if game.state != s.STATE_PLAYING:
+            assert dead[0]
+            break
+        assert [(g.row, g.col) for g in game.ghosts_list] == \
+            list(zip(env.ghost_view("ghost_row")[0], env.ghost_view("ghost_col")[0]))
+        assert (game.level.score, len(game.level.coins)) == (env.score[0], env.coin_count[0])
@@ -0,0 +1,58 @@
+# pylint: disable=missing-docstring, redefined-outer-name, protected-access
+import itertools
+import json
+
+import bench
+
+
+def _results(**values):
+    return {"results": {
+        name: {"value": value, "unit": "", "higher_is_better": name != "draw"} for name, value in values.items()
+    }}
+
+
+def test_compare_flags_slower_rates_and_durations():
+    baseline = _results(update=1000.0, draw=1.0)
+
+    assert not bench.compare(_results(update=900.0, draw=1.1), baseline, threshold=0.25)
+    regressions = bench.compare(_results(update=700.0, draw=1.5), baseline, threshold=0.25)
+    assert len(regressions) == 2
+
+
+def test_compare_skips_workloads_missing_from_baseline():
+    assert not bench.compare(_results(update=1.0), {"results": {}})
+
+
+def test_main_writes_results_and_detects_regression(tmp_path, mocker):
+    # Every timed repeat takes one clock unit, so the results do not depend on the machine
+    clock = itertools.count()
+    mocker.patch("bench.time.perf_counter", lambda: next(clock))
+    output = tmp_path / "out.json"
+    baseline = tmp_path / "baseline.json"
+    args = ["pacman_update", "level_draw", "--scale", "200", "--repeats", "1", "--baseline", str(baseline)]
+
+    assert bench.main(args + ["--update-baseline"]) == 0
+    assert bench.main(args + ["--output", str(output)]) == 0
+    assert set(json.loads(output.read_text())["results"]) == {"pacman_update", "level_draw"}
+
+    stored = json.loads(baseline.read_text())
+    stored["results"]["pacman_update"]["value"] *= 100
+    baseline.write_text(json.dumps(stored))
+    assert bench.main(args) == 1
+
+
+def test_setup_runs_before_every_repeat_outside_the_timing(mocker):
+    clock = iter(range(100))
+    mocker.patch("bench.time.perf_counter", lambda: next(clock))
+    calls = []
+
+    def setup():
+        calls.append("setup")
+        next(clock)  # setup takes a whole time unit, which must not be counted
+
+    def run():
+        calls.append("run")
+        return 10
+
+    assert bench._best_rate(run, 2, setup) == 10.0
+    assert calls == ["setup", "run", "setup", "run"]
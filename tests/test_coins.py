@@ -0,0 +1,43 @@
+# pylint: disable=missing-docstring, redefined-outer-name
+import pytest
+
+import settings as s
+from coins import CoinGrid
+from grid import MazeGrid
+
+
+@pytest.fixture
+def coins():
+    return CoinGrid.for_grid(MazeGrid(["101", "000", "1-1"]))
+
+
+def test_coins_on_path_tiles_only(coins):
+    assert sorted(coins) == [(0, 1), (1, 0), (1, 1), (1, 2)]
+    assert len(coins) == 4
+
+
+def test_membership_by_position(coins):
+    assert (1, 1) in coins
+    assert (2, 1) not in coins
+    assert (1, -1) not in coins
+    assert (1, 3) not in coins
+
+
+def test_take_updates_count_and_eaten_log(coins):
+    assert coins.take(1, 1) is True
+    assert coins.take(1, 1) is False
+
+    assert len(coins) == 3
+    assert (1, 1) not in coins
+    assert coins.eaten == [4]
+
+
+def test_remove_missing_coin_raises(coins):
+    with pytest.raises(KeyError):
+        coins.remove((2, 1))
+
+
+def test_classic_layout_coin_count():
+    grid = MazeGrid.from_layout(s.LAYOUT)
+    expected = sum(row.count("0") for row in s.LAYOUT)
+    assert len(CoinGrid.for_grid(grid)) == expected
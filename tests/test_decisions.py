@@ -0,0 +1,65 @@
+# pylint: disable=missing-docstring, redefined-outer-name, protected-access
+import pytest
+
+import settings as s
+from bench import cycling_policy
+from decisions import DecisionCache
+from game import Game
+from ghosts import Ghost
+from grid import MazeGrid
+from maze import classic_maze
+
+
+@pytest.fixture(autouse=True)
+def fresh_caches():
+    DecisionCache.invalidate()
+    yield
+    DecisionCache.invalidate()
+
+
+def test_lru_evicts_the_least_recently_used_decision():
+    cache = DecisionCache(capacity=2)
+    cache.put("a", s.Direction.UP)
+    cache.put("b", s.Direction.LEFT)
+    assert cache.get("a") is s.Direction.UP
+    cache.put("c", s.Direction.DOWN)  # evicts "b"
+
+    assert cache.get("b") is None
+    assert cache.get("c") is s.Direction.DOWN
+    assert cache.stats() == {"entries": 2, "hits": 2, "misses": 1, "evictions": 1, "hit_rate": 2 / 3}
+
+
+def test_caches_are_per_layout_and_invalidated_per_layout():
+    classic = MazeGrid.from_layout(s.LAYOUT)
+    small = MazeGrid(["000", "000", "000"])
+    cache = DecisionCache.for_grid(classic)
+
+    assert DecisionCache.for_grid(MazeGrid(s.LAYOUT)) is cache
+    assert DecisionCache.for_grid(small) is not cache
+
+    small_cache = DecisionCache.for_grid(small)
+    cache.put("key", s.Direction.UP)
+    small_cache.put("key", s.Direction.UP)
+    DecisionCache.invalidate(classic)
+
+    assert len(cache) == 0 and len(small_cache) == 1
+    assert DecisionCache.for_grid(classic) is cache
+
+
+@pytest.mark.parametrize("path_distance", [False, True])
+def test_cached_decisions_match_fresh_ones(monkeypatch, path_distance):
+    monkeypatch.setattr(s, "GHOST_PATH_DISTANCE", path_distance)
+    choose = Ghost._choose_best_direction
+    agreed = []
+
+    def checked(ghost, target_row, target_col):
+        direction = choose(ghost, target_row, target_col)
+        agreed.append(direction == ghost._compute_best_direction(target_row, target_col))
+        return direction
+
+    monkeypatch.setattr(Ghost, "_choose_best_direction", checked)
+    for seed in range(5):
+        Game(headless=True, seed=seed).simulate(3000, cycling_policy)
+
+    assert agreed and all(agreed)
+    assert DecisionCache.for_grid(classic_maze().grid).stats()["hit_rate"] > 0.5
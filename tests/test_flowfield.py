@@ -0,0 +1,116 @@
+# pylint: disable=missing-docstring, redefined-outer-name, protected-access
+from collections import deque
+
+import pytest
+
+import settings as s
+from flowfield import STEPS, UNREACHABLE, FlowFields
+from game import Game
+from grid import DIRECTIONS, MazeGrid, TILE_DOOR, TILE_WALL
+
+
+@pytest.fixture
+def grid():
+    return MazeGrid.from_layout(s.LAYOUT)
+
+
+@pytest.fixture
+def fields(grid):
+    return FlowFields(grid)
+
+
+def _bfs(grid, start):
+    dist = {start: 0}
+    queue = deque([start])
+    while queue:
+        idx = queue.popleft()
+        r, c = divmod(idx, grid.cols)
+        for d in DIRECTIONS:
+            nxt = grid.neighbors[d.value][idx]
+            if grid.ghost_can_move(r, c, d, False) and nxt not in dist:
+                dist[nxt] = dist[idx] + 1
+                queue.append(nxt)
+    return dist
+
+
+@pytest.fixture(scope="module")
+def reference():
+    # Path length between every pair of ghost-walkable tiles, one search per source
+    grid = MazeGrid.from_layout(s.LAYOUT)
+    walkable = [idx for idx, kind in enumerate(grid.kinds) if kind not in (TILE_WALL, TILE_DOOR)]
+    return walkable, {idx: _bfs(grid, idx) for idx in walkable}
+
+
+def _reference_target(grid, walkable, row, col):
+    row = min(max(row, 0), grid.rows - 1)
+    col = min(max(col, 0), grid.cols - 1)
+    return min(walkable, key=lambda idx: ((idx // grid.cols - row) ** 2 + (idx % grid.cols - col) ** 2, idx))
+
+
+def _reference_decision(grid, paths, idx, heading, target):
+    # Ghost._choose_best_direction as it was written against all-pairs path lengths
+    r, c = divmod(idx, grid.cols)
+    options = [d for d in DIRECTIONS if grid.ghost_can_move(r, c, d, False)
+               and not (heading != s.Direction.STOP and d.value == (-heading.value[0], -heading.value[1]))]
+    if not options:
+        reverse = s.Direction((-heading.value[0], -heading.value[1]))
+        if heading != s.Direction.STOP and grid.ghost_can_move(r, c, reverse, False):
+            return reverse
+        return s.Direction.STOP
+    return min(options, key=lambda d: paths[grid.neighbors[d.value][idx]].get(target, UNREACHABLE))
+
+
+def test_fields_match_breadth_first_search(grid, fields, reference):
+    walkable, paths = reference
+    for target in walkable[::7]:
+        field = fields.toward(*divmod(target, grid.cols))
+        expected = [paths[idx].get(target, UNREACHABLE) if idx in paths else UNREACHABLE
+                    for idx in range(grid.rows * grid.cols)]
+        assert field.dist.tolist() == expected
+
+
+def test_tunnel_wrap_is_one_step(grid, fields):
+    assert fields.toward(9, grid.cols - 1).dist[grid.index(9, 0)] == 1
+
+
+def test_decisions_match_the_reference_steering(grid, fields, reference):
+    walkable, paths = reference
+    for row, col in ((1, 1), (9, 0), (-2, grid.cols - 3), (grid.rows + 1, 0)):
+        target = _reference_target(grid, walkable, row, col)
+        field = fields.toward(row, col)
+        assert field.target == target
+        for idx in walkable:
+            for heading in STEPS:
+                assert field.direction(idx, heading) == _reference_decision(grid, paths, idx, heading, target)
+
+
+def test_fields_are_cached_per_target_with_lru_eviction(grid):
+    fields = FlowFields(grid, capacity=2)
+    first = fields.toward(1, 1)
+
+    assert fields.toward(1, 1) is first
+    fields.toward(1, 2)
+    fields.toward(1, 1)
+    fields.toward(1, 3)  # evicts (1, 2), the least recently used
+
+    assert fields.toward(1, 1) is first
+    stats = fields.stats()
+    assert stats["fields"] == 2 and stats["builds"] == 3 and stats["hits"] == 3
+    assert stats["hit_rate"] == 0.5 and stats["build_seconds"] > 0
+    fields.toward(1, 2)
+    assert fields.builds == 4
+
+
+def test_ghosts_on_one_maze_share_the_fields():
+    game = Game(headless=True, seed=2)
+    game._start_game()
+    for ghost in game.ghosts_list:
+        ghost.path_distance = True
+    fields = game.blinky.flow_fields
+    builds = fields.builds
+
+    game.simulate(400, lambda g: (s.Direction.LEFT, s.Direction.RIGHT)[g.tick // 60 % 2])
+
+    assert all(ghost.flow_fields is fields for ghost in game.ghosts_list)
+    assert FlowFields.for_grid(game.level.grid) is fields
+    assert fields.hits > fields.builds - builds
@@ -37,3 +37,139 @@ def test_game_reset_creates_objects(game_instance):
     assert game_instance.pacman is not None
     assert len(game_instance.ghosts_list) == 4
     assert game_instance.state == s.STATE_MENU  # Check that reset does not change the state by itself
+
+
+# Headless Simulation
+@pytest.fixture
+def headless_game():
+    return Game(headless=True)
+
+
+def test_headless_game_has_no_display_or_audio(headless_game):
+    assert headless_game.screen is None
+    assert headless_game.audio is None
+    assert headless_game.menu_screen is None
+
+
+def test_headless_step_advances_without_intro_delay(headless_game):
+    headless_game._start_game()
+    headless_game.pacman.next_direction = s.Direction.LEFT
+
+    for _ in range(s.TILE_SIZE // s.BASE_SPEED):
+        headless_game.step()
+
+    assert headless_game.pacman.col == 8
+    assert headless_game.level.score > 0
+
+
+def test_headless_simulate_reports_throughput(headless_game):
+    stats = headless_game.simulate(50, policy=lambda game: s.Direction.RIGHT)
+
+    assert stats["ticks"] == 50
+    assert stats["ticks_per_second"] > 0
+    assert stats["score"] > 0
+
+
+# Seeded RNG and Tick Clock
+def _play(game, ticks):
+    game._start_game()
+    for _ in range(ticks):
+        game.step(lambda g: s.Direction.LEFT if g.tick % 90 < 45 else s.Direction.UP)
+    return [(g.row, g.col, g.x, g.y, g.direction) for g in game.ghosts_list], game.level.score
+
+
+def test_same_seed_reproduces_the_run():
+    assert _play(Game(headless=True, seed=5), 900) == _play(Game(headless=True, seed=5), 900)
+
+
+def test_ghosts_share_the_game_rng(headless_game):
+    headless_game._reset_game()
+    assert all(g.rng is headless_game.rng for g in headless_game.ghosts_list)
+
+
+def test_intro_is_counted_in_ticks(game_instance):
+    game_instance._start_game()
+    game_instance.pacman.next_direction = s.Direction.LEFT
+
+    for _ in range(s.INTRO_TICKS):
+        game_instance._update()
+    assert game_instance.tick == 0
+    assert game_instance.pacman.x == game_instance.pacman.col * s.TILE_SIZE
+
+    game_instance._update()
+    assert game_instance.tick == 1
+    assert game_instance.pacman.moving
+
+
+def test_settings_screen_is_built_on_first_open(game_instance):
+    assert game_instance._settings_screen is None
+
+    screen = game_instance.settings_screen
+    assert screen is not None
+    assert game_instance.settings_screen is screen
+
+
+def test_startup_phases_are_timed(game_instance):
+    assert {"pygame init", "display", "main menu"} <= set(game_instance.startup.phases)
+
+
+# Fixed Timestep
+def test_advance_runs_whole_ticks_and_keeps_remainder(headless_game):
+    headless_game._start_game()
+
+    alpha = headless_game._advance(2.5 * headless_game.tick_seconds)
+    assert headless_game.tick == 2
+    assert alpha == pytest.approx(0.5)
+
+    headless_game._advance(0.5 * headless_game.tick_seconds)
+    assert headless_game.tick == 3
+
+
+def test_advance_caps_catch_up_after_hitch(headless_game):
+    headless_game._start_game()
+
+    headless_game._advance(1.0)
+    assert headless_game.tick == s.MAX_CATCHUP_TICKS
+    assert headless_game.dropped_ticks == s.FPS - s.MAX_CATCHUP_TICKS
+    assert headless_game.accumulator < 1
+
+
+def test_render_position_interpolates_between_ticks(headless_game):
+    headless_game._start_game()
+    headless_game.pacman.next_direction = s.Direction.LEFT
+    headless_game._advance(headless_game.tick_seconds)
+
+    pacman = headless_game.pacman
+    x, _ = pacman.render_position(0.5)
+    assert x == int(pacman.prev_x + (pacman.x - pacman.prev_x) / 2)
+    assert pacman.render_position() == (int(pacman.x), int(pacman.y))
+    assert headless_game.blinky.render_rect(0.0).x == int(headless_game.blinky.prev_x)
+
+
+def test_pills_blink_with_logic_ticks_not_frames(game_instance):
+    game_instance._start_game()
+    game_instance.intro_ticks_left = 0
+    pill = game_instance.level.pills[0]
+
+    for _ in range(5):
+        game_instance._draw(0.5)
+    assert pill.blink_timer == 0
+
+    game_instance._advance(3 * game_instance.tick_seconds)
+    assert pill.blink_timer == 3
+
+
+def test_background_loop_is_retried_until_it_is_decoded(game_instance, monkeypatch):
+    monkeypatch.setitem(s.CONFIG, "MUSIC_ON", True)
+    game_instance._start_game()
+    game_instance.intro_ticks_left = 0
+    assert game_instance.audio.wait_ready(timeout=10)
+    decoded = game_instance.audio.futures["siren"]
+    game_instance.audio.futures["siren"] = type(decoded)()
+
+    game_instance.step()
+    assert game_instance.current_bg_sound is None
+
+    game_instance.audio.futures["siren"] = decoded
+    game_instance.step()
+    assert game_instance.current_bg_sound == "siren"
@@ -6,6 +6,7 @@ import pygame as pg
 
 import settings as s
 from ghosts import Ghost
+from grid import MazeGrid
 from level import Level
 from pacman import Pacman
 
@@ -16,7 +17,7 @@ def mock_level():
     level = MagicMock(spec=Level)
     # Simulate an empty 3x3 layout by default, where everything is non-wall '0'
     level.layout = [["0", "0", "0"] for _ in range(3)]
-    level.is_wall.return_value = False
+    level.grid = MazeGrid(level.layout)
     return level
 
 
@@ -54,6 +55,7 @@ class TestGhostTargets:
     ])
     def test_get_scatter_target(self, mock_level, mock_sprite_manager, ghost_type, expected_target):
         # Arrange
+        mock_level.grid = MazeGrid.from_layout(s.LAYOUT)
         ghost = Ghost(5, 5, ghost_type, mock_level, mock_sprite_manager)
 
         # Act
@@ -110,17 +112,37 @@ class TestGhostMovement:
     ])
     def test_can_move_to_standard(self, default_ghost, mock_level, direction, dy, dx, is_wall_result, will_move):
         # Arrange
-        mock_level.is_wall.return_value = is_wall_result
+        layout = [["0", "0", "0"] for _ in range(3)]
+        if is_wall_result:
+            layout[1 + dy][1 + dx] = "1"
+        mock_level.grid = MazeGrid(layout)
 
         # Act
         result = default_ghost.can_move_to(direction)
 
         # Assert
         assert result == will_move
-        # Verify it queries the wrapped position
-        expected_wrapped_row, expected_wrapped_col = default_ghost._wrapped_coords(1 + dy, 1 + dx)
-        if not is_wall_result and default_ghost.level.layout[expected_wrapped_row][expected_wrapped_col] != "=":
-            mock_level.is_wall.assert_called_with(expected_wrapped_row, expected_wrapped_col)
+
+    def test_can_move_to_door_only_from_house(self, default_ghost, mock_level):
+        # Arrange
+        mock_level.grid = MazeGrid(["000", "0=0", "000"])
+        default_ghost.row, default_ghost.col = 0, 1
+
+        # Act / Assert
+        default_ghost.in_house = False
+        assert default_ghost.can_move_to(s.Direction.DOWN) is False
+        default_ghost.in_house = True
+        assert default_ghost.can_move_to(s.Direction.DOWN) is True
+
+    def test_can_move_to_wraps_around_edges(self, default_ghost, mock_level):
+        # Arrange
+        mock_level.grid = MazeGrid(["111", "001", "111"])
+        default_ghost.row, default_ghost.col = 1, 0
+
+        # Act / Assert
+        assert default_ghost.can_move_to(s.Direction.LEFT) is False
+        mock_level.grid = MazeGrid(["111", "000", "111"])
+        assert default_ghost.can_move_to(s.Direction.LEFT) is True
 
     def test_start_move(self, default_ghost):
         # Act
@@ -193,3 +215,31 @@ class TestGhostStateTransitions:
         default_ghost._update_frightened_state()
         assert default_ghost.timer == 0
         assert default_ghost.frightened is False
+
+
+class TestGhostPathDistance:
+    """Ghosts steering by shortest path instead of straight-line distance."""
+
+    @pytest.fixture
+    def dead_end_level(self):
+        # Straight-line distance favours the dead end below (2, 1); the path goes over the top
+        level = MagicMock(spec=Level)
+        level.grid = MazeGrid([
+            "11111",
+            "10001",
+            "10101",
+            "10101",
+            "11111",
+        ])
+        return level
+
+    def test_euclidean_walks_into_dead_end(self, dead_end_level, mock_sprite_manager):
+        ghost = Ghost(2, 1, s.GhostType.BLINKY, dead_end_level, mock_sprite_manager, path_distance=False)
+        assert ghost._choose_best_direction(3, 3) == s.Direction.DOWN
+
+    def test_path_distance_goes_around_wall(self, dead_end_level, mock_sprite_manager):
+        ghost = Ghost(2, 1, s.GhostType.BLINKY, dead_end_level, mock_sprite_manager, path_distance=True)
+        assert ghost._choose_best_direction(3, 3) == s.Direction.UP
+
+    def test_path_distance_defaults_to_setting(self, default_ghost):
+        assert default_ghost.path_distance is s.GHOST_PATH_DISTANCE
@@ -0,0 +1,54 @@
+# pylint: disable=missing-docstring, redefined-outer-name, protected-access
+import pytest
+
+import settings as s
+from grid import MazeGrid, TILE_PATH, TILE_WALL, TILE_DOOR, TILE_HOUSE, layout_hash
+
+
+@pytest.fixture
+def grid():
+    return MazeGrid.from_layout(s.LAYOUT)
+
+
+def test_tile_kinds_match_layout(grid):
+    symbols = {"0": TILE_PATH, "1": TILE_WALL, "=": TILE_DOOR, "-": TILE_HOUSE}
+    for r, row in enumerate(s.LAYOUT):
+        for c, tile in enumerate(row):
+            assert grid.kind(r, c) == symbols[tile]
+
+
+def test_from_layout_is_shared():
+    assert MazeGrid.from_layout(s.LAYOUT) is MazeGrid.from_layout(list(s.LAYOUT))
+
+
+def test_tunnel_rows_are_derived(grid):
+    assert grid.tunnel_rows == frozenset({9})
+
+
+def test_pacman_moves_through_tunnel(grid):
+    assert grid.pacman_can_move(9, 0, s.Direction.LEFT)
+    assert grid.pacman_can_move(9, s.COLS - 1, s.Direction.RIGHT)
+    assert not grid.pacman_can_move(1, 1, s.Direction.UP)
+
+
+def test_pacman_cannot_enter_door_or_house(grid):
+    assert not grid.pacman_can_move(7, 9, s.Direction.DOWN)
+    assert not grid.pacman_can_move(9, 7, s.Direction.RIGHT)
+
+
+def test_ghost_door_rules(grid):
+    assert not grid.ghost_can_move(7, 9, s.Direction.DOWN, in_house=False)
+    assert grid.ghost_can_move(9, 9, s.Direction.UP, in_house=True)
+
+
+def test_is_wall_out_of_bounds(grid):
+    assert not grid.is_wall(-1, 0)
+    assert not grid.is_wall(s.ROWS, s.COLS)
+    assert grid.is_wall(0, 0)
+
+
+def test_layout_hash_depends_only_on_the_tiles(grid):
+    assert layout_hash(MazeGrid(list(s.LAYOUT))) == layout_hash(grid)
+    changed = [list(row) for row in s.LAYOUT]
+    changed[1][1] = "1"
+    assert layout_hash(MazeGrid(changed)) != layout_hash(grid)
@@ -1,6 +1,10 @@
 import pytest
+import pygame as pg
+import level as level_module
 from level import Level
+from maze import load_maze, LEVELS_DIR
 from unittest.mock import Mock
+import settings as s
 
 @pytest.fixture
 def level():
@@ -43,13 +47,13 @@ def test_is_wall_out_of_bounds():
 
 
 def test_check_pills_calls_pill_collision():
-    """Test that pill collision is triggered."""
+    """Test that pill collision is triggered for the pill under Pac-Man."""
     level = Level()
 
-    mock_pill = Mock()
+    mock_pill = Mock(row=1, col=1)
     level.pills = [mock_pill]
 
-    pacman = Mock()
+    pacman = Mock(grid_pos=(1, 1))
     ghosts = []
 
     level.check_pills(pacman, ghosts)
@@ -57,7 +61,74 @@ def test_check_pills_calls_pill_collision():
     mock_pill.check_collision.assert_called_once_with(pacman, ghosts, level)
 
 
+def test_check_pills_skips_pills_elsewhere():
+    """Test that pills away from Pac-Man are not checked."""
+    level = Level()
+
+    mock_pill = Mock(row=1, col=1)
+    level.pills = [mock_pill]
+
+    level.check_pills(Mock(grid_pos=(5, 5)), [])
+
+    mock_pill.check_collision.assert_not_called()
+
+
 def test_level_keeps_score():
     """Test that score is preserved."""
     level = Level(score=100)
-    assert level.score == 100
\ No newline at end of file
+    assert level.score == 100
+
+def test_background_is_built_once(monkeypatch):
+    """Test that the static maze is rendered only on the first draw."""
+    level_module._backgrounds.clear()
+    level = Level()
+    screen = pg.Surface((s.SCREEN_WIDTH, s.SCREEN_HEIGHT))
+    build = Mock(wraps=level._build_background)
+    monkeypatch.setattr(level, "_build_background", build)
+
+    level.draw(screen)
+    level.draw(screen)
+
+    build.assert_called_once()
+
+
+def test_background_is_shared_by_levels_on_the_same_maze():
+    """Test that a new episode on the same maze reuses the rendered maze."""
+    first = Level().get_background()
+    from_file = Level(maze=load_maze(f"{LEVELS_DIR}/classic.txt"))
+
+    assert from_file.get_background() is first
+
+
+def test_pills_come_from_the_maze():
+    level = Level()
+
+    assert [(p.row, p.col) for p in level.pills] == [(1, 1), (1, s.COLS - 2), (s.ROWS - 2, 1), (s.ROWS - 2, s.COLS - 2)]
+
+
+def test_background_rebuilt_when_wall_color_changes(monkeypatch):
+    """Test that changing the wall colour invalidates the cached maze."""
+    level = Level()
+    first = level.get_background()
+
+    monkeypatch.setattr(s, "WALL_COLOR", (40, 0, 0))
+    second = level.get_background()
+
+    assert second is not first
+    path_center = (s.TILE_SIZE + s.TILE_SIZE // 2, s.TILE_SIZE + s.TILE_SIZE // 2)
+    assert second.get_at(path_center)[:3] == (40, 0, 0)
+    assert level.get_background() is second
+
+
+def test_eaten_coins_are_erased_from_the_board():
+    """Test that the cached board erases eaten coins without a full redraw."""
+    level = Level()
+    row, col = next(iter(level.coins))
+    center = (col * s.TILE_SIZE + s.TILE_SIZE // 2, row * s.TILE_SIZE + s.TILE_SIZE // 2)
+    board = level.get_board()
+    assert board.get_at(center)[:3] == s.COIN_COLOR
+
+    level.coins.take(row, col)
+
+    assert level.get_board() is board
+    assert board.get_at(center)[:3] == s.WALL_COLOR
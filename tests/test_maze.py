@@ -0,0 +1,84 @@
+# pylint: disable=missing-docstring, redefined-outer-name, protected-access
+import pytest
+
+import settings as s
+from game import Game
+from maze import LEVELS_DIR, MazeError, classic_maze, load_maze, parse_maze, resolve_maze
+
+SMALL = """
+# A small maze with a tunnel on row 6 and the house on row 4
+111111111
+1o00000o1
+101000101
+1011=1101
+101pic101
+101111101
+000000000
+1o00P00o1
+111111111
+"""
+
+
+def test_small_maze_derives_spawns_pills_and_house():
+    maze = parse_maze(SMALL)
+
+    assert maze.grid.rows == 9 and maze.grid.cols == 9
+    assert maze.pacman_spawn == (7, 4)
+    assert maze.pills == ((1, 1), (1, 7), (7, 1), (7, 7))
+    assert maze.grid.house_exit == (2, 4)
+    assert maze.grid.tunnel_rows == frozenset({6})
+    spawns = {ghost_type: (row, col) for ghost_type, row, col, _ in maze.ghost_spawns}
+    assert spawns == {
+        s.GhostType.BLINKY: (2, 4),  # no marker: starts on the house exit
+        s.GhostType.PINKY: (4, 3),
+        s.GhostType.INKY: (4, 4),
+        s.GhostType.CLYDE: (4, 5),
+    }
+    assert all(maze.grid.is_house(4, c) for c in (3, 4, 5))
+
+
+def test_parsed_mazes_are_cached_by_text():
+    assert parse_maze(SMALL) is parse_maze(SMALL)
+
+
+def test_classic_file_matches_the_built_in_maze():
+    from_file = load_maze(f"{LEVELS_DIR}/classic.txt")
+    classic = classic_maze()
+
+    assert from_file.key == classic.key
+    assert from_file.grid is classic.grid
+    assert from_file.ghost_spawns == classic.ghost_spawns
+    assert from_file.pills == classic.pills
+    assert resolve_maze("classic").key == classic.key
+    assert resolve_maze(None) is classic
+
+
+@pytest.mark.parametrize("text, problem", [
+    ("", "no rows"),
+    (SMALL.replace("1o00P00o1", "1o00P00o"), "row 7 is 8 tiles wide"),
+    (SMALL.replace("1o00P00o1", "1o00P00x1"), "unknown symbol 'x'"),
+    (SMALL.replace("P", "0"), "one Pac-Man spawn"),
+    (SMALL.replace("pic", "ppc"), "Pinky has 2 spawns"),
+    (SMALL.replace("=", "1"), "no door"),
+    (SMALL.replace("111111111\n1o0", "111101111\n1o0", 1), "border tile (0, 4)"),
+    (SMALL.replace("101111101", "111111111"), "cannot be reached"),
+])
+def test_invalid_mazes_are_rejected(text, problem):
+    with pytest.raises(MazeError) as error:
+        parse_maze(text, name="bad")
+
+    assert any(problem in message for message in error.value.problems)
+    assert "bad" in str(error.value)
+
+
+def test_game_runs_on_a_loaded_maze():
+    maze = parse_maze(SMALL)
+    game = Game(headless=True, seed=2, maze=maze)
+
+    stats = game.simulate(600, lambda g: (s.Direction.LEFT, s.Direction.RIGHT)[g.tick // 40 % 2])
+
+    assert stats["ticks"] == 600
+    assert game.level.maze is maze
+    assert game.observe().shape[1:] == (maze.grid.rows, maze.grid.cols)
+    # Every ghost has left the house through the door by now
+    assert not any(ghost.in_house for ghost in game.ghosts_list)
@@ -3,7 +3,7 @@ os.environ["SDL_VIDEODRIVER"] = "dummy"
 
 import pygame as pg
 import pytest
-from menu import Button, MainMenuScreen, SettingsScreen
+from menu import Button, MainMenuScreen, SettingsScreen, create_color_gradient
 
 
 @pytest.fixture(scope="session", autouse=True)
@@ -86,4 +86,22 @@ def test_back_button_calls_callback(mocker):
     screen.handle_event(pg.event.Event(pg.MOUSEBUTTONDOWN, {"pos": pos, "button": 1}))
     screen.handle_event(pg.event.Event(pg.MOUSEBUTTONUP, {"pos": pos, "button": 1}))
 
-    callback.assert_called_once()
\ No newline at end of file
+    callback.assert_called_once()
+
+def test_color_gradient_columns_are_solid():
+    gradient = create_color_gradient(40, 10)
+
+    assert gradient.get_size() == (40, 10)
+    for x in (0, 13, 39):
+        assert gradient.get_at((x, 0)) == gradient.get_at((x, 9))
+    expected = pg.Color(0)
+    expected.hsva = (13 / 40 * 360, 100, 100, 100)
+    assert gradient.get_at((13, 5)) == expected
+
+def test_screens_are_centred_on_the_given_size():
+    menu = MainMenuScreen(lambda: None, lambda: None, lambda: None, size=(1200, 900))
+    settings_screen = SettingsScreen(lambda: None, size=(1200, 900))
+
+    assert menu.play_btn.rect.centerx == 600
+    assert menu.gear_btn.rect.bottomright == (1200 - 18, 900 - 18)
+    assert settings_screen.toggle_music.rect.centerx == settings_screen.palette_rect.centerx == 600
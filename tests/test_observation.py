@@ -0,0 +1,109 @@
+# pylint: disable=missing-docstring, redefined-outer-name, protected-access
+import numpy as np
+import pygame as pg
+import pytest
+
+import settings as s
+from bench import cycling_policy
+from game import Game
+from observation import CH_COINS, CH_DEAD, CH_FRIGHTENED, CH_GHOSTS, CH_PACMAN, CH_PILLS, CH_WALLS, CHANNELS
+from observation import ObservationEncoder
+
+
+@pytest.fixture
+def game():
+    game = Game(headless=True, seed=5)
+    game._start_game()
+    return game
+
+
+def test_initial_observation_matches_the_level(game):
+    obs = game.observe()
+
+    assert obs.shape == (len(CHANNELS), s.ROWS, s.COLS)
+    assert obs[CH_WALLS, 0, 0] == 1
+    assert obs[CH_COINS].sum() == len(game.level.coins)
+    assert obs[CH_PILLS].sum() == len(game.level.pills)
+    assert obs[CH_PACMAN, game.pacman.row, game.pacman.col] == 1
+    for i, ghost in enumerate(game.ghosts_list):
+        assert obs[CH_GHOSTS + i, ghost.row, ghost.col] == 1
+        assert obs[CH_GHOSTS + i].sum() == 1
+
+
+def test_incremental_updates_match_a_fresh_encoding(game):
+    obs = game.observe()
+    for _ in range(400):
+        game.step(cycling_policy)
+        if game.state != s.STATE_PLAYING:
+            game._start_game()
+        assert game.observe() is obs
+        assert np.array_equal(obs, ObservationEncoder(game).update())
+
+
+def test_flags_follow_frightened_and_dead_ghosts(game):
+    game.observe()
+    ghost = game.pinky
+    ghost.frightened = True
+    obs = game.observe()
+    assert obs[CH_FRIGHTENED, ghost.row, ghost.col] == 1
+    assert obs[CH_FRIGHTENED].sum() == 1
+
+    ghost.frightened = False
+    ghost.dead = True
+    obs = game.observe()
+    assert obs[CH_FRIGHTENED].sum() == 0
+    assert obs[CH_DEAD, ghost.row, ghost.col] == 1
+
+
+def test_eaten_pill_is_cleared(game):
+    game.observe()
+    pill = game.level.pills[0]
+    pill.eaten = True
+
+    assert game.observe()[CH_PILLS, pill.row, pill.col] == 0
+
+
+def test_restored_snapshot_refills_the_coins(game):
+    state = game.save_state()
+    obs = game.observe().copy()
+    for _ in range(100):
+        game.step(cycling_policy)
+    game.observe()
+
+    game.load_state(state)
+
+    assert np.array_equal(game.observe(), obs)
+
+
+def test_encoder_fills_a_caller_supplied_array(game):
+    out = np.zeros((len(CHANNELS), s.ROWS, s.COLS), dtype=np.float32)
+
+    assert ObservationEncoder(game, out=out).update() is out
+    assert out[CH_COINS].sum() == len(game.level.coins)
+
+
+def test_encoder_rejects_a_wrongly_shaped_array(game):
+    with pytest.raises(ValueError):
+        ObservationEncoder(game, out=np.zeros((1, s.ROWS, s.COLS)))
+
+
+def test_frame_is_a_downsampled_view_of_the_screen():
+    pg.display.set_mode((1, 1))
+    game = Game(seed=5)
+    game._start_game()
+    game._draw()
+
+    with game.observation.frame(step=4) as frame:
+        assert frame.shape == (s.SCREEN_HEIGHT // 4, s.SCREEN_WIDTH // 4, 3)
+        assert not frame.flags.owndata
+        assert tuple(frame[2, 3]) == tuple(game.screen.get_at((12, 8)))[:3]
+
+    # The surface is unlocked again once the view is gone
+    del frame
+    assert not game.screen.get_locked()
+
+
+def test_headless_game_has_no_frame(game):
+    with pytest.raises(RuntimeError):
+        with game.observation.frame():
+            pass
@@ -0,0 +1,60 @@
+# pylint: disable=missing-docstring, redefined-outer-name, protected-access
+import pytest
+
+from occupancy import OccupancyGrid
+
+
+class Entity:
+    def __init__(self, row, col, target_row=None, target_col=None):
+        self.row = row
+        self.col = col
+        self.target_row = row if target_row is None else target_row
+        self.target_col = col if target_col is None else target_col
+
+
+
+@pytest.fixture
+def occupancy():
+    return OccupancyGrid(rows=10, cols=10)
+
+
+def test_entity_is_registered_on_current_and_target_tiles(occupancy):
+    ghost = Entity(2, 2, 2, 3)
+    occupancy.update(ghost)
+
+    assert {i: cell for i, cell in enumerate(occupancy.cells) if cell} == {22: [ghost], 23: [ghost]}
+
+
+def test_update_moves_entity_between_cells(occupancy):
+    ghost = Entity(2, 2)
+    occupancy.update(ghost)
+    ghost.row = ghost.target_row = 5
+    occupancy.update(ghost)
+
+    assert {i: cell for i, cell in enumerate(occupancy.cells) if cell} == {52: [ghost]}
+
+
+def test_near_finds_only_adjacent_entities(occupancy):
+    close, diagonal, far = Entity(4, 5), Entity(5, 6), Entity(8, 8)
+    occupancy.update_all([close, diagonal, far])
+
+    assert occupancy.near((4, 4)) == [close]
+    assert set(map(id, occupancy.near((4, 4), (4, 5)))) == {id(close), id(diagonal)}
+
+
+def test_near_wraps_around_edges(occupancy):
+    ghost = Entity(3, 9)
+    occupancy.update(ghost)
+
+    assert occupancy.near((3, 0)) == [ghost]
+
+
+def test_remove_and_clear(occupancy):
+    a, b = Entity(1, 1), Entity(2, 2)
+    occupancy.update_all([a, b])
+    occupancy.remove(a)
+    occupancy.remove(a)
+    assert occupancy.near((1, 1)) == [b]
+
+    occupancy.clear()
+    assert len(occupancy) == 0 and not any(occupancy.cells)
@@ -1,17 +1,21 @@
 # pylint: disable=missing-docstring, redefined-outer-name, protected-access, too-many-positional-arguments, too-many-arguments
+import math
 from unittest.mock import MagicMock
 
 import pytest
 import pygame as pg
 
-from pacman import Pacman
-from settings import TILE_SIZE, Direction, COLS, COIN_SCORE_VALUE
+from coins import CoinGrid
+from grid import MazeGrid
+from occupancy import OccupancyGrid
+from pacman import Pacman, get_mouth_atlas
+from settings import TILE_SIZE, Direction, COLS, COIN_SCORE_VALUE, LAYOUT
 
 
 @pytest.fixture
 def mock_level():
     level = MagicMock()
-    level.coins = set()
+    level.coins = CoinGrid(cols=3)
     level.score = 0
     return level
 
@@ -21,14 +25,19 @@ def pacman():
     return Pacman(row=5, col=5)
 
 
+@pytest.fixture
+def classic_grid():
+    return MazeGrid.from_layout(LAYOUT)
+
+
 @pytest.fixture
 def dummy_layout():
-    return [
+    return MazeGrid([
         ["=", "=", "="],
         ["=", "0", "="],
         ["=", "0", "0"],
         ["=", "=", "="]
-    ]
+    ])
 
 
 class TestPacman:
@@ -41,25 +50,25 @@ class TestPacman:
         assert pacman.moving is False
         assert pacman.grid_pos == (5, 5)
 
-    def test_is_tunnel_row(self, pacman):
+    def test_is_tunnel_row(self, pacman, classic_grid):
         pacman.row = 9
-        assert pacman._is_tunnel_row() is True
+        assert pacman._is_tunnel_row(classic_grid) is True
 
         pacman.row = 5
-        assert pacman._is_tunnel_row() is False
+        assert pacman._is_tunnel_row(classic_grid) is False
 
-    def test_handle_teleport_left(self, pacman):
+    def test_handle_teleport_left(self, pacman, classic_grid):
         pacman.row = 9
         pacman.col = -1
-        pacman._handle_teleport()
+        pacman._handle_teleport(classic_grid)
 
         assert pacman.col == COLS - 1
         assert pacman.x == (COLS - 1) * TILE_SIZE
 
-    def test_handle_teleport_right(self, pacman):
+    def test_handle_teleport_right(self, pacman, classic_grid):
         pacman.row = 9
         pacman.col = COLS
-        pacman._handle_teleport()
+        pacman._handle_teleport(classic_grid)
 
         assert pacman.col == 0
         assert pacman.x == 0
@@ -102,7 +111,7 @@ class TestPacman:
 
         pacman.moving = True
 
-        mock_level.coins = {(2, 2)}
+        mock_level.coins = CoinGrid(dummy_layout.cols, 1 << dummy_layout.index(2, 2))
         initial_score = mock_level.score
 
         pacman.update(dummy_layout, mock_level)
@@ -145,3 +154,46 @@ class TestPacman:
         pacman.check_ghost_collision([ghost], mock_level)
 
         assert pacman.alive is True
+
+
+def test_mouth_atlas_is_shared(pacman):
+    other = Pacman(row=1, col=1)
+    screen = pg.Surface((20 * TILE_SIZE, 20 * TILE_SIZE))
+    pacman.draw(screen)
+    other.draw(screen)
+
+    args = (pacman.radius, pacman.color, pacman.animation_speed, pacman.max_mouth_angle)
+    assert get_mouth_atlas(*args) is get_mouth_atlas(*args)
+    assert get_mouth_atlas.cache_info().currsize == 1
+
+
+def test_mouth_atlas_quantizes_to_animation_steps(pacman):
+    atlas = get_mouth_atlas(pacman.radius, pacman.color, pacman.animation_speed, pacman.max_mouth_angle)
+
+    assert atlas.frame(0.0, 0.0) is atlas.frames[0][0]
+    assert atlas.frame(math.pi, 0.31) is atlas.frames[2][2]
+    assert atlas.frame(math.pi * 1.5, pacman.max_mouth_angle) is atlas.frames[3][atlas.steps]
+
+
+def test_draw_blits_open_mouth_towards_facing(pacman):
+    screen = pg.Surface((20 * TILE_SIZE, 20 * TILE_SIZE))
+    pacman.facing_angle = 0.0
+    pacman.mouth_angle = pacman.max_mouth_angle
+    pacman.draw(screen)
+
+    center = (int(pacman.x) + TILE_SIZE // 2, int(pacman.y) + TILE_SIZE // 2)
+    assert screen.get_at((center[0] + pacman.radius - 2, center[1]))[:3] == (0, 0, 0)
+    assert screen.get_at((center[0] - pacman.radius + 2, center[1]))[:3] == pacman.color
+
+
+def test_ghost_collision_only_checks_nearby_ghosts(pacman, mock_level):
+    # A frightened ghost registered far away is not examined, even with overlapping pixels
+    near = MagicMock(dead=False, frightened=False, x=pacman.x, y=pacman.y, row=5, col=6, target_row=5, target_col=6)
+    far = MagicMock(dead=False, frightened=True, x=pacman.x, y=pacman.y, row=1, col=1, target_row=1, target_col=1)
+    occupancy = OccupancyGrid(rows=20, cols=20)
+    occupancy.update_all([near, far])
+
+    pacman.check_ghost_collision([near, far], mock_level, occupancy)
+
+    assert pacman.alive is False
+    far.start_death.assert_not_called()
@@ -44,7 +44,7 @@ class TestPill:
     @patch('pygame.draw.circle')
     def test_draw_blink_visible(self, mock_draw_circle, pill):
         screen = MagicMock(spec=pg.Surface)
-        pill.blink_timer = 9
+        pill.blink_timer = 10
 
         pill.draw(screen)
 
@@ -59,13 +59,22 @@ class TestPill:
     @patch('pygame.draw.circle')
     def test_draw_blink_hidden(self, mock_draw_circle, pill):
         screen = MagicMock(spec=pg.Surface)
-        pill.blink_timer = 4
+        pill.blink_timer = 5
 
         pill.draw(screen)
 
         assert pill.blink_timer == 5
         mock_draw_circle.assert_not_called()
 
+    def test_update_advances_blink_only_while_uneaten(self, pill):
+        pill.update()
+        pill.update()
+        assert pill.blink_timer == 2
+
+        pill.eaten = True
+        pill.update()
+        assert pill.blink_timer == 2
+
     def test_check_collision_already_eaten(self, pill):
         pill.eaten = True
         pacman = MagicMock()
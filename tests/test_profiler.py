@@ -0,0 +1,83 @@
+# pylint: disable=missing-docstring, redefined-outer-name, protected-access
+import json
+
+import pytest
+
+import settings as s
+from game import Game
+from profiler import FrameProfiler, RingBuffer
+
+
+def test_ring_buffer_keeps_latest_values():
+    buffer = RingBuffer(3)
+    for value in (1, 2, 3, 4, 5):
+        buffer.append(value)
+
+    assert len(buffer) == 3
+    assert buffer.values() == [3, 4, 5]
+
+
+def test_ring_buffer_percentiles():
+    buffer = RingBuffer(100)
+    for value in range(1, 101):
+        buffer.append(value)
+
+    assert buffer.percentiles(50, 95, 99) == [50, 95, 99]
+    assert RingBuffer(4).percentiles(50) == [0.0]
+
+
+def test_timed_sections_are_summed_per_frame():
+    profiler = FrameProfiler()
+    profiler.record("update", 0.0, 0.001)
+    profiler.record("update", 1.0, 1.002)
+    profiler.end_frame()
+
+    assert profiler.sections["update"].values() == pytest.approx([0.003])
+    assert profiler.summary()["update"]["p50_ms"] == pytest.approx(3.0)
+    assert profiler.summary()["frame"]["count"] == 1
+
+
+def test_timed_wrapper_returns_result_and_records():
+    profiler = FrameProfiler()
+    double = profiler.timed("double", lambda x: 2 * x)
+
+    assert double(4) == 8
+    assert profiler.events[0][0] == "double"
+
+
+def test_export_formats(tmp_path):
+    profiler = FrameProfiler()
+    profiler.record("draw", 0.5, 0.51)
+    profiler.end_frame()
+
+    profiler.export(str(tmp_path / "profile.json"))
+    summary = json.loads((tmp_path / "profile.json").read_text())
+    assert summary["frames"] == 1 and "draw" in summary["sections"]
+
+    profiler.export(str(tmp_path / "trace.json"), fmt="chrome")
+    event = json.loads((tmp_path / "trace.json").read_text())["traceEvents"][0]
+    assert event["ph"] == "X" and event["ts"] == pytest.approx(5e5) and event["dur"] == pytest.approx(1e4)
+
+    with pytest.raises(ValueError):
+        profiler.export(str(tmp_path / "bad"), fmt="xml")
+
+
+def test_game_without_profiler_is_not_wrapped():
+    game = Game(headless=True)
+    assert game.profiler is None
+    assert "_update" not in vars(game)
+
+
+def test_game_sections_survive_level_reset():
+    game = Game(headless=True, seed=1, profile=True)
+    game._start_game()
+    for _ in range(3):
+        game.step(lambda g: s.Direction.LEFT)
+        game.profiler.end_frame()
+    game._reset_game()
+    game.step()
+    game.profiler.end_frame()
+
+    sections = game.profiler.summary()
+    assert {"update", "update.pacman", "update.check_pills", "update.ghost.blinky"} <= set(sections)
+    assert sections["update.pacman"]["count"] == 4
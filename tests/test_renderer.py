@@ -0,0 +1,39 @@
+# pylint: disable=missing-docstring, redefined-outer-name, protected-access
+import pygame as pg
+
+import settings as s
+from game import Game
+
+
+# Dirty Rectangle Rendering
+def _render_full(game, alpha):
+    screen = pg.Surface(game.screen.get_size())
+    game.level.draw(screen)
+    game.pacman.draw(screen, alpha)
+    for ghost in game.ghosts_list:
+        ghost.draw(screen, alpha)
+    game.level.draw_ui(screen)
+    return screen
+
+
+def test_dirty_renderer_matches_full_redraw(mocker):
+    pg.display.set_mode((1, 1))
+    game = Game(seed=3, dirty_rects=True)
+    update = mocker.patch("pygame.display.update")
+    game._start_game()
+    game.intro_ticks_left = 0
+
+    for i in range(120):
+        alpha = (i % 4) / 4
+        game._remember_positions()
+        game.step(lambda g: s.Direction.LEFT)
+        game._draw(alpha)
+        incremental = game.screen.copy()
+
+        expected = _render_full(game, alpha)
+
+        assert pg.image.tobytes(incremental, "RGB") == pg.image.tobytes(expected, "RGB")
+
+    # Only the first frame is a full flip; later frames update a handful of rects
+    assert update.call_count == 119
+    assert len(update.call_args.args[0]) < 30
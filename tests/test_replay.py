@@ -0,0 +1,139 @@
+# pylint: disable=missing-docstring, redefined-outer-name, protected-access
+import os
+
+import pytest
+
+import settings as s
+from bench import cycling_policy
+from game import Game
+from inputlog import InputLog
+from maze import generate_maze, load_maze
+from replay import ReplayEngine
+
+
+WIDE = """
+111111111111111111111
+1o00000000000000000o1
+101111111101111111101
+1011111111=1111111101
+101111111pic111111101
+101111111111111111101
+000000000000000000000
+1o0000000P000000000o1
+111111111111111111111
+"""
+
+
+def _fingerprint(game):
+    return (
+        game.tick,
+        game.level.score,
+        len(game.level.coins),
+        (game.pacman.row, game.pacman.col, game.pacman.x, game.pacman.y),
+        tuple((g.row, g.col, g.x, g.y, g.direction, g.frightened, g.dead) for g in game.ghosts_list),
+    )
+
+
+@pytest.fixture
+def recorded(tmp_path):
+    game = Game(headless=True, seed=11, record_dir=str(tmp_path))
+    game._start_game()
+    recorder = game.recorder
+    snapshots = {}
+    while game.state == s.STATE_PLAYING and game.tick < 1500:
+        game.step(cycling_policy)
+        snapshots[game.tick] = _fingerprint(game)
+    return recorder, snapshots
+
+
+def test_log_round_trips_through_bytes(recorded):
+    log, _ = recorded
+    parsed = InputLog.from_bytes(log.to_bytes())
+
+    assert parsed.seed == log.seed
+    assert parsed.end_tick == log.end_tick
+    assert parsed.inputs == log.inputs
+    assert parsed.maze_text is None and parsed.maze_key == log.maze_key != ""
+    assert (parsed.ghost_count, parsed.swarm, parsed.path_distance) == (None, False, False)
+    assert len(log.to_bytes()) == 46 + 5 * len(log.inputs)
+
+
+def test_log_only_stores_direction_changes():
+    log = InputLog(3)
+    for tick in range(1, 10):
+        log.record(tick, s.Direction.LEFT if tick < 5 else s.Direction.UP)
+
+    assert log.inputs == [(1, s.Direction.LEFT), (5, s.Direction.UP)]
+    assert log.end_tick == 9
+
+
+def test_episode_end_writes_log_file(tmp_path):
+    game = Game(headless=True, seed=2, record_dir=str(tmp_path))
+    game.simulate(5000)
+
+    files = os.listdir(tmp_path)
+    assert len(files) == 1
+    assert InputLog.load(str(tmp_path / files[0])).seed == 2
+
+
+def test_replay_rebuilds_exact_state(recorded):
+    log, snapshots = recorded
+    engine = ReplayEngine(log)
+
+    engine.run()
+
+    assert _fingerprint(engine.game) == snapshots[log.end_tick]
+
+
+def test_seek_uses_checkpoints_in_both_directions(recorded):
+    log, snapshots = recorded
+    engine = ReplayEngine(log, checkpoint_interval=100)
+    engine.seek(log.end_tick)
+    assert len(engine.checkpoints) > 1
+
+    for tick in (250, 120, log.end_tick - 1, 1):
+        assert _fingerprint(engine.seek(tick)) == snapshots[tick]
+
+
+@pytest.mark.parametrize("swarm, path_distance", [(False, True), (True, False)])
+def test_replay_rebuilds_maze_and_ghost_options(tmp_path, swarm, path_distance):
+    path = tmp_path / "wide.txt"
+    path.write_text(WIDE)
+    maze = load_maze(str(path))
+    game = Game(headless=True, seed=4, maze=maze, ghost_count=9, swarm=swarm,
+                path_distance=path_distance, record_dir=str(tmp_path))
+    game._start_game()
+    log = game.recorder
+    while game.state == s.STATE_PLAYING and game.tick < 600:
+        game.step(cycling_policy)
+
+    path.unlink()  # the log carries the map itself
+    engine = ReplayEngine(InputLog.from_bytes(log.to_bytes()))
+    engine.run()
+
+    assert engine.game.maze is maze and len(engine.game.ghosts_list) == 9
+    assert (engine.game.use_swarm, engine.game.path_distance) == (swarm, path_distance)
+    assert _fingerprint(engine.game) == _fingerprint(game)
+
+
+def test_replay_rebuilds_a_generated_maze(tmp_path):
+    maze = generate_maze(15, 21, seed=3)
+    game = Game(headless=True, seed=6, maze=maze, record_dir=str(tmp_path))
+    game._start_game()
+    log = game.recorder
+    while game.state == s.STATE_PLAYING and game.tick < 600:
+        game.step(cycling_policy)
+
+    engine = ReplayEngine(InputLog.from_bytes(log.to_bytes()))
+    engine.run()
+
+    assert engine.game.maze is maze
+    assert _fingerprint(engine.game) == _fingerprint(game)
+
+
+def test_replay_refuses_a_changed_maze(recorded):
+    log, _ = recorded
+    log.maze_key = "0" * 16
+
+    with pytest.raises(ValueError):
+        ReplayEngine(log)
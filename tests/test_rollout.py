@@ -0,0 +1,56 @@
+# pylint: disable=missing-docstring, redefined-outer-name, protected-access
+import os
+
+import settings as s
+from rollout import EpisodeResult, RolloutPool, run_episode
+
+
+def turn_left(_game):
+    return s.Direction.LEFT
+
+
+class CrashOnce:
+    """Kills the worker process the first time it is called."""
+
+    def __init__(self, flag_path):
+        self.flag_path = flag_path
+
+    def __call__(self, game):
+        if not os.path.exists(self.flag_path):
+            with open(self.flag_path, "w", encoding="utf-8"):
+                pass
+            os._exit(1)
+        return turn_left(game)
+
+
+def test_run_episode_is_deterministic():
+    first = run_episode(7, turn_left, max_ticks=600)
+    second = run_episode(7, turn_left, max_ticks=600)
+
+    assert first == second
+    assert first.coins_eaten > 0
+    assert first.score >= first.coins_eaten * s.COIN_SCORE_VALUE
+
+
+def test_run_episode_respects_tick_limit():
+    result = run_episode(1, turn_left, max_ticks=10)
+    assert result.ticks == 10
+
+
+def test_pool_streams_one_result_per_seed():
+    pool = RolloutPool(workers=2, max_ticks=300, episodes_per_worker=None)
+
+    results = list(pool.run(turn_left, range(5)))
+
+    assert sorted(r.seed for r in results) == list(range(5))
+    assert all(isinstance(r, EpisodeResult) for r in results)
+    assert {r.seed: r for r in results}[3] == run_episode(3, turn_left, max_ticks=300)
+
+
+def test_pool_restarts_crashed_workers(tmp_path):
+    pool = RolloutPool(workers=2, max_ticks=100, episodes_per_worker=2)
+
+    results = list(pool.run(CrashOnce(str(tmp_path / "crashed")), range(4)))
+
+    assert pool.restarts == 1
+    assert sorted(r.seed for r in results) == list(range(4))
@@ -0,0 +1,105 @@
+# pylint: disable=missing-docstring, redefined-outer-name, protected-access
+import pytest
+
+import settings as s
+from game import Game
+from snapshot import GameState
+
+
+def _fingerprint(game):
+    return (
+        game.tick,
+        game.level.score,
+        sorted(game.level.coins),
+        [p.eaten for p in game.level.pills],
+        (game.pacman.row, game.pacman.col, game.pacman.x, game.pacman.y, game.pacman.direction),
+        [(g.row, g.col, g.x, g.y, g.direction, g.frightened, g.dead, g.mode) for g in game.ghosts_list],
+    )
+
+
+def _advance(game, ticks):
+    for _ in range(ticks):
+        game.step(lambda g: s.Direction.LEFT if g.tick % 80 < 40 else s.Direction.UP)
+
+
+@pytest.fixture
+def game():
+    game = Game(headless=True, seed=4)
+    game._start_game()
+    _advance(game, 200)
+    return game
+
+
+def test_restore_returns_to_the_captured_position(game):
+    state = GameState.from_game(game)
+    expected = _fingerprint(game)
+
+    _advance(game, 150)
+    assert _fingerprint(game) != expected
+
+    state.apply(game)
+    assert _fingerprint(game) == expected
+
+
+def test_restored_position_plays_out_identically(game):
+    state = GameState.from_game(game)
+    _advance(game, 300)
+    expected = _fingerprint(game)
+
+    state.apply(game)
+    _advance(game, 300)
+
+    assert _fingerprint(game) == expected
+
+
+def test_clone_shares_the_grid_and_is_independent(game):
+    state = GameState.from_game(game)
+    clone = state.clone()
+
+    assert clone.grid is state.grid is game.level.grid
+    assert clone.coins == state.coins
+
+    _advance(game, 50)
+    clone.apply(game)
+    assert _fingerprint(game) == _fingerprint(_restored(state))
+
+
+def _restored(state):
+    other = Game(headless=True)
+    state.apply(other)
+    return other
+
+
+def test_apply_builds_entities_for_a_fresh_game(game):
+    other = _restored(GameState.from_game(game))
+
+    assert _fingerprint(other) == _fingerprint(game)
+    assert other.rng.getstate() == game.rng.getstate()
+
+
+def test_coins_are_stored_as_a_bitset(game):
+    state = GameState.from_game(game)
+
+    assert isinstance(state.coins, int)
+    assert state.coins.bit_count() == len(game.level.coins)
+
+
+@pytest.mark.parametrize("swarm", [False, True])
+def test_fresh_game_with_extra_ghosts_gets_their_spawns_and_rng(swarm):
+    game = Game(headless=True, seed=6, ghost_count=6, swarm=swarm)
+    game._start_game()
+    _advance(game, 120)
+    state = GameState.from_game(game)
+
+    other = Game(headless=True, ghost_count=6, swarm=swarm)
+    state.apply(other)
+
+    assert other.rng.getstate() == game.rng.getstate()
+    assert [g.grid_pos for g in other.ghosts_list] == [g.grid_pos for g in game.ghosts_list]
+    assert [(g.start_row, g.start_col) for g in other.ghosts_list] == \
+        [(g.start_row, g.start_col) for g in game.ghosts_list]
+    if not swarm:
+        assert [g.rect for g in other.ghosts_list] == [g.rect for g in game.ghosts_list]
+    _advance(game, 300)
+    _advance(other, 300)
+    assert _fingerprint(other) == _fingerprint(game)
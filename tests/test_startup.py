@@ -0,0 +1,23 @@
+# pylint: disable=missing-docstring, redefined-outer-name, protected-access
+from startup import StartupProfiler
+
+
+def test_phases_accumulate():
+    profiler = StartupProfiler()
+    with profiler.phase("load"):
+        pass
+    with profiler.phase("load"):
+        pass
+
+    assert list(profiler.phases) == ["load"]
+    assert profiler.phases["load"] >= 0
+
+
+def test_first_frame_is_recorded_once():
+    profiler = StartupProfiler()
+    profiler.mark_first_frame()
+    first = profiler.first_frame
+    profiler.mark_first_frame()
+
+    assert profiler.first_frame == first
+    assert "first frame" in profiler.report()
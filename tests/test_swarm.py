@@ -0,0 +1,120 @@
+# pylint: disable=missing-docstring, redefined-outer-name, protected-access
+import numpy as np
+import pygame as pg
+import pytest
+
+import settings as s
+from bench import cycling_policy
+from game import Game
+from maze import generate_maze
+from observation import CH_GHOSTS, ObservationEncoder
+from snapshot import _GHOST_FIELDS
+from swarm import MIN_SPAWN_DISTANCE
+
+
+def _ghost_states(game):
+    return [tuple(getattr(ghost, field) for field in _GHOST_FIELDS) for ghost in game.ghosts_list]
+
+
+@pytest.mark.parametrize("count, path_distance", [(None, False), (12, False), (12, True)])
+def test_swarm_matches_ghost_objects_tick_for_tick(monkeypatch, count, path_distance):
+    monkeypatch.setattr(s, "GHOST_PATH_DISTANCE", path_distance)
+    for seed in range(3):
+        objects = Game(headless=True, seed=seed, ghost_count=count)
+        swarm = Game(headless=True, seed=seed, ghost_count=count, swarm=True)
+        objects._start_game()
+        swarm._start_game()
+
+        for _ in range(1500):
+            objects.step(cycling_policy)
+            swarm.step(cycling_policy)
+            assert _ghost_states(swarm) == _ghost_states(objects)
+            assert (swarm.state, swarm.level.score) == (objects.state, objects.level.score)
+            if objects.state != s.STATE_PLAYING:
+                break
+
+
+def test_extra_ghosts_cycle_personalities_away_from_pacman():
+    game = Game(headless=True, seed=4, ghost_count=10, swarm=True)
+    game._start_game()
+    spawn_r, spawn_c = game.maze.pacman_spawn
+
+    names = [ghost.name for ghost in game.ghosts_list]
+    assert names[:4] == ["BLINKY", "PINKY", "INKY", "CLYDE"]
+    assert names[4:] == ["BLINKY", "PINKY", "INKY", "CLYDE", "BLINKY", "PINKY"]
+    assert game.blinky is game.ghosts_list[0]
+    for ghost in game.ghosts_list[4:]:
+        assert not game.level.grid.is_wall(ghost.row, ghost.col)
+        assert np.hypot(ghost.row - spawn_r, ghost.col - spawn_c) >= MIN_SPAWN_DISTANCE
+
+
+def test_views_write_through_to_the_arrays():
+    game = Game(headless=True, seed=1, swarm=True)
+    game._start_game()
+    ghost = game.pinky
+
+    ghost.frightened = True
+    ghost.direction = s.Direction.DOWN
+    ghost.mode = "CHASE"
+
+    assert game.swarm.frightened[1]
+    assert ghost.direction is s.Direction.DOWN and ghost.mode == "CHASE"
+    ghost.start_death()
+    assert ghost.dead and not ghost.frightened and ghost.dead_timer == 5 * s.FPS
+
+
+def test_snapshot_restores_a_swarm():
+    game = Game(headless=True, seed=2, ghost_count=20, swarm=True)
+    game._start_game()
+    state = game.save_state()
+    before = _ghost_states(game)
+    for _ in range(200):
+        game.step(cycling_policy)
+
+    game.load_state(state)
+
+    assert _ghost_states(game) == before
+
+
+def test_observation_counts_every_ghost_of_a_personality():
+    game = Game(headless=True, seed=3, ghost_count=16, swarm=True)
+    game._start_game()
+    obs = game.observe()
+    for _ in range(100):
+        game.step(cycling_policy)
+        assert np.array_equal(game.observe(), ObservationEncoder(game).update())
+
+    blinkies = {(ghost.row, ghost.col) for ghost in game.ghosts_list if ghost.name == "BLINKY"}
+    assert obs[CH_GHOSTS].sum() == len(blinkies)
+
+
+def test_batched_draw_matches_ghost_objects():
+    pg.display.set_mode((1, 1))
+    games = [Game(seed=5, ghost_count=12, swarm=swarm) for swarm in (False, True)]
+    for game in games:
+        game._start_game()
+        for _ in range(120):
+            game._remember_positions()
+            game.step(cycling_policy)
+        for ghost in game.ghosts_list[::3]:
+            ghost.frightened, ghost.timer = True, 42
+
+    objects, swarm = (pg.Surface(games[0].screen.get_size()) for _ in range(2))
+    for ghost in games[0].ghosts_list:
+        ghost.draw(objects, 0.5)
+    games[1].swarm.draw(swarm, 0.5)
+
+    assert pg.image.tobytes(swarm, "RGB") == pg.image.tobytes(objects, "RGB")
+
+
+def test_generated_mazes_are_playable():
+    maze = generate_maze(31, 41, seed=7)
+
+    assert (maze.grid.rows, maze.grid.cols) == (31, 41)
+    assert maze.grid.house_exit is not None and maze.grid.tunnel_rows
+    assert generate_maze(31, 41, seed=7) is maze
+    game = Game(headless=True, seed=1, maze=maze, ghost_count=200, swarm=True)
+    assert game.simulate(300, cycling_policy)["ticks"] > 0
+
+    with pytest.raises(ValueError):
+        generate_maze(30, 41)
@@ -0,0 +1,49 @@
+# pylint: disable=missing-docstring, redefined-outer-name, protected-access
+import pygame as pg
+import pytest
+
+from text import TextCache, get_font
+
+
+@pytest.fixture
+def font():
+    pg.font.init()
+    return get_font(None, 24)
+
+
+def test_get_font_is_shared(font):
+    assert get_font(None, 24) is font
+    assert get_font(None, 30) is not font
+
+
+def test_render_reuses_surface(font):
+    cache = TextCache()
+    first = cache.render(font, "SCORE: 10", (255, 255, 255))
+    second = cache.render(font, "SCORE: 10", pg.Color(255, 255, 255))
+
+    assert first is second
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+def test_render_key_includes_text_and_color(font):
+    cache = TextCache()
+    cache.render(font, "A", (255, 255, 255))
+    cache.render(font, "B", (255, 255, 255))
+    cache.render(font, "A", (255, 0, 0))
+
+    assert cache.misses == 3
+    assert len(cache) == 3
+
+
+def test_cache_evicts_least_recently_used(font):
+    cache = TextCache(max_size=2)
+    a = cache.render(font, "A", (255, 255, 255))
+    cache.render(font, "B", (255, 255, 255))
+    cache.render(font, "A", (255, 255, 255))
+    cache.render(font, "C", (255, 255, 255))
+
+    assert len(cache) == 2
+    assert cache.render(font, "A", (255, 255, 255)) is a
+    cache.render(font, "B", (255, 255, 255))
+    assert cache.misses == 4
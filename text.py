@@ -0,0 +1,93 @@
+"""
+Text rendering module.
+
+This module provides a shared font registry and an LRU cache of rendered text
+surfaces. Fonts are loaded once per (name, size) instead of on every frame, and
+a string is only rendered again when its font, text or color changes, so static
+titles, button labels and an unchanged score cost a dictionary lookup per frame.
+"""
+from collections import OrderedDict
+
+import pygame as pg
+
+_fonts: dict[tuple, pg.font.Font] = {}
+
+
+def get_font(name, size: int) -> pg.font.Font:
+    """
+    Return the system font ``name`` at ``size``, loading it on first use.
+
+    Args:
+        name (str | None): System font name, or None for the default font.
+        size (int): Font size in points.
+
+    Returns:
+        pg.font.Font: The shared font object.
+    """
+    key = (name, size)
+    font = _fonts.get(key)
+    if font is None:
+        if not pg.font.get_init():
+            pg.font.init()
+        font = _fonts[key] = pg.font.SysFont(name, size)
+    return font
+
+
+class TextCache:
+    """Bounded LRU cache of rendered text surfaces."""
+
+    def __init__(self, max_size: int = 256):
+        """
+        Args:
+            max_size (int): Maximum number of surfaces kept before the least
+                recently used one is dropped.
+        """
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._surfaces: OrderedDict[tuple, pg.Surface] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._surfaces)
+
+    def render(self, font: pg.font.Font, text: str, color, antialias: bool = True) -> pg.Surface:
+        """
+        Return ``text`` rendered with ``font`` in ``color``, reusing a cached surface.
+
+        The returned surface is shared; callers must blit it, not draw on it.
+        """
+        key = (font, text, tuple(pg.Color(color)), antialias)
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            self._surfaces.move_to_end(key)
+            return surface
+
+        self.misses += 1
+        surface = self._surfaces[key] = font.render(text, antialias, color)
+        if len(self._surfaces) > self.max_size:
+            self._surfaces.popitem(last=False)
+        return surface
+
+    def clear(self) -> None:
+        """Drop every cached surface and reset the counters."""
+        self._surfaces.clear()
+        self.hits = self.misses = 0
+
+    def stats(self) -> dict:
+        """Return the size of the cache and its hit/miss counters."""
+        total = self.hits + self.misses
+        return {
+            "size": len(self._surfaces),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+        }
+
+
+TEXT_CACHE = TextCache()
+
+
+def render_text(font: pg.font.Font, text: str, color) -> pg.Surface:
+    """Render antialiased ``text`` through the shared TEXT_CACHE."""
+    return TEXT_CACHE.render(font, text, color)